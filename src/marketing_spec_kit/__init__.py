@@ -51,10 +51,56 @@ from marketing_spec_kit.models import (
 
 # Parser (will be implemented in parser.py)
 from marketing_spec_kit.parser import MarketingSpecParser
+from marketing_spec_kit.source import SpecSource
+from marketing_spec_kit.schema import spec_schema, write_schema
 
 # Validator (will be implemented in validator.py)
 from marketing_spec_kit.validator import MarketingSpecValidator, ValidationResult
 
+# Content calendar and channel constraints
+from marketing_spec_kit.calendar_index import CalendarIndex
+from marketing_spec_kit.constraints import ChannelConstraintEngine
+
+# Entity graph
+from marketing_spec_kit.graph import SpecGraph
+from marketing_spec_kit.impact import ImpactAnalyzer, ImpactReport
+
+# Analytics rollup
+from marketing_spec_kit.rollup import AnalyticsRollup, RollupReport
+
+# Analytics integrity
+from marketing_spec_kit.integrity import KPIIntegrityReport, check_kpis
+
+# Budget ledger
+from marketing_spec_kit.budget import BudgetLedger
+
+# Compiled snapshots
+from marketing_spec_kit.snapshot import SpecSnapshot, load_snapshot, write_snapshot
+
+# Memory report
+from marketing_spec_kit.memory import MemoryReport, measure_spec
+
+# Spec diff
+from marketing_spec_kit.diff import SpecDiff, SpecDiffer
+
+# Workspace
+from marketing_spec_kit.workspace import MarketingWorkspace, WorkspaceValidator
+
+# Multi-document streams
+from marketing_spec_kit.stream import DocumentResult, StreamValidator
+
+# Validation cache
+from marketing_spec_kit.cache import ValidationCache
+
+# Git-aware validation
+from marketing_spec_kit.changes import ChangeSelection, validate_changes
+
+# CI reports
+from marketing_spec_kit.reports import IssueLocator, write_junit, write_sarif
+
+# Language server
+from marketing_spec_kit.lsp import LanguageServer, SpecDocument
+
 __all__ = [
     # Version
     "__version__",
@@ -86,9 +132,56 @@ __all__ = [
     "MarketingSpec",
     # Parser
     "MarketingSpecParser",
+    "SpecSource",
+    "spec_schema",
+    "write_schema",
     # Validator
     "MarketingSpecValidator",
     "ValidationResult",
+    # Calendar
+    "CalendarIndex",
+    # Constraints
+    "ChannelConstraintEngine",
+    # Graph
+    "SpecGraph",
+    "ImpactAnalyzer",
+    "ImpactReport",
+    # Rollup
+    "AnalyticsRollup",
+    "RollupReport",
+    # Integrity
+    "KPIIntegrityReport",
+    "check_kpis",
+    # Budget
+    "BudgetLedger",
+    # Snapshots
+    "SpecSnapshot",
+    "load_snapshot",
+    "write_snapshot",
+    # Memory
+    "MemoryReport",
+    "measure_spec",
+    # Diff
+    "SpecDiff",
+    "SpecDiffer",
+    # Workspace
+    "MarketingWorkspace",
+    "WorkspaceValidator",
+    # Streams
+    "StreamValidator",
+    "DocumentResult",
+    # Validation cache
+    "ValidationCache",
+    # Git-aware validation
+    "ChangeSelection",
+    "validate_changes",
+    # CI reports
+    "IssueLocator",
+    "write_sarif",
+    "write_junit",
+    # Language server
+    "SpecDocument",
+    "LanguageServer",
     # Exceptions
     "MarketingSpecError",
     "ParseError",
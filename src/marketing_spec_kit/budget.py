@@ -0,0 +1,169 @@
+"""Budget ledger across plans, allocation keys, channels and currencies
+
+The ledger is computed once per spec in a single pass over plans and
+campaigns (linear in their number):
+
+- per plan: budget total, allocated (sum of PlanBudget.allocation),
+  committed (sum of its campaigns' budgets) and remaining (total -
+  committed), with over-allocation and over-commitment flags
+- per allocation key: allocated vs committed. Keys that name a channel
+  are committed by the campaigns running on it; a campaign's budget is
+  split evenly across its channels
+- per channel: budget committed by all campaigns (in the plan currency)
+- per currency: the plan figures summed (no conversion between currencies)
+
+Campaigns whose plan does not exist are counted as unplanned.
+
+Example:
+    >>> ledger = BudgetLedger.from_spec(spec)
+    >>> ledger.plan("q4-2025-launch-plan").remaining
+    3000.0
+    >>> [p.plan_id for p in ledger.over_committed]
+    []
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from marketing_spec_kit.models import MarketingSpec
+
+# Relative slack before a plan counts as over-committed (CAMP-11)
+COMMIT_TOLERANCE = 0.05
+# Absolute slack for allocation sums (PLAN-03 rounding)
+ALLOCATION_TOLERANCE = 0.01
+
+
+class BudgetLine(BaseModel):
+    """Allocation key of a plan budget"""
+
+    key: str = Field(..., description="Allocation key (category or channel id)")
+    allocated: float = 0.0
+    committed: float = Field(0.0, description="Campaign budget on this channel (channel keys only)")
+    remaining: float = 0.0
+    channel: bool = Field(False, description="True if the key names a channel")
+
+
+class PlanLedger(BaseModel):
+    """Budget position of one plan"""
+
+    plan_id: str
+    currency: str
+    total: float
+    allocated: float = Field(0.0, description="Sum of budget.allocation")
+    committed: float = Field(0.0, description="Sum of campaign budgets")
+    remaining: float = Field(0.0, description="total - committed")
+    campaigns: int = 0
+    lines: List[BudgetLine] = Field(default_factory=list)
+    over_allocated: bool = Field(False, description="Allocation exceeds the total")
+    over_committed: bool = Field(False, description="Campaign budgets exceed the total (+5%)")
+
+
+class CurrencyTotals(BaseModel):
+    """Plan figures summed per currency"""
+
+    currency: str
+    plans: int = 0
+    total: float = 0.0
+    allocated: float = 0.0
+    committed: float = 0.0
+    remaining: float = 0.0
+
+
+class BudgetLedger(BaseModel):
+    """Allocated vs committed vs remaining budget of a spec"""
+
+    plans: List[PlanLedger] = Field(default_factory=list)
+    channels: Dict[str, Dict[str, float]] = Field(
+        default_factory=dict, description="Channel → currency → committed budget"
+    )
+    currencies: List[CurrencyTotals] = Field(default_factory=list)
+    unplanned: float = Field(0.0, description="Budget of campaigns without a known plan")
+    unplanned_campaigns: List[str] = Field(default_factory=list)
+
+    @classmethod
+    def from_spec(cls, spec: MarketingSpec) -> "BudgetLedger":
+        """Build the ledger in one pass over plans and campaigns"""
+        ledger = cls()
+        channel_ids = {channel.id for channel in spec.channels}
+        by_id: Dict[str, PlanLedger] = {}
+        for plan in spec.plans:
+            entry = PlanLedger(
+                plan_id=plan.id,
+                currency=plan.budget.currency,
+                total=plan.budget.total,
+                allocated=sum(plan.budget.allocation.values()),
+                lines=[
+                    BudgetLine(key=key, allocated=amount, channel=key in channel_ids)
+                    for key, amount in plan.budget.allocation.items()
+                ],
+            )
+            ledger.plans.append(entry)
+            by_id.setdefault(plan.id, entry)
+
+        # Campaigns commit to the first plan of a duplicated id (by_id), lines included
+        line_index: Dict[str, Dict[str, BudgetLine]] = {
+            plan_id: {line.key: line for line in entry.lines if line.channel}
+            for plan_id, entry in by_id.items()
+        }
+        for campaign in spec.campaigns:
+            entry = by_id.get(campaign.plan_id)
+            if entry is None:
+                ledger.unplanned += campaign.budget
+                ledger.unplanned_campaigns.append(campaign.id)
+                continue
+            entry.committed += campaign.budget
+            entry.campaigns += 1
+            if not campaign.channels:
+                continue
+            share = campaign.budget / len(campaign.channels)
+            lines = line_index[entry.plan_id]
+            for channel_id in campaign.channels:
+                by_currency = ledger.channels.setdefault(channel_id, {})
+                by_currency[entry.currency] = by_currency.get(entry.currency, 0.0) + share
+                line = lines.get(channel_id)
+                if line is not None:
+                    line.committed += share
+
+        currencies: Dict[str, CurrencyTotals] = {}
+        for entry in ledger.plans:
+            entry.remaining = entry.total - entry.committed
+            entry.over_allocated = entry.allocated > entry.total + ALLOCATION_TOLERANCE
+            entry.over_committed = entry.committed > entry.total * (1 + COMMIT_TOLERANCE)
+            for line in entry.lines:
+                line.remaining = line.allocated - line.committed
+
+            totals = currencies.get(entry.currency)
+            if totals is None:
+                totals = currencies[entry.currency] = CurrencyTotals(currency=entry.currency)
+            totals.plans += 1
+            totals.total += entry.total
+            totals.allocated += entry.allocated
+            totals.committed += entry.committed
+            totals.remaining += entry.remaining
+        ledger.currencies = list(currencies.values())
+        return ledger
+
+    def plan(self, plan_id: str) -> Optional[PlanLedger]:
+        """Ledger entry of a plan"""
+        return next((entry for entry in self.plans if entry.plan_id == plan_id), None)
+
+    @property
+    def over_allocated(self) -> List[PlanLedger]:
+        """Plans whose allocation exceeds their total"""
+        return [entry for entry in self.plans if entry.over_allocated]
+
+    @property
+    def over_committed(self) -> List[PlanLedger]:
+        """Plans whose campaigns commit more than the total (+5%)"""
+        return [entry for entry in self.plans if entry.over_committed]
+
+    @property
+    def over_committed_lines(self) -> List[Tuple[str, BudgetLine]]:
+        """(plan_id, line) for channel keys committed beyond their allocation"""
+        return [
+            (entry.plan_id, line)
+            for entry in self.plans
+            for line in entry.lines
+            if line.channel and line.committed > line.allocated + ALLOCATION_TOLERANCE
+        ]
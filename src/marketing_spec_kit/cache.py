@@ -0,0 +1,120 @@
+"""On-disk cache of per-entity validation outcomes
+
+Most entities of a spec do not change between runs. The validator can
+reuse their rule outcomes (issues and rule counters) from a cache file
+instead of re-running the rules:
+
+- Each entity is keyed by a hash of its serialized content plus the
+  state of everything its rules read outside the entity: whether each
+  referenced id exists, the period and budget position of a campaign's
+  plan, and a digest of the id list quoted by 'Use one of: ...' fixes
+- The spec-wide rules (analytics integrity, entity graph) are keyed by a
+  digest of all entity keys, so they are reused only when nothing changed
+- The file header records the toolkit version, the model schema
+  fingerprint and the date (some rules compare dates against today); a
+  mismatch discards the whole cache
+- Saving keeps only the entries used by the last run, so the file tracks
+  the current spec instead of growing
+
+Example:
+    >>> cache = ValidationCache.load(".marketing-spec-cache.json")
+    >>> result = MarketingSpecValidator(cache=cache).validate(spec)
+    >>> cache.save()
+    >>> cache.hits, cache.misses
+    (39998, 2)
+"""
+
+import json
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from marketing_spec_kit import __version__
+
+CACHE_VERSION = 2
+
+# Stored outcome: [rules_checked, rules_passed, [[level, code, entity_type,
+# entity_id, field, message, fix], ...]]
+Outcome = List[Any]
+
+
+def cache_context() -> Dict[str, Any]:
+    """Header values a cache file must match to be reused"""
+    from marketing_spec_kit.schema import schema_fingerprint
+
+    return {
+        "cache_version": CACHE_VERSION,
+        "version": __version__,
+        "schema": schema_fingerprint(),
+        "date": date.today().isoformat(),
+    }
+
+
+class ValidationCache:
+    """Entity key → validation outcome, persisted as one JSON file
+
+    Example:
+        >>> cache = ValidationCache.load("validation-cache.json")
+        >>> cache.get("campaigns:3f2a...")
+        [4, 4, []]
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, entries: Optional[Dict[str, Outcome]] = None):
+        """
+        Args:
+            path: Cache file (None = in-memory only)
+            entries: Outcomes loaded from a previous run
+        """
+        self.path = Path(path) if path is not None else None
+        self._entries: Dict[str, Outcome] = entries or {}
+        self._used: Dict[str, Outcome] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ValidationCache":
+        """Load a cache file; a missing, unreadable or outdated file gives an empty cache"""
+        path = Path(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(path)
+        if not isinstance(data, dict) or data.get("context") != cache_context():
+            return cls(path)
+        entries = data.get("entries")
+        return cls(path, entries if isinstance(entries, dict) else {})
+
+    def get(self, key: str) -> Optional[Outcome]:
+        """Outcome stored for a key (counted as hit or miss)"""
+        outcome = self._entries.get(key)
+        if outcome is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used[key] = outcome
+        return outcome
+
+    def put(self, key: str, outcome: Outcome):
+        """Store the outcome of a key for this and later runs"""
+        self._entries[key] = outcome
+        self._used[key] = outcome
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> int:
+        """Write the entries used since loading; returns the number written
+
+        Raises:
+            ValueError: If neither path nor the cache path is set
+        """
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            raise ValueError("No cache file to save to")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"context": cache_context(), "entries": self._used}, f, separators=(",", ":"))
+        tmp.replace(path)
+        return len(self._used)
@@ -0,0 +1,229 @@
+"""Content calendar index for scheduling queries
+
+Flattens every Campaign.content_calendar into one index sorted by date
+ordinal and bucketed by channel, status and (channel, status), so that
+scheduling questions are answered with binary search instead of scanning
+every campaign:
+
+- "What publishes on channel X between two dates?"  → range()
+- "What is the next entry on channel X?"           → next_entry()
+- "Which channel days are over-booked?"            → conflicts()
+
+Build cost is O(n log n) once per spec; range queries are O(log n + k).
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from marketing_spec_kit.models import (
+    ContentCalendarEntry,
+    ContentStatus,
+    MarketingSpec,
+)
+
+DateLike = Union[str, date]
+
+
+class CalendarSlot(NamedTuple):
+    """Single indexed calendar entry"""
+
+    ordinal: int
+    campaign_id: str
+    entry: ContentCalendarEntry
+
+    @property
+    def date(self) -> date:
+        return date.fromordinal(self.ordinal)
+
+    @property
+    def channel_id(self) -> str:
+        return self.entry.channel_id
+
+
+class CalendarConflict(NamedTuple):
+    """Channel day with more entries than allowed"""
+
+    channel_id: str
+    date: date
+    slots: List[CalendarSlot]
+
+
+def to_ordinal(value: DateLike) -> int:
+    """Convert an ISO 8601 date (or datetime) string or date to a day ordinal
+
+    Raises:
+        ValueError: If the string is not ISO 8601
+    """
+    if isinstance(value, datetime):
+        return value.date().toordinal()
+    if isinstance(value, date):
+        return value.toordinal()
+    try:
+        return date.fromisoformat(value).toordinal()
+    except ValueError:
+        return datetime.fromisoformat(value).date().toordinal()
+
+
+class _Bucket:
+    """Slots sorted by ordinal with a parallel key list for bisect"""
+
+    __slots__ = ("keys", "slots")
+
+    def __init__(self):
+        self.keys: List[int] = []
+        self.slots: List[CalendarSlot] = []
+
+    def append(self, slot: CalendarSlot):
+        self.keys.append(slot.ordinal)
+        self.slots.append(slot)
+
+    def between(self, start: Optional[int], end: Optional[int]) -> List[CalendarSlot]:
+        lo = 0 if start is None else bisect_left(self.keys, start)
+        hi = len(self.keys) if end is None else bisect_right(self.keys, end)
+        return self.slots[lo:hi]
+
+
+class CalendarIndex:
+    """Date-ordered index over all content calendar entries of a spec
+
+    Example:
+        >>> index = CalendarIndex.from_spec(spec)
+        >>> index.range("2025-10-01", "2025-10-07", channel_id="twitter")
+        [CalendarSlot(ordinal=..., campaign_id='launch-awareness-oct', entry=...)]
+        >>> index.conflicts(max_per_day=1)
+        []
+    """
+
+    def __init__(self, slots: List[CalendarSlot], invalid: List[Tuple[str, ContentCalendarEntry]]):
+        """Build buckets from slots (use from_spec() for the common case)
+
+        Args:
+            slots: Indexed entries, in any order
+            invalid: (campaign_id, entry) pairs whose date could not be parsed
+        """
+        slots = sorted(slots, key=lambda s: (s.ordinal, s.campaign_id))
+        self.invalid = invalid
+        self._all = _Bucket()
+        self._by_channel: Dict[str, _Bucket] = defaultdict(_Bucket)
+        self._by_status: Dict[ContentStatus, _Bucket] = defaultdict(_Bucket)
+        self._by_channel_status: Dict[Tuple[str, ContentStatus], _Bucket] = defaultdict(_Bucket)
+
+        for slot in slots:
+            entry = slot.entry
+            self._all.append(slot)
+            self._by_channel[entry.channel_id].append(slot)
+            self._by_status[entry.status].append(slot)
+            self._by_channel_status[(entry.channel_id, entry.status)].append(slot)
+
+    @classmethod
+    def from_spec(cls, spec: MarketingSpec) -> "CalendarIndex":
+        """Index every content calendar entry in the specification
+
+        Entries with unparseable dates are kept in `invalid` rather than
+        failing the build (VR-C05 style date errors are the validator's job).
+        """
+        slots: List[CalendarSlot] = []
+        invalid: List[Tuple[str, ContentCalendarEntry]] = []
+        for campaign in spec.campaigns:
+            for entry in campaign.content_calendar or ():
+                try:
+                    slots.append(CalendarSlot(to_ordinal(entry.date), campaign.id, entry))
+                except ValueError:
+                    invalid.append((campaign.id, entry))
+        return cls(slots, invalid)
+
+    def __len__(self) -> int:
+        return len(self._all.slots)
+
+    @property
+    def channel_ids(self) -> List[str]:
+        """Channels with at least one scheduled entry"""
+        return sorted(self._by_channel)
+
+    def range(
+        self,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        channel_id: Optional[str] = None,
+        status: Optional[Union[ContentStatus, str]] = None,
+    ) -> List[CalendarSlot]:
+        """Entries dated within [start, end] (inclusive, open if None)
+
+        Args:
+            start: First date to include
+            end: Last date to include
+            channel_id: Restrict to one channel
+            status: Restrict to one ContentStatus
+
+        Returns:
+            Matching slots in date order
+        """
+        bucket = self._bucket(channel_id, status)
+        if bucket is None:
+            return []
+        return bucket.between(
+            None if start is None else to_ordinal(start),
+            None if end is None else to_ordinal(end),
+        )
+
+    def next_entry(
+        self,
+        after: DateLike,
+        channel_id: Optional[str] = None,
+        status: Optional[Union[ContentStatus, str]] = None,
+    ) -> Optional[CalendarSlot]:
+        """First entry dated strictly after the given date"""
+        bucket = self._bucket(channel_id, status)
+        if bucket is None:
+            return None
+        pos = bisect_right(bucket.keys, to_ordinal(after))
+        return bucket.slots[pos] if pos < len(bucket.slots) else None
+
+    def conflicts(
+        self,
+        max_per_day: int = 1,
+        channel_id: Optional[str] = None,
+    ) -> List[CalendarConflict]:
+        """Channel days scheduled with more than max_per_day entries
+
+        Args:
+            max_per_day: Allowed entries per channel per day
+            channel_id: Restrict to one channel
+
+        Returns:
+            Conflicts ordered by channel, then date
+        """
+        channels = [channel_id] if channel_id else self.channel_ids
+        conflicts: List[CalendarConflict] = []
+        for ch_id in channels:
+            bucket = self._by_channel.get(ch_id)
+            if bucket is None:
+                continue
+            keys, slots = bucket.keys, bucket.slots
+            i = 0
+            while i < len(keys):
+                j = bisect_right(keys, keys[i], lo=i)
+                if j - i > max_per_day:
+                    conflicts.append(
+                        CalendarConflict(ch_id, date.fromordinal(keys[i]), slots[i:j])
+                    )
+                i = j
+        return conflicts
+
+    def _bucket(
+        self,
+        channel_id: Optional[str],
+        status: Optional[Union[ContentStatus, str]],
+    ) -> Optional[_Bucket]:
+        """Pick the narrowest precomputed bucket for the filters"""
+        if status is not None:
+            status = ContentStatus(status)
+        if channel_id is not None and status is not None:
+            return self._by_channel_status.get((channel_id, status))
+        if channel_id is not None:
+            return self._by_channel.get(channel_id)
+        if status is not None:
+            return self._by_status.get(status)
+        return self._all
@@ -0,0 +1,334 @@
+"""Validate only the specs affected by changes since a git ref
+
+In a repository with thousands of spec files most of them are untouched
+by a given change. select_changes() asks the local git for the changed
+spec files under a workspace and widens the set to everything whose
+outcome can depend on them:
+
+- changed     modified, added or untracked spec files (git diff <ref> and
+              git ls-files --others); deleted files are only used for the
+              ids they defined at <ref>
+- dependents  files that include a changed file ($ref, transitively) or
+              mention an id defined by a changed file, now or at <ref>
+              (references to it may have been broken or fixed)
+- providers   files defining ids referenced by the changed and dependent
+              files; they are parsed so references resolve, but their own
+              issues are not reported
+
+Files are matched against ids by a token scan of their bytes (no YAML
+parsing), and only the selected files are parsed, in parallel worker
+processes. The selection is conservative: a file that merely mentions a
+changed id is revalidated.
+
+Example:
+    >>> result, selection = validate_changes("specs/", "origin/main")
+    >>> len(selection.validated), selection.skipped
+    (3, 2417)
+"""
+
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from marketing_spec_kit.exceptions import MarketingSpecError
+from marketing_spec_kit.models import MarketingSpec
+from marketing_spec_kit.parser import MarketingSpecParser
+from marketing_spec_kit.validator import ValidationResult
+from marketing_spec_kit.workspace import (
+    DEFAULT_PATTERNS,
+    ENTITY_TYPES,
+    ID_RULES,
+    MarketingWorkspace,
+    WorkspaceDocument,
+    WorkspaceLoadError,
+    WorkspaceValidator,
+    load_documents,
+    project_slug,
+    spec_files,
+)
+
+# Characters of an id-like token (ids, slugs, file names)
+_TOKEN = re.compile(rb"[A-Za-z0-9_.@/-]+")
+# 'id: x' / '"id": "x"' (not project_id, tool_id, ...)
+_ID = re.compile(rb"(?<![\w-])[\"']?id[\"']?[ \t]*:[ \t]*[\"']?([^\"'\s,}#]+)")
+_PROJECT = re.compile(rb"^[\"']?project[\"']?[ \t]*:|[{,][ \t\r\n]*\"project\"[ \t]*:", re.M)
+_NAME = re.compile(rb"[\"']?name[\"']?[ \t]*:[ \t]*[\"']?([^\"'\r\n#,}]+?)[\"']?[ \t]*(?:[,}\r\n]|$)", re.M)
+_REF = re.compile(rb"\$ref[\"']?[ \t]*:[ \t]*[\"']?([^\"'#\s}]+)")
+
+
+class _FileScan(NamedTuple):
+    """Token scan of one spec file"""
+
+    tokens: Set[str]  # Every id-like token (any mention)
+    defines: Set[str]  # Entity ids and project slugs the file defines
+    refs: Set[Path]  # Resolved $ref targets
+    project: bool  # Defines a project
+
+
+class ChangeSelection(BaseModel):
+    """Spec files selected for validation by changes since a ref"""
+
+    ref: str
+    changed: List[str] = Field(default_factory=list, description="Changed or untracked spec files")
+    deleted: List[str] = Field(default_factory=list, description="Spec files deleted since the ref")
+    dependents: List[str] = Field(default_factory=list, description="Files including or referencing changed ones")
+    providers: List[str] = Field(default_factory=list, description="Files loaded to resolve references only")
+    total: int = Field(0, description="Spec files in the workspace")
+
+    @property
+    def validated(self) -> List[str]:
+        """Files whose issues are reported"""
+        return self.changed + self.dependents
+
+    @property
+    def skipped(self) -> int:
+        """Spec files neither validated nor loaded"""
+        return self.total - len(self.changed) - len(self.dependents) - len(self.providers)
+
+
+def _git(root: Path, *args: str) -> bytes:
+    """Run git in root (MKT-GIT-001 on failure)"""
+    try:
+        completed = subprocess.run(["git", "-C", str(root), *args], capture_output=True, check=False)
+    except OSError as e:
+        raise MarketingSpecError("MKT-GIT-001", f"Cannot run git: {e}", "Install git or validate without --changed-since")
+    if completed.returncode != 0:
+        message = completed.stderr.decode("utf-8", "replace").strip().splitlines()
+        raise MarketingSpecError(
+            "MKT-GIT-001",
+            f"git {args[0]} failed: {message[-1] if message else completed.returncode}",
+            "Check that the directory is inside a git repository and the ref exists (e.g. fetch it first)",
+        )
+    return completed.stdout
+
+
+def git_changes(root: Union[str, Path], ref: str) -> Tuple[List[Path], List[Path]]:
+    """Files under root changed since ref (working tree included)
+
+    Returns:
+        (existing changed or untracked files, deleted files), as paths under root
+    """
+    root = Path(root)
+    diff = _git(root, "diff", "--name-only", "--no-renames", "--relative", "-z", ref, "--")
+    untracked = _git(root, "ls-files", "--others", "--exclude-standard", "-z")
+    names = {name for name in (diff + untracked).decode("utf-8").split("\0") if name}
+    changed, deleted = [], []
+    for name in sorted(names):
+        path = root / name
+        (changed if path.exists() else deleted).append(path)
+    return changed, deleted
+
+
+def _ids_of_data(data: dict) -> Set[str]:
+    """Ids defined by raw spec data (and its project slug)"""
+    ids = set()
+    for collection in ID_RULES:
+        for entity in data.get(collection) or ():
+            if isinstance(entity, dict) and isinstance(entity.get("id"), str):
+                ids.add(entity["id"])
+    project = data.get("project")
+    if isinstance(project, dict) and isinstance(project.get("name"), str):
+        ids.add(project["name"].lower().replace(" ", "-"))
+    return ids
+
+
+def _ids_at_ref(root: Path, ref: str, path: Path) -> Set[str]:
+    """Ids a file defined at ref (empty if it did not exist or did not parse)"""
+    try:
+        content = _git(root, "show", f"{ref}:./{path.relative_to(root).as_posix()}")
+        fmt = "json" if path.suffix.lower() == ".json" else "yaml"
+        return _ids_of_data(MarketingSpecParser()._load_data(content, fmt))
+    except Exception:
+        return set()
+
+
+def defined_ids(spec: MarketingSpec) -> Set[str]:
+    """Ids of every entity of a spec (and its project slug)"""
+    ids = {entity.id for collection in ID_RULES for entity in getattr(spec, collection)}
+    if spec.project is not None:
+        ids.add(project_slug(spec.project))
+    return ids
+
+
+def referenced_ids(spec: MarketingSpec) -> Set[str]:
+    """Ids a spec references (project_id, plan_id, channels, entity_id, ...)"""
+    ids: Set[str] = set()
+    for entity in [*spec.products, *spec.plans, *spec.campaigns, *spec.content_templates, *spec.milestones]:
+        ids.add(entity.project_id)
+    for plan in spec.plans:
+        ids.update(plan.campaign_ids or ())
+    for campaign in spec.campaigns:
+        ids.add(campaign.plan_id)
+        ids.update(campaign.product_ids or ())
+        ids.update(campaign.channels)
+        ids.update(entry.channel_id for entry in campaign.content_calendar or ())
+    for channel in spec.channels:
+        if channel.tool_id:
+            ids.add(channel.tool_id)
+    for tool in spec.tools:
+        ids.update(tool.channel_ids or ())
+    for milestone in spec.milestones:
+        ids.update(milestone.campaign_ids or ())
+        ids.update(milestone.product_ids or ())
+    for analytics in spec.analytics:
+        ids.add(analytics.entity_id)
+    return ids
+
+
+def _scan(path: Path) -> _FileScan:
+    """Tokens, defined ids and $ref targets of a file (no parsing)"""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return _FileScan(set(), set(), set(), False)
+    tokens = {token.decode("utf-8", "replace").strip("./") for token in _TOKEN.findall(data)}
+    defines = {value.decode("utf-8", "replace") for value in _ID.findall(data)}
+    project = _PROJECT.search(data) is not None
+    if project:
+        # Any name could be the project's: project_id references use its slug
+        defines.update(
+            name.decode("utf-8", "replace").strip().lower().replace(" ", "-") for name in _NAME.findall(data)
+        )
+    tokens |= defines
+    refs = {(path.parent / ref.decode("utf-8", "replace")).resolve() for ref in _REF.findall(data)}
+    return _FileScan(tokens, defines, refs, project)
+
+
+def _load(paths: Iterable[Path], max_workers: Optional[int]) -> Dict[Path, Union[WorkspaceDocument, WorkspaceLoadError]]:
+    paths = list(paths)
+    return dict(zip(paths, load_documents(paths, max_workers)))
+
+
+def select_changes(
+    root: Union[str, Path],
+    ref: str,
+    patterns: Sequence[str] = DEFAULT_PATTERNS,
+    max_workers: Optional[int] = None,
+) -> Tuple[MarketingWorkspace, ChangeSelection]:
+    """Load the part of a workspace affected by changes since ref
+
+    Args:
+        root: Workspace directory inside a git repository
+        ref: Commit, branch or tag to compare the working tree with
+        patterns: Glob patterns for spec files
+        max_workers: Worker processes for parsing (None = CPU count)
+
+    Returns:
+        (workspace of the changed, dependent and provider files, selection)
+
+    Raises:
+        MarketingSpecError: If git fails (MKT-GIT-001)
+    """
+    root = Path(root)
+    files = spec_files(root, patterns)
+    selection = ChangeSelection(ref=ref, total=len(files))
+    changed, deleted = git_changes(root, ref)
+    known = set(files)
+    changed = [path for path in changed if path in known]
+    deleted = [path for path in deleted if any(path.match(pattern) for pattern in patterns)]
+    if not changed and not deleted:
+        return MarketingWorkspace(root, [], []), selection
+
+    loaded = _load(changed, max_workers)
+    touched_ids: Set[str] = set()
+    for path in changed + deleted:
+        touched_ids |= _ids_at_ref(root, ref, path)
+    for item in loaded.values():
+        if isinstance(item, WorkspaceDocument):
+            touched_ids |= defined_ids(item.spec)
+
+    # One token scan of every other file
+    scans = {path: _scan(path) for path in files if path not in loaded}
+    touched_files = {path.resolve() for path in changed + deleted}
+    includes = {path for path, scan in scans.items() if scan.refs & touched_files}
+    # Includes of includes
+    while True:
+        targets = {path.resolve() for path in includes}
+        more = {path for path, scan in scans.items() if path not in includes and scan.refs & targets}
+        if not more:
+            break
+        includes |= more
+    dependents = sorted(includes | {path for path, scan in scans.items() if scan.tokens & touched_ids})
+    loaded.update(_load(dependents, max_workers))
+
+    wanted: Set[str] = set()
+    defined: Set[str] = set()
+    for item in loaded.values():
+        if isinstance(item, WorkspaceDocument):
+            wanted |= referenced_ids(item.spec)
+            defined |= defined_ids(item.spec)
+    wanted -= defined
+    providers = sorted(path for path, scan in scans.items() if path not in loaded and scan.defines & wanted)
+    has_project = any(
+        isinstance(item, WorkspaceDocument) and item.spec.project is not None for item in loaded.values()
+    ) or any(scans[path].project for path in providers)
+    if not has_project:
+        # Workspace validation needs a project to validate against
+        providers += [path for path, scan in sorted(scans.items()) if scan.project and path not in loaded][:1]
+    loaded.update(_load(providers, max_workers))
+
+    selection.changed = [str(path) for path in changed]
+    selection.deleted = [str(path) for path in deleted]
+    selection.dependents = [str(path) for path in dependents]
+    selection.providers = [str(path) for path in providers]
+
+    ordered = [loaded[path] for path in sorted(loaded)]
+    documents = [item for item in ordered if isinstance(item, WorkspaceDocument)]
+    errors = [item for item in ordered if isinstance(item, WorkspaceLoadError)]
+    return MarketingWorkspace(root, documents, errors), selection
+
+
+def filter_result(
+    result: ValidationResult,
+    workspace: MarketingWorkspace,
+    paths: Iterable[Union[str, Path]],
+) -> ValidationResult:
+    """Keep the issues of entities defined in the given files
+
+    Workspace-wide issues are kept; project issues are kept when one of the
+    files defines a project. Rule counters are left as they are.
+    """
+    reported = {Path(path) for path in paths}
+    collections = {entity_type: collection for collection, entity_type in ENTITY_TYPES.items()}
+    project_reported = any(path in reported for path, _ in workspace.projects)
+
+    def keep(issue) -> bool:
+        if issue.entity_type == "file":
+            return Path(issue.entity_id) in reported
+        if issue.entity_type == "project":
+            return project_reported
+        collection = collections.get(issue.entity_type)
+        if collection is None:
+            return True
+        paths = workspace.index[collection].get(issue.entity_id)
+        return paths is None or any(path in reported for path in paths)
+
+    filtered = result.model_copy(update={
+        "errors": [issue for issue in result.errors if keep(issue)],
+        "warnings": [issue for issue in result.warnings if keep(issue)],
+        "info": [issue for issue in result.info if keep(issue)],
+    })
+    filtered.valid = not filtered.errors
+    return filtered
+
+
+def validate_changes(
+    root: Union[str, Path],
+    ref: str,
+    patterns: Sequence[str] = DEFAULT_PATTERNS,
+    max_workers: Optional[int] = None,
+    validator: Optional[WorkspaceValidator] = None,
+) -> Tuple[ValidationResult, ChangeSelection]:
+    """Validate the files affected by changes since ref
+
+    Returns:
+        (result with the issues of changed and dependent files, selection)
+    """
+    workspace, selection = select_changes(root, ref, patterns, max_workers)
+    if not selection.validated:
+        return ValidationResult(valid=True), selection
+    result = (validator or WorkspaceValidator()).validate_workspace(workspace)
+    return filter_result(result, workspace, selection.validated), selection
@@ -4,14 +4,26 @@ CLI for marketing_spec_kit - Marketing Operations Specification Toolkit
 Commands:
 - init: Create a new specification from template
 - validate: Validate an existing specification
+- export: Export campaign/channel/template configs from a specification
+- calendar: Query the content calendar across campaigns
+- lint: Check scheduled content against channel constraints
+- diff: Semantic diff between two specifications
+- impact: Show everything that depends on an entity
+- rollup: Roll campaign analytics up to plan-level KPIs
+- budget: Budget ledger per plan, allocation key, channel and currency
+- compile: Compile a specification into a binary snapshot
+- schema: Export the versioned JSON Schema of the specification format
+- lsp: Language server for editors (stdio)
 - info: Show toolkit information
 """
 
 import sys
 from pathlib import Path
+from typing import List, Optional
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
@@ -43,7 +55,7 @@ def info():
         "Entities: [green]9[/green] (Project, Product, MarketingPlan, Campaign, Channel, Tool, Template, Milestone, Analytics)\n"
         "Validation Rules: [green]45[/green]\n"
         "SDM Commands: [green]10[/green] (constitution → discover → ... → optimize)\n"
-        "CLI Commands: [green]init, validate, info[/green]",
+        "CLI Commands: [green]init, validate, export, calendar, lint, diff, impact, rollup, budget, compile, schema, lsp, info[/green]",
         title="📦 Toolkit Info",
         border_style="cyan",
     ))
@@ -51,6 +63,16 @@ def info():
     console.print("\n[bold]Available Commands:[/bold]")
     console.print("  [cyan]init[/cyan] <project-dir>  Initialize a new marketing project with complete structure")
     console.print("  [cyan]validate[/cyan] <filename>  Validate an existing specification")
+    console.print("  [cyan]export[/cyan] <filename>    Export config/ and templates/ from a specification")
+    console.print("  [cyan]calendar[/cyan] <filename>  Query scheduled content by channel, date and status")
+    console.print("  [cyan]lint[/cyan] <filename>      Check scheduled content against channel constraints")
+    console.print("  [cyan]diff[/cyan] <old> <new>     Show entity-level changes between two specifications")
+    console.print("  [cyan]impact[/cyan] <file> <id>   Show campaigns, milestones and content depending on an entity")
+    console.print("  [cyan]rollup[/cyan] <filename>    Aggregate campaign analytics into plan-level KPIs")
+    console.print("  [cyan]budget[/cyan] <filename>    Show allocated, committed and remaining budget per plan")
+    console.print("  [cyan]compile[/cyan] <filename>   Compile a validated specification into a fast-loading snapshot")
+    console.print("  [cyan]schema[/cyan]               Export the JSON Schema of the specification format")
+    console.print("  [cyan]lsp[/cyan]                  Run the language server (diagnostics and id completion in editors)")
     console.print("  [cyan]info[/cyan]                 Show this information")
 
 
@@ -143,9 +165,652 @@ def init(
         raise typer.Exit(2)
 
 
+@app.command()
+def export(
+    filename: str = typer.Argument(..., help="Specification file to export (YAML or JSON)"),
+    output: str = typer.Option(
+        ".",
+        "--output",
+        "-o",
+        help="Project directory receiving config/ and templates/",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Preview without writing files",
+    ),
+):
+    """Export campaign configs from a specification
+
+    Renders one file per entity, deterministically, from the parsed spec:
+    - config/campaigns/<id>.yaml    Campaign configuration
+    - config/channels/<id>.yaml     Channel configuration (with tool)
+    - config/calendars/<id>.yaml    Per-channel content calendar
+    - templates/<id>.yaml           Content template
+
+    Example:
+        marketing_spec_kit export specs/001-q1/spec.yaml
+        marketing_spec_kit export spec.yaml --output my-project --dry-run
+
+    Exit codes:
+        0: Export succeeded
+        1: Export failed
+        2: Parse error (invalid YAML/JSON)
+    """
+    from marketing_spec_kit.exporter import MarketingConfigExporter
+
+    spec = _parse_or_exit(filename)
+
+    try:
+        result = MarketingConfigExporter().export(
+            spec,
+            output_dir=Path(output),
+            dry_run=dry_run,
+        )
+    except MarketingSpecError as e:
+        console.print(f"[red]✗[/red] Export failed: [{e.code}] {e.message}")
+        raise typer.Exit(1)
+
+    if dry_run:
+        console.print("[cyan]→[/cyan] Dry run - would create...")
+        for file_path in result["files"]:
+            console.print(f"  [green]✓[/green] {file_path}")
+
+    console.print(f"\n[cyan]→[/cyan] Total: {result['file_count']} files")
+    if not dry_run:
+        console.print(f"[green]✓[/green] Exported to {result['output_dir']}")
+
+
+@app.command()
+def calendar(
+    filename: str = typer.Argument(..., help="Specification file (YAML or JSON)"),
+    channel: str = typer.Option(None, "--channel", "-c", help="Only entries for this channel id"),
+    start: str = typer.Option(None, "--from", help="First date to include (YYYY-MM-DD)"),
+    end: str = typer.Option(None, "--to", help="Last date to include (YYYY-MM-DD)"),
+    status: str = typer.Option(None, "--status", help="Only entries with status: planned, created or published"),
+    conflicts: bool = typer.Option(
+        False,
+        "--conflicts",
+        help="Report channel days with more than --max-per-day entries",
+    ),
+    max_per_day: int = typer.Option(1, "--max-per-day", help="Allowed entries per channel per day"),
+    format: str = typer.Option("text", "--format", "-f", help="Output format: text or json"),
+):
+    """Query the content calendar across all campaigns
+
+    Example:
+        marketing_spec_kit calendar spec.yaml --channel twitter --from 2025-10-01 --to 2025-10-07
+        marketing_spec_kit calendar spec.yaml --status planned --format json
+        marketing_spec_kit calendar spec.yaml --conflicts
+
+    Exit codes:
+        0: Query succeeded (no conflicts with --conflicts)
+        1: Invalid query, or conflicts found with --conflicts
+        2: Parse error (invalid YAML/JSON)
+    """
+    from marketing_spec_kit.calendar_index import CalendarIndex
+
+    if format not in ["text", "json"]:
+        console.print(f"[red]✗[/red] Invalid format: {format} (use 'text' or 'json')")
+        raise typer.Exit(1)
+
+    index = CalendarIndex.from_spec(_parse_or_exit(filename))
+
+    try:
+        if conflicts:
+            found = index.conflicts(max_per_day=max_per_day, channel_id=channel)
+            slots = [slot for conflict in found for slot in conflict.slots]
+        else:
+            found = []
+            slots = index.range(start, end, channel_id=channel, status=status)
+    except ValueError as e:
+        console.print(f"[red]✗[/red] Invalid query: {e}")
+        raise typer.Exit(1)
+
+    if format == "json":
+        import json
+        print(json.dumps({
+            "file": filename,
+            "count": len(slots),
+            "entries": [
+                {
+                    "date": slot.entry.date,
+                    "campaign_id": slot.campaign_id,
+                    "channel_id": slot.channel_id,
+                    "content_type": slot.entry.content_type,
+                    "title": slot.entry.title,
+                    "status": slot.entry.status.value,
+                }
+                for slot in slots
+            ],
+        }, indent=2))
+    else:
+        table = Table(title="📅 Content Calendar", border_style="cyan")
+        table.add_column("Date", style="cyan")
+        table.add_column("Channel", style="yellow")
+        table.add_column("Campaign", style="dim")
+        table.add_column("Type")
+        table.add_column("Title", style="white")
+        table.add_column("Status", style="green")
+        for slot in slots:
+            table.add_row(
+                slot.entry.date,
+                escape(slot.channel_id),
+                escape(slot.campaign_id),
+                escape(slot.entry.content_type),
+                escape(slot.entry.title),
+                slot.entry.status.value,
+            )
+        console.print(table)
+        console.print(f"\n[cyan]→[/cyan] {len(slots)} of {len(index)} entries")
+        if index.invalid:
+            console.print(f"[yellow]⚠[/yellow] {len(index.invalid)} entries skipped (invalid date)")
+        if conflicts:
+            if found:
+                console.print(f"[red]✗[/red] {len(found)} over-booked channel day(s)")
+            else:
+                console.print("[green]✓[/green] No conflicts")
+
+    if found:
+        raise typer.Exit(1)
+
+
+@app.command()
+def lint(
+    filename: str = typer.Argument(..., help="Specification file to lint (YAML or JSON)"),
+    strict: bool = typer.Option(
+        False,
+        "--strict",
+        "-s",
+        help="Fail on warnings (treat warnings as errors)",
+    ),
+    format: str = typer.Option("text", "--format", "-f", help="Output format: text or json"),
+):
+    """Check scheduled content against channel constraints
+
+    Applies Channel.constraints (max_text_length, max_hashtags, ...) to every
+    content calendar entry and template example that targets the channel.
+
+    Example:
+        marketing_spec_kit lint spec.yaml
+        marketing_spec_kit lint spec.yaml --format json
+
+    Exit codes:
+        0: All content within constraints
+        1: Constraint violations found
+        2: Parse error (invalid YAML/JSON)
+    """
+    from marketing_spec_kit.constraints import ChannelConstraintEngine
+
+    if format not in ["text", "json"]:
+        console.print(f"[red]✗[/red] Invalid format: {format} (use 'text' or 'json')")
+        raise typer.Exit(1)
+
+    result = ChannelConstraintEngine().check(_parse_or_exit(filename))
+
+    if format == "json":
+        _display_validation_result_json(result, filename)
+    else:
+        _display_validation_result(result)
+
+    if not result.valid or (strict and result.warning_count > 0):
+        raise typer.Exit(1)
+
+
+@app.command()
+def diff(
+    old_file: str = typer.Argument(..., help="Previous specification (YAML or JSON)"),
+    new_file: str = typer.Argument(..., help="Current specification (YAML or JSON)"),
+    format: str = typer.Option("text", "--format", "-f", help="Output format: text or json"),
+):
+    """Show a semantic, entity-level diff between two specifications
+
+    Entities are matched by id; only fields that changed are reported.
+
+    Example:
+        marketing_spec_kit diff old-spec.yaml spec.yaml
+        marketing_spec_kit diff old-spec.yaml spec.yaml --format json
+
+    Exit codes:
+        0: No differences
+        1: Differences found
+        2: Parse error (invalid YAML/JSON)
+    """
+    from marketing_spec_kit.diff import SpecDiffer
+
+    if format not in ["text", "json"]:
+        console.print(f"[red]✗[/red] Invalid format: {format} (use 'text' or 'json')")
+        raise typer.Exit(1)
+
+    result = SpecDiffer().diff(_parse_or_exit(old_file), _parse_or_exit(new_file))
+
+    if format == "json":
+        import json
+        output = result.model_dump()
+        output.update({
+            "old_file": old_file,
+            "new_file": new_file,
+            "summary": result.summary(),
+            "changed_ids": result.changed_ids,
+        })
+        print(json.dumps(output, indent=2, default=str))
+    else:
+        symbols = {"added": "[green]+[/green]", "removed": "[red]-[/red]", "changed": "[yellow]~[/yellow]"}
+        for change in result.changes:
+            console.print(f"{symbols[change.change]} {change.collection}/[cyan]{change.entity_id}[/cyan]")
+            for field_change in change.fields:
+                console.print(
+                    f"    [dim]{escape(field_change.field)}:[/dim] "
+                    f"{escape(repr(field_change.old))} → {escape(repr(field_change.new))}"
+                )
+        console.print(
+            f"\n[cyan]→[/cyan] {len(result.changes)} changed, {result.unchanged} unchanged entities"
+        )
+
+    if result.has_changes:
+        raise typer.Exit(1)
+
+
+@app.command()
+def impact(
+    filename: str = typer.Argument(..., help="Specification file (YAML or JSON)"),
+    entity_id: str = typer.Argument(..., help="ID of the entity to retire or change"),
+    kind: str = typer.Option(
+        None,
+        "--type",
+        "-t",
+        help="Entity kind when the id is ambiguous (plan, product, campaign, channel, tool, ...)",
+    ),
+    format: str = typer.Option("text", "--format", "-f", help="Output format: text or json"),
+):
+    """Show every entity and calendar entry that depends on an entity
+
+    Example:
+        marketing_spec_kit impact spec.yaml buffer
+        marketing_spec_kit impact spec.yaml twitter --type channel --format json
+
+    Exit codes:
+        0: Query succeeded
+        1: Unknown or ambiguous entity id
+        2: Parse error (invalid YAML/JSON)
+    """
+    from marketing_spec_kit.impact import ImpactAnalyzer
+
+    if format not in ["text", "json"]:
+        console.print(f"[red]✗[/red] Invalid format: {format} (use 'text' or 'json')")
+        raise typer.Exit(1)
+
+    analyzer = ImpactAnalyzer.from_spec(_parse_or_exit(filename))
+    try:
+        report = analyzer.impact(entity_id, kind=kind)
+    except (KeyError, ValueError) as e:
+        console.print(f"[red]✗[/red] {e.args[0]}")
+        raise typer.Exit(1)
+
+    if format == "json":
+        import json
+        output = report.model_dump()
+        output.update({"file": filename, "by_kind": report.by_kind})
+        print(json.dumps(output, indent=2))
+        return
+
+    console.print(f"Impact of {report.kind} [cyan]{escape(report.entity_id)}[/cyan]\n")
+    if report.entities:
+        table = Table(title="🔗 Dependent Entities", border_style="cyan")
+        table.add_column("Depth", style="dim", justify="right")
+        table.add_column("Entity", style="cyan")
+        table.add_column("Via", style="yellow")
+        table.add_column("Field", style="dim")
+        for entity in report.entities:
+            table.add_row(
+                str(entity.depth),
+                f"{entity.kind}\n[dim]{escape(entity.entity_id)}[/dim]",
+                escape(entity.via),
+                ", ".join(entity.fields),
+            )
+        console.print(table)
+    if report.calendar_entries:
+        table = Table(title="📅 Affected Calendar Entries", border_style="cyan")
+        table.add_column("Date", style="cyan")
+        table.add_column("Channel", style="yellow")
+        table.add_column("Campaign", style="dim")
+        table.add_column("Title", style="white")
+        for entry in report.calendar_entries:
+            table.add_row(entry.date, entry.channel_id, entry.campaign_id, escape(entry.title))
+        console.print(table)
+
+    counts = ", ".join(f"{len(ids)} {k}" for k, ids in report.by_kind.items()) or "no entities"
+    console.print(
+        f"\n[cyan]→[/cyan] {counts}; {len(report.calendar_entries)} calendar entries"
+    )
+
+
+@app.command()
+def rollup(
+    filename: str = typer.Argument(..., help="Specification file (YAML or JSON) or compiled snapshot"),
+    plan: str = typer.Option(None, "--plan", "-p", help="Only show this plan"),
+    aggregations: List[str] = typer.Option(
+        None,
+        "--agg",
+        "-a",
+        help="Metric aggregation: metric=sum, metric=mean or metric=weighted:<metric> (repeatable)",
+    ),
+    kpi_metrics: List[str] = typer.Option(
+        None,
+        "--kpi",
+        "-k",
+        help="Metric measuring a plan KPI: 'KPI name=metric' (repeatable)",
+    ),
+    format: str = typer.Option("text", "--format", "-f", help="Output format: text or json"),
+):
+    """Roll campaign analytics up to plan-level KPIs
+
+    Campaign reports are grouped by campaign plan, metrics are summed
+    (averaged for '*_rate' metrics, unless --agg says otherwise) and each
+    plan KPI is compared with the metric named like it.
+
+    Example:
+        marketing_spec_kit rollup spec.yaml
+        marketing_spec_kit rollup spec.mspec --kpi "Qualified Signups=signups"
+        marketing_spec_kit rollup spec.yaml --agg engagement_rate=weighted:impressions -f json
+
+    Exit codes:
+        0: Rollup succeeded
+        1: Invalid option or unknown plan
+        2: Parse error (invalid YAML/JSON)
+    """
+    from marketing_spec_kit.rollup import AnalyticsRollup
+    from marketing_spec_kit.snapshot import SpecSnapshot, is_snapshot
+
+    if format not in ["text", "json"]:
+        console.print(f"[red]✗[/red] Invalid format: {format} (use 'text' or 'json')")
+        raise typer.Exit(1)
+
+    try:
+        engine = AnalyticsRollup(
+            dict(_split_option(item, "--agg") for item in aggregations or ()),
+            dict(_split_option(item, "--kpi") for item in kpi_metrics or ()),
+        )
+    except ValueError as e:
+        console.print(f"[red]✗[/red] {e}")
+        raise typer.Exit(1)
+
+    if is_snapshot(filename):
+        try:
+            with SpecSnapshot(filename) as snapshot:
+                report = engine.rollup_snapshot(snapshot)
+        except ParseError as e:
+            _exit_parse_error(e, filename, format, False)
+    else:
+        report = engine.rollup(_parse_or_exit(filename))
+
+    plans = report.plans
+    if plan:
+        plans = [p for p in plans if p.plan_id == plan]
+        if not plans:
+            console.print(f"[red]✗[/red] No plan with id '{plan}'")
+            raise typer.Exit(1)
+
+    if format == "json":
+        import json
+        output = {
+            "file": filename,
+            "plans": [p.model_dump() for p in plans],
+            "skipped_reports": report.skipped_reports,
+        }
+        print(json.dumps(output, indent=2))
+        return
+
+    status_styles = {"exceeds": "green", "meets": "green", "on_track": "cyan", "below_target": "yellow"}
+    for item in plans:
+        console.print(
+            f"Plan [cyan]{escape(item.plan_id)}[/cyan]: {item.reports:,} reports "
+            f"from {len(item.campaigns)} campaign(s)"
+        )
+        if item.kpis:
+            table = Table(title="🎯 Plan KPIs", border_style="cyan")
+            table.add_column("KPI", style="cyan")
+            table.add_column("Target", justify="right")
+            table.add_column("Actual", justify="right")
+            table.add_column("Achievement", justify="right")
+            table.add_column("Status")
+            for name, kpi in item.kpis.items():
+                style = status_styles.get(kpi.status, "red")
+                table.add_row(
+                    name,
+                    f"{kpi.target:,g}",
+                    f"{kpi.actual:,g}",
+                    f"{kpi.achievement:.1f}%",
+                    f"[{style}]{kpi.status}[/{style}]",
+                )
+            console.print(table)
+        if item.metrics:
+            console.print(
+                "  [dim]Metrics:[/dim] "
+                + ", ".join(f"{escape(k)}={v:,g}" for k, v in item.metrics.items())
+            )
+        if item.missing_kpis:
+            console.print(
+                f"  [yellow]⚠[/yellow] No metric for: {escape(', '.join(item.missing_kpis))} "
+                "[dim](map with --kpi 'name=metric')[/dim]"
+            )
+        console.print()
+    if report.skipped_reports:
+        console.print(f"[dim]{report.skipped_reports:,} report(s) not rolled up (plan reports or unknown campaigns)[/dim]")
+
+
+@app.command()
+def budget(
+    filename: str = typer.Argument(..., help="Specification file (YAML or JSON) or compiled snapshot"),
+    plan: str = typer.Option(None, "--plan", "-p", help="Only show this plan (with its allocation keys)"),
+    channels: bool = typer.Option(False, "--channels", "-c", help="Show committed budget per channel"),
+    over: bool = typer.Option(False, "--over", help="Only show over-allocated or over-committed plans"),
+    format: str = typer.Option("text", "--format", "-f", help="Output format: text or json"),
+):
+    """Show the budget ledger: allocated vs committed vs remaining
+
+    Committed budget is the sum of a plan's campaign budgets. Allocation
+    keys that name a channel are committed by the campaigns on it (a
+    campaign's budget is split evenly across its channels).
+
+    Example:
+        marketing_spec_kit budget spec.yaml
+        marketing_spec_kit budget spec.yaml --plan q4-2025-launch-plan
+        marketing_spec_kit budget spec.yaml --over --format json
+
+    Exit codes:
+        0: Report shown
+        1: Invalid option or unknown plan
+        2: Parse error (invalid YAML/JSON)
+    """
+    from marketing_spec_kit.budget import BudgetLedger
+
+    if format not in ["text", "json"]:
+        console.print(f"[red]✗[/red] Invalid format: {format} (use 'text' or 'json')")
+        raise typer.Exit(1)
+
+    ledger = BudgetLedger.from_spec(_parse_or_exit(filename))
+    plans = ledger.plans
+    if plan:
+        plans = [entry for entry in plans if entry.plan_id == plan]
+        if not plans:
+            console.print(f"[red]✗[/red] No plan with id '{plan}'")
+            raise typer.Exit(1)
+    if over:
+        plans = [entry for entry in plans if entry.over_allocated or entry.over_committed]
+
+    if format == "json":
+        import json
+        output = ledger.model_dump(include={"currencies", "unplanned", "unplanned_campaigns"})
+        output["file"] = filename
+        output["plans"] = [entry.model_dump() for entry in plans]
+        if channels:
+            output["channels"] = ledger.channels
+        print(json.dumps(output, indent=2))
+        return
+
+    if plans:
+        table = Table(title="💰 Plan Budgets", border_style="cyan")
+        table.add_column("Plan", style="cyan")
+        table.add_column("Currency", style="dim")
+        table.add_column("Total", justify="right")
+        table.add_column("Allocated", justify="right")
+        table.add_column("Committed", justify="right")
+        table.add_column("Remaining", justify="right")
+        table.add_column("Campaigns", justify="right", style="dim")
+        for entry in plans:
+            allocated = f"{entry.allocated:,.2f}"
+            committed = f"{entry.committed:,.2f}"
+            table.add_row(
+                escape(entry.plan_id),
+                entry.currency,
+                f"{entry.total:,.2f}",
+                f"[red]{allocated}[/red]" if entry.over_allocated else allocated,
+                f"[red]{committed}[/red]" if entry.over_committed else committed,
+                f"[{'red' if entry.remaining < 0 else 'green'}]{entry.remaining:,.2f}[/]",
+                str(entry.campaigns),
+            )
+        console.print(table)
+    elif over:
+        console.print("[green]✓[/green] No over-allocated or over-committed plans")
+
+    if plan:
+        lines = Table(title="Allocation", border_style="dim")
+        lines.add_column("Key", style="cyan")
+        lines.add_column("Allocated", justify="right")
+        lines.add_column("Committed", justify="right")
+        lines.add_column("Remaining", justify="right")
+        for line in plans[0].lines:
+            committed = f"{line.committed:,.2f}" if line.channel else "[dim]-[/dim]"
+            lines.add_row(
+                escape(line.key) + (" [dim](channel)[/dim]" if line.channel else ""),
+                f"{line.allocated:,.2f}",
+                committed,
+                f"[{'red' if line.remaining < 0 else 'green'}]{line.remaining:,.2f}[/]",
+            )
+        console.print(lines)
+
+    if channels and ledger.channels:
+        table = Table(title="📣 Committed by Channel", border_style="cyan")
+        table.add_column("Channel", style="cyan")
+        table.add_column("Committed", justify="right")
+        for channel_id, amounts in sorted(ledger.channels.items()):
+            table.add_row(
+                escape(channel_id),
+                ", ".join(f"{amount:,.2f} {currency}" for currency, amount in amounts.items()),
+            )
+        console.print(table)
+
+    for totals in ledger.currencies:
+        console.print(
+            f"[cyan]→[/cyan] {totals.currency}: {totals.plans} plan(s), total {totals.total:,.2f}, "
+            f"committed {totals.committed:,.2f}, remaining {totals.remaining:,.2f}"
+        )
+    if ledger.unplanned_campaigns:
+        console.print(
+            f"[yellow]⚠[/yellow] {len(ledger.unplanned_campaigns)} campaign(s) without a known plan "
+            f"({ledger.unplanned:,.2f})"
+        )
+
+
+def _split_option(item: str, option: str):
+    """Split a 'key=value' option value"""
+    key, sep, value = item.partition("=")
+    if not sep or not key or not value:
+        raise ValueError(f"{option} expects 'key=value', got '{item}'")
+    return key.strip(), value.strip()
+
+
+@app.command(name="compile")
+def compile_spec(
+    filename: str = typer.Argument(..., help="Specification file to compile (YAML or JSON)"),
+    output: str = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Snapshot file (default: <filename>.mspec)",
+    ),
+):
+    """Compile a validated specification into a binary snapshot
+
+    Snapshots load without YAML parsing or re-validation. Every command that
+    reads a specification file also accepts a snapshot.
+
+    Example:
+        marketing_spec_kit compile spec.yaml
+        marketing_spec_kit calendar spec.mspec --channel twitter
+
+    Exit codes:
+        0: Snapshot written
+        1: Validation failed (no snapshot written)
+        2: Parse error (invalid YAML/JSON)
+    """
+    from marketing_spec_kit.snapshot import SNAPSHOT_SUFFIX, write_snapshot
+
+    spec = _parse_or_exit(filename)
+    result = MarketingSpecValidator().validate(spec)
+    if not result.valid:
+        _display_validation_result(result)
+        console.print("\n[red]✗[/red] Not compiled: fix validation errors first")
+        raise typer.Exit(1)
+
+    target = Path(output) if output else Path(filename).with_suffix(SNAPSHOT_SUFFIX)
+    size = write_snapshot(spec, target, source=filename)
+    console.print(f"[green]✓[/green] Compiled {filename} → {target} ({size:,} bytes)")
+
+
+@app.command()
+def schema(
+    output: str = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Schema file (default: print to stdout)",
+    ),
+):
+    """Export the versioned JSON Schema of the specification format
+
+    The schema is generated from the models used by validate, so services
+    in other languages can check specs against the same structure.
+
+    Example:
+        marketing_spec_kit schema -o marketing-spec.schema.json
+        marketing_spec_kit schema > schema.json
+    """
+    import json
+
+    from marketing_spec_kit.schema import spec_schema, write_schema
+
+    if output is None:
+        print(json.dumps(spec_schema(), indent=2))
+        return
+    size = write_schema(output)
+    console.print(f"[green]✓[/green] Wrote JSON Schema v{__version__} → {output} ({size:,} bytes)")
+
+
+@app.command()
+def lsp():
+    """Run the language server on stdin/stdout
+
+    Editors start it as a subprocess and get diagnostics while typing
+    (re-validating only the edited entities and the entities depending on
+    them) and id completion for plan_id, channels, tool_id, product_ids,
+    campaign_ids and entity_id. No network port is opened.
+
+    Example (editor configuration):
+        command: ["marketing_spec_kit", "lsp"]
+        filetypes: ["yaml", "json"]
+    """
+    from marketing_spec_kit.lsp import serve
+
+    raise typer.Exit(serve())
+
+
 @app.command()
 def validate(
-    filename: str = typer.Argument(..., help="Specification file to validate (YAML or JSON)"),
+    filename: str = typer.Argument(
+        ..., help="Specification file (YAML or JSON), workspace directory, or '-' for stdin"
+    ),
     strict: bool = typer.Option(
         False,
         "--strict",
@@ -170,6 +835,47 @@ def validate(
         "-q",
         help="Only show pass/fail (minimal output)",
     ),
+    memory: bool = typer.Option(
+        False,
+        "--memory",
+        help="Report parse peak and retained memory of the parsed spec (files only)",
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Validate each '---' separated document of a YAML stream",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Worker processes for streams, stdin and large specs (0 = CPU count)",
+    ),
+    prevalidate: bool = typer.Option(
+        False,
+        "--prevalidate",
+        help="Check the raw data against the exported JSON Schema first (lists every problem)",
+    ),
+    sarif: Optional[Path] = typer.Option(
+        None,
+        "--sarif",
+        help="Also write a SARIF 2.1.0 report for code scanning (files and workspaces)",
+    ),
+    junit: Optional[Path] = typer.Option(
+        None,
+        "--junit",
+        help="Also write a JUnit XML report, one test case per rule per entity",
+    ),
+    cache: Optional[Path] = typer.Option(
+        None,
+        "--cache",
+        help="Reuse rule outcomes of unchanged entities from this cache file (created if missing)",
+    ),
+    changed_since: Optional[str] = typer.Option(
+        None,
+        "--changed-since",
+        help="Only validate workspace files changed since this git ref (and files depending on them)",
+    ),
 ):
     """Validate a marketing specification
     
@@ -179,103 +885,111 @@ def validate(
     - 42 validation rules (VR-P01 to VR-M05)
     - Reference integrity (product_ids, channel_ids, etc.)
     
+    A directory argument validates every spec under it as one workspace:
+    cross-file references resolve, and workspace-level rules (VR-P01,
+    project_id references, id uniqueness across files) are checked.
+    
+    '-' reads from stdin. A stream of YAML documents separated by '---' (from
+    stdin, or a file with --stream) is validated document by document as it
+    is read, optionally in parallel with --jobs. For a single large spec,
+    --jobs validates entity families in parallel worker processes.
+    
+    --changed-since REF validates only the workspace files changed since a
+    git ref, plus the files that include them or reference their ids;
+    everything else is skipped.
+    
     Example:
         marketing_spec_kit validate my-spec.yaml
+        marketing_spec_kit validate specs/
         marketing_spec_kit validate my-spec.yaml --strict
         marketing_spec_kit validate my-spec.yaml --format json
         marketing_spec_kit validate my-spec.yaml --quiet
+        marketing_spec_kit validate my-spec.yaml --memory
+        marketing_spec_kit validate brands.yaml --stream --jobs 4
+        marketing_spec_kit validate spec.yaml --sarif validation.sarif --junit validation.xml
+        marketing_spec_kit validate spec.yaml --cache .marketing-spec-cache.json
+        marketing_spec_kit validate specs/ --changed-since origin/main
+        generate-specs | marketing_spec_kit validate - --quiet
     
     Exit codes:
         0: Validation passed
         1: Validation failed (errors found)
-        2: Parse error (invalid YAML/JSON)
+        2: Parse error (invalid YAML/JSON, in any document of a stream)
     """
     try:
         # Validate format option
         if format not in ["text", "json"]:
             console.print(f"[red]✗[/red] Invalid format: {format} (use 'text' or 'json')")
             raise typer.Exit(1)
+        if (sarif or junit or cache) and (filename == "-" or stream):
+            console.print("[red]✗[/red] --sarif, --junit and --cache need a file or workspace, not a stream")
+            raise typer.Exit(1)
+
+        if filename == "-":
+            from marketing_spec_kit.source import SpecSource
+
+            _validate_stream(SpecSource.stdin(), strict, verbose, format, quiet, jobs)
 
         # Check if file exists
         spec_path = Path(filename)
+        if changed_since is not None:
+            if not spec_path.is_dir():
+                console.print("[red]✗[/red] --changed-since needs a workspace directory")
+                raise typer.Exit(1)
+            _validate_changed(spec_path, changed_since, strict, verbose, format, quiet, sarif, junit, cache)
+        if spec_path.is_dir():
+            _validate_workspace(spec_path, strict, verbose, format, quiet, memory, sarif, junit, cache)
+        if stream and spec_path.is_file():
+            from marketing_spec_kit.source import SpecSource
+
+            _validate_stream(SpecSource.resolve(spec_path), strict, verbose, format, quiet, jobs)
         if not spec_path.exists():
             if format == "json":
                 import json
                 print(json.dumps({"error": "File not found", "file": filename}))
-        elif quiet:
-            console.print("[red]✗[/red] FAIL (file not found)")
-        else:
-            console.print(f"[red]✗[/red] File '{filename}' not found")
+            elif quiet:
+                console.print("[red]✗[/red] FAIL (file not found)")
+            else:
+                console.print(f"[red]✗[/red] File '{filename}' not found")
             raise typer.Exit(2)
 
         # Parse specification
         if not quiet and format == "text":
             console.print(f"[cyan]→[/cyan] Parsing '{filename}'...")
 
-        parser = MarketingSpecParser()
+        parser = MarketingSpecParser(prevalidate=prevalidate)
 
+        if memory:
+            import tracemalloc
+            tracemalloc.start()
         try:
             spec = parser.parse(spec_path)
             if not quiet and format == "text":
                 console.print("[green]✓[/green] Parsing successful")
         except (ParseError, ValidationError) as e:
-            if format == "json":
-                import json
-                error_data = {
-                    "error": "parse_error",
-                    "code": e.code,
-                    "message": e.message,
-                    "file": filename,
-                }
-                if hasattr(e, 'fix') and e.fix:
-                    error_data["fix"] = e.fix
-                if hasattr(e, 'line') and e.line:
-                    error_data["line"] = e.line
-                print(json.dumps(error_data, indent=2))
-            elif quiet:
-                console.print("[red]✗[/red] FAIL (parse error)")
-            else:
-                console.print(f"[red]✗[/red] Parsing failed: [{e.code}] {e.message}")
-                if hasattr(e, 'fix') and e.fix:
-                    console.print(f"  [yellow]Fix:[/yellow] {e.fix}")
-                if hasattr(e, 'line') and e.line:
-                    console.print(f"  [dim]Line {e.line}[/dim]")
-            raise typer.Exit(2)
+            _exit_parse_error(e, filename, format, quiet)
+        finally:
+            if memory:
+                parse_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
 
         # Validate specification
         if not quiet and format == "text":
             console.print("[cyan]→[/cyan] Validating specification...")
 
-        validator = MarketingSpecValidator()
+        validation_cache = _load_cache(cache)
+        validator = MarketingSpecValidator(jobs=jobs, cache=validation_cache)
         result = validator.validate(spec)
+        _save_cache(validation_cache, verbose, format, quiet)
 
-        # Display results based on format
-        if format == "json":
-            _display_validation_result_json(result, filename)
-        elif quiet:
-            # Quiet mode: minimal output
-            if result.valid and not (strict and result.warning_count > 0):
-                console.print("[green]✓[/green] PASS")
-            else:
-                console.print("[red]✗[/red] FAIL")
-        else:
-            # Normal text output
-            console.print()
-        _display_validation_result(result, verbose)
+        memory_report = _measure_memory(spec, parse_peak) if memory else None
+        if sarif or junit:
+            from marketing_spec_kit.reports import IssueLocator
 
-        # Exit code
-        if not result.valid:
-            if not quiet and format == "text":
-                console.print("\n[red bold]✗ Validation failed![/red bold]")
-            raise typer.Exit(1)
-        elif strict and result.warning_count > 0:
-            if not quiet and format == "text":
-                console.print("\n[yellow]⚠[/yellow] Warnings present (strict mode enabled)")
-            raise typer.Exit(1)
-        else:
-            if not quiet and format == "text":
-                console.print("\n[green bold]✓ Validation successful![/green bold]")
-            raise typer.Exit(0)
+            _write_ci_reports(
+                result, IssueLocator.for_file(spec_path), filename, sarif, junit, strict, verbose, format, quiet
+            )
+        _finish_validation(result, filename, strict, verbose, format, quiet, memory_report)
 
     except typer.Exit:
         # Re-raise typer.Exit without catching
@@ -295,8 +1009,414 @@ def validate(
             raise typer.Exit(1)
 
 
+def _validate_workspace(
+    root: Path,
+    strict: bool,
+    verbose: bool,
+    format: str,
+    quiet: bool,
+    memory: bool = False,
+    sarif: Optional[Path] = None,
+    junit: Optional[Path] = None,
+    cache: Optional[Path] = None,
+):
+    """Validate every spec under a directory as one workspace"""
+    from marketing_spec_kit.workspace import MarketingWorkspace, WorkspaceValidator
+
+    if not quiet and format == "text":
+        console.print(f"[cyan]→[/cyan] Loading workspace '{root}'...")
+
+    workspace = MarketingWorkspace.load(root)
+
+    if not quiet and format == "text":
+        console.print(
+            f"[green]✓[/green] Loaded {len(workspace.documents)} file(s)"
+            + (f", [red]{len(workspace.load_errors)} failed[/red]" if workspace.load_errors else "")
+        )
+        console.print("[cyan]→[/cyan] Validating workspace...")
+
+    validation_cache = _load_cache(cache)
+    result = WorkspaceValidator(cache=validation_cache).validate_workspace(workspace)
+    _save_cache(validation_cache, verbose, format, quiet)
+    # Files are parsed in worker processes: only the merged spec is measured
+    memory_report = _measure_memory(workspace.merged()) if memory and workspace.projects else None
+    if sarif or junit:
+        from marketing_spec_kit.reports import IssueLocator
+
+        _write_ci_reports(
+            result, IssueLocator.for_workspace(workspace), str(root), sarif, junit, strict, verbose, format, quiet
+        )
+    _finish_validation(result, str(root), strict, verbose, format, quiet, memory_report)
+
+
+def _validate_changed(
+    root: Path,
+    ref: str,
+    strict: bool,
+    verbose: bool,
+    format: str,
+    quiet: bool,
+    sarif: Optional[Path] = None,
+    junit: Optional[Path] = None,
+    cache: Optional[Path] = None,
+):
+    """Validate the workspace files affected by changes since a git ref"""
+    from marketing_spec_kit.changes import filter_result, select_changes
+    from marketing_spec_kit.validator import ValidationResult
+    from marketing_spec_kit.workspace import WorkspaceValidator
+
+    if not quiet and format == "text":
+        console.print(f"[cyan]→[/cyan] Selecting files changed since '{ref}'...")
+    try:
+        workspace, selection = select_changes(root, ref)
+    except MarketingSpecError as e:
+        if format == "json":
+            import json
+            print(json.dumps({"error": e.code, "message": e.message, "file": str(root)}))
+        else:
+            console.print(f"[red]✗[/red] [{e.code}] {e.message}")
+            if e.fix:
+                console.print(f"  [yellow]Fix:[/yellow] {e.fix}")
+        raise typer.Exit(2)
+
+    if not quiet and format == "text":
+        console.print(
+            f"[green]✓[/green] {len(selection.changed)} changed, {len(selection.deleted)} deleted, "
+            f"{len(selection.dependents)} dependent, {len(selection.providers)} provider file(s); "
+            f"[dim]{selection.skipped} of {selection.total} skipped[/dim]"
+        )
+        if verbose:
+            for label, paths in (
+                ("changed", selection.changed),
+                ("deleted", selection.deleted),
+                ("dependent", selection.dependents),
+                ("provider", selection.providers),
+            ):
+                for path in paths:
+                    console.print(f"  [dim]{label}:[/dim] {escape(path)}")
+
+    if not selection.validated:
+        result = ValidationResult(valid=True)
+        if not quiet and format == "text":
+            console.print(f"\n[green bold]✓ No spec files to validate since '{ref}'[/green bold]")
+            raise typer.Exit(0)
+    else:
+        if not quiet and format == "text":
+            console.print(f"[cyan]→[/cyan] Validating {len(selection.validated)} file(s)...")
+        validation_cache = _load_cache(cache)
+        result = WorkspaceValidator(cache=validation_cache).validate_workspace(workspace)
+        _save_cache(validation_cache, verbose, format, quiet)
+        result = filter_result(result, workspace, selection.validated)
+        if sarif or junit:
+            from marketing_spec_kit.reports import IssueLocator
+
+            _write_ci_reports(
+                result, IssueLocator.for_workspace(workspace), str(root), sarif, junit, strict, verbose, format, quiet
+            )
+    _finish_validation(result, str(root), strict, verbose, format, quiet, selection=selection)
+
+
+def _load_cache(path: Optional[Path]):
+    """ValidationCache of --cache (None without the option)"""
+    if path is None:
+        return None
+    from marketing_spec_kit.cache import ValidationCache
+
+    return ValidationCache.load(path)
+
+
+def _save_cache(cache, verbose: bool, format: str, quiet: bool):
+    """Write the validation cache back and report its hit rate (verbose)"""
+    if cache is None:
+        return
+    cache.save()
+    if verbose and not quiet and format == "text":
+        console.print(
+            f"[green]✓[/green] Cache: {cache.hits} outcome(s) reused, "
+            f"{cache.misses} validated ('{cache.path}')"
+        )
+
+
+def _write_ci_reports(
+    result,
+    locator,
+    name: str,
+    sarif: Optional[Path],
+    junit: Optional[Path],
+    strict: bool,
+    verbose: bool,
+    format: str,
+    quiet: bool,
+):
+    """Write the SARIF / JUnit reports requested for a validation result"""
+    from marketing_spec_kit.reports import write_junit, write_sarif
+
+    written = []
+    if sarif:
+        count = write_sarif(result, sarif, locator, info=verbose)
+        written.append(f"SARIF '{sarif}' ({count} results)")
+    if junit:
+        count = write_junit(result, junit, locator, name=name, strict=strict)
+        written.append(f"JUnit '{junit}' ({count} test cases)")
+    if not quiet and format == "text":
+        for report in written:
+            console.print(f"[green]✓[/green] Wrote {report}")
+
+
+def _validate_stream(
+    source,
+    strict: bool,
+    verbose: bool,
+    format: str,
+    quiet: bool,
+    jobs: int = 1,
+):
+    """Validate every document of a (possibly multi-document) stream
+
+    A single document is reported exactly like a file. Documents of a
+    multi-document stream are reported as they are validated, so output
+    starts before the producer has finished writing.
+    """
+    from itertools import chain
+
+    from marketing_spec_kit.stream import StreamValidator
+
+    documents = StreamValidator(jobs=jobs).validate(source)
+    first = next(documents, None)
+    if first is None:
+        _exit_parse_error(
+            ParseError(
+                code="MKT-VAL-001",
+                message=f"No document in {source.name}",
+                fix="Pass a YAML or JSON specification",
+            ),
+            source.name,
+            format,
+            quiet,
+        )
+    second = next(documents, None)
+    if second is None:
+        if first.error is not None:
+            _exit_parse_error(first.error, source.name, format, quiet)
+        _finish_validation(first.result, source.name, strict, verbose, format, quiet)
+
+    outputs = []
+    counts = {"passed": 0, "failed": 0, "parse_errors": 0}
+    for document in chain((first, second), documents):
+        name = f"{source.name}#{document.index}"
+        if document.error is not None:
+            counts["parse_errors"] += 1
+            if format == "json":
+                outputs.append({"document": document.index, **_parse_error_data(document.error, name)})
+            elif not quiet:
+                _display_parse_error(document.error, label=f"Document {document.index}")
+            continue
+
+        result = document.result
+        passed = result.valid and not (strict and result.warning_count > 0)
+        counts["passed" if passed else "failed"] += 1
+        if format == "json":
+            outputs.append({"document": document.index, "line": document.line, **_validation_result_data(result, name)})
+        elif not quiet:
+            _display_document_result(document, passed, verbose)
+
+    total = sum(counts.values())
+    failed = counts["failed"] + counts["parse_errors"]
+    if format == "json":
+        import json
+
+        print(json.dumps({
+            "file": source.name,
+            "valid": failed == 0,
+            "summary": {"documents": total, **counts},
+            "documents": outputs,
+        }, indent=2))
+    elif quiet:
+        console.print("[green]✓[/green] PASS" if not failed else f"[red]✗[/red] FAIL ({failed} of {total} documents)")
+    else:
+        console.print(
+            f"\n[bold]{total} documents:[/bold] [green]{counts['passed']} passed[/green], "
+            f"[red]{counts['failed']} failed[/red], [red]{counts['parse_errors']} not parsed[/red]"
+        )
+    raise typer.Exit(2 if counts["parse_errors"] else 1 if counts["failed"] else 0)
+
+
+def _display_document_result(document, passed: bool, verbose: bool):
+    """One line per stream document; the full result when it fails (or verbose)"""
+    result = document.result
+    label = f"Document {document.index} ({escape(document.name)}, line {document.line})"
+    if passed:
+        console.print(
+            f"[green]✓[/green] {label}: valid"
+            + (f", [yellow]{result.warning_count} warning(s)[/yellow]" if result.warning_count else "")
+        )
+    else:
+        console.print(
+            f"[red]✗[/red] {label}: "
+            f"[red]{result.error_count} error(s)[/red], [yellow]{result.warning_count} warning(s)[/yellow]"
+        )
+    if verbose or not passed:
+        _display_validation_result(result, verbose)
+
+
+def _parse_error_data(e, filename: str) -> dict:
+    """JSON payload of a parse error"""
+    error_data = {
+        "error": "parse_error",
+        "code": e.code,
+        "message": e.message,
+        "file": filename,
+    }
+    if e.fix:
+        error_data["fix"] = e.fix
+    if getattr(e, "line", None):
+        error_data["line"] = e.line
+    if getattr(e, "details", None):
+        error_data["details"] = e.details
+    return error_data
+
+
+def _display_parse_error(e, label: str = "Parsing"):
+    """Display a parse error with its fix, line and (up to 20) further problems"""
+    console.print(f"[red]✗[/red] {label} failed: [{e.code}] {escape(e.message)}")
+    if e.fix:
+        console.print(f"  [yellow]Fix:[/yellow] {e.fix}")
+    if getattr(e, "line", None):
+        console.print(f"  [dim]Line {e.line}[/dim]")
+    details = getattr(e, "details", None) or []
+    if len(details) > 1:
+        for detail in details[:20]:
+            console.print(f"  [dim]•[/dim] {escape(detail)}")
+        if len(details) > 20:
+            console.print(f"  [dim]… and {len(details) - 20} more[/dim]")
+
+
+def _exit_parse_error(e, filename: str, format: str, quiet: bool):
+    """Report a parse error in the requested format and exit with 2"""
+    if format == "json":
+        import json
+        print(json.dumps(_parse_error_data(e, filename), indent=2))
+    elif quiet:
+        console.print("[red]✗[/red] FAIL (parse error)")
+    else:
+        _display_parse_error(e)
+    raise typer.Exit(2)
+
+
+def _measure_memory(spec, parse_peak: int = 0):
+    """Memory report for a parsed spec"""
+    from marketing_spec_kit.memory import measure_spec
+
+    report = measure_spec(spec)
+    report.parse_peak_bytes = parse_peak
+    return report
+
+
+def _format_bytes(size: int) -> str:
+    """Human-readable byte count"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _display_memory_report(report):
+    """Display a memory report panel"""
+    lines = [f"Retained: [cyan]{_format_bytes(report.total_bytes)}[/cyan] in {report.objects:,} objects"]
+    if report.parse_peak_bytes:
+        lines.append(f"Parse peak: [cyan]{_format_bytes(report.parse_peak_bytes)}[/cyan]")
+    lines.append(
+        f"Strings: {report.strings:,} references, {report.unique_strings:,} objects, "
+        f"{report.distinct_string_values:,} distinct values"
+    )
+    lines.append(f"Duplicate strings: [yellow]{_format_bytes(report.duplicate_string_bytes)}[/yellow]")
+    lines.extend(
+        f"  {collection}: {_format_bytes(size)}"
+        for collection, size in report.by_collection.items()
+        if size
+    )
+    console.print(Panel("\n".join(lines), title="🧠 Memory", border_style="blue", expand=False))
+
+
+def _finish_validation(
+    result,
+    filename: str,
+    strict: bool,
+    verbose: bool,
+    format: str,
+    quiet: bool,
+    memory_report=None,
+    selection=None,
+):
+    """Display validation results and exit with the validate exit code"""
+
+    # Display results based on format
+    if format == "json":
+        _display_validation_result_json(result, filename, memory_report, selection)
+    elif quiet:
+        # Quiet mode: minimal output
+        if result.valid and not (strict and result.warning_count > 0):
+            console.print("[green]✓[/green] PASS")
+        else:
+            console.print("[red]✗[/red] FAIL")
+    else:
+        # Normal text output
+        console.print()
+        if memory_report is not None:
+            _display_memory_report(memory_report)
+        _display_validation_result(result, verbose)
+
+    # Exit code
+    if not result.valid:
+        if not quiet and format == "text":
+            console.print("\n[red bold]✗ Validation failed![/red bold]")
+        raise typer.Exit(1)
+    elif strict and result.warning_count > 0:
+        if not quiet and format == "text":
+            console.print("\n[yellow]⚠[/yellow] Warnings present (strict mode enabled)")
+        raise typer.Exit(1)
+    else:
+        if not quiet and format == "text":
+            console.print("\n[green bold]✓ Validation successful![/green bold]")
+        raise typer.Exit(0)
+
+
+def _parse_or_exit(filename: str):
+    """Parse a specification file (or compiled snapshot), exiting with 2 on failure"""
+    from marketing_spec_kit.snapshot import is_snapshot, load_snapshot
+
+    try:
+        if is_snapshot(filename):
+            return load_snapshot(filename)
+        return MarketingSpecParser().parse(Path(filename))
+    except (ParseError, ValidationError) as e:
+        console.print(f"[red]✗[/red] Parsing failed: [{e.code}] {e.message}")
+        if e.fix:
+            console.print(f"  [yellow]Fix:[/yellow] {e.fix}")
+        if getattr(e, "line", None):
+            console.print(f"  [dim]Line {e.line}[/dim]")
+        raise typer.Exit(2)
+
+
+# Issues shown row by row in the terminal; larger results are grouped
+MAX_TABLE_ROWS = 50
+# Groups (code, entity type) shown when a result is grouped
+MAX_GROUPS = 30
+
+
 def _display_validation_result(result, verbose: bool = False):
-    """Display validation results with rich formatting"""
+    """Display validation results
+
+    Terminals get rich tables: every issue when there are at most
+    MAX_TABLE_ROWS of a level, otherwise one row per (code, entity type)
+    group with counts, so rendering time does not grow with the issue
+    count. When stdout is not a terminal (pipes, CI logs) every issue is
+    streamed as plain text instead.
+    """
+    if not console.is_terminal:
+        _print_validation_result_plain(result, verbose)
+        return
 
     # Summary panel
     summary_lines = [
@@ -319,7 +1439,10 @@ def _display_validation_result(result, verbose: bool = False):
     ))
 
     # Errors table
-    if result.error_count > 0:
+    if result.error_count > MAX_TABLE_ROWS:
+        console.print()
+        _display_issue_groups(result.errors, "❌ Errors", "red")
+    elif result.error_count > 0:
         console.print()
         errors_table = Table(title="❌ Errors", border_style="red", show_lines=True)
         errors_table.add_column("Code", style="red bold")
@@ -340,7 +1463,10 @@ def _display_validation_result(result, verbose: bool = False):
         console.print(errors_table)
 
     # Warnings table
-    if result.warning_count > 0:
+    if result.warning_count > MAX_TABLE_ROWS:
+        console.print()
+        _display_issue_groups(result.warnings, "⚠️  Warnings", "yellow")
+    elif result.warning_count > 0:
         console.print()
         warnings_table = Table(title="⚠️  Warnings", border_style="yellow")
         warnings_table.add_column("Code", style="yellow bold")
@@ -359,7 +1485,10 @@ def _display_validation_result(result, verbose: bool = False):
         console.print(warnings_table)
 
     # Info (verbose only)
-    if verbose and len(result.info) > 0:
+    if verbose and len(result.info) > MAX_TABLE_ROWS:
+        console.print()
+        _display_issue_groups(result.info, "ℹ️  Info", "blue")
+    elif verbose and len(result.info) > 0:
         console.print()
         info_table = Table(title="ℹ️  Info", border_style="blue")
         info_table.add_column("Code", style="blue bold")
@@ -376,10 +1505,91 @@ def _display_validation_result(result, verbose: bool = False):
         console.print(info_table)
 
 
-def _display_validation_result_json(result, filename: str):
+def _group_issues(issues):
+    """(code, entity type) → [count, first issue, sample entity ids], largest first"""
+    groups = {}
+    for issue in issues:
+        group = groups.get((issue.code, issue.entity_type))
+        if group is None:
+            group = groups[(issue.code, issue.entity_type)] = [0, issue, []]
+        group[0] += 1
+        if issue.entity_id and len(group[2]) < 3:
+            group[2].append(issue.entity_id)
+    return sorted(groups.items(), key=lambda item: -item[1][0])
+
+
+def _display_issue_groups(issues, title: str, color: str):
+    """One table row per (code, entity type) group with its count and an example"""
+    groups = _group_issues(issues)
+    table = Table(
+        title=f"{title} ({len(issues):,} in {len(groups):,} groups)",
+        border_style=color,
+    )
+    table.add_column("Code", style=f"{color} bold")
+    table.add_column("Entity", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("Example", style="white")
+    table.add_column("Fix", style="green")
+
+    for (code, entity_type), (count, first, sample) in groups[:MAX_GROUPS]:
+        more = count - len(sample)
+        ids = ", ".join(sample) + (f", … +{more:,}" if sample and more > 0 else "")
+        table.add_row(
+            code,
+            f"{entity_type}\n[dim]{escape(ids)}[/dim]" if ids else entity_type,
+            f"{count:,}",
+            escape(first.message),
+            escape(first.fix),
+        )
+    console.print(table)
+    if len(groups) > MAX_GROUPS:
+        console.print(f"[dim]… {len(groups) - MAX_GROUPS:,} more groups[/dim]")
+    console.print("[dim]Pipe the output or use --format json for every issue[/dim]")
+
+
+def _print_validation_result_plain(result, verbose: bool = False):
+    """Stream validation results as plain text, one line per issue (no rich layout)"""
+    write = sys.stdout.write
+    write(
+        f"Rules checked: {result.rules_checked}, passed: {result.rules_passed} "
+        f"({result.success_rate:.1f}%)\n"
+        f"Errors: {result.error_count}, warnings: {result.warning_count}"
+        + (f", info: {len(result.info)}" if verbose else "")
+        + "\n"
+    )
+    levels = [("ERROR", result.errors), ("WARNING", result.warnings)]
+    if verbose:
+        levels.append(("INFO", result.info))
+    for label, issues in levels:
+        lines = []
+        for issue in issues:
+            entity = f"{issue.entity_type}:{issue.entity_id}" if issue.entity_id else issue.entity_type
+            field = f" {issue.field}:" if issue.field else ""
+            fix = f" (fix: {issue.fix})" if issue.fix else ""
+            lines.append(f"{label} {issue.code} {entity}{field} {issue.message}{fix}\n")
+            if len(lines) == 1000:
+                write("".join(lines))
+                lines = []
+        write("".join(lines))
+    sys.stdout.flush()
+
+
+def _display_validation_result_json(result, filename: str, memory_report=None, selection=None):
     """Display validation results in JSON format"""
     import json
 
+    output = _validation_result_data(result, filename)
+    if memory_report is not None:
+        output["memory"] = memory_report.model_dump()
+    if selection is not None:
+        output["changed_since"] = {**selection.model_dump(), "skipped": selection.skipped}
+
+    # Print JSON
+    print(json.dumps(output, indent=2))
+
+
+def _validation_result_data(result, filename: str) -> dict:
+    """JSON payload of a validation result"""
     output = {
         "file": filename,
         "valid": result.valid,
@@ -415,8 +1625,7 @@ def _display_validation_result_json(result, filename: str):
             "fix": warn.fix,
         })
 
-    # Print JSON
-    print(json.dumps(output, indent=2))
+    return output
 
 
 def main():
@@ -0,0 +1,232 @@
+"""Channel constraint enforcement for scheduled content
+
+VR-CH06 only sanity-checks Channel.constraints themselves. This module applies
+them to the content that targets each channel:
+
+- ContentCalendarEntry.title → upper-bound constraints of entry.channel_id
+- ContentTemplate.examples  → the template's own constraints, plus the
+  constraints of every channel whose content_types include template.type
+
+Supported constraint keys:
+- CNST-01: max_text_length / max_length (characters)
+- CNST-02: min_length (characters)
+- CNST-03: max_hashtags
+- CNST-04: max_mentions
+- CNST-05: max_links
+- CNST-06: content_type should be one of Channel.content_types (warning,
+  calendar only)
+
+Each channel's constraint set is compiled once into a list of checks, then
+evaluated over all texts of that channel in bulk.
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from marketing_spec_kit.models import Channel, MarketingSpec
+from marketing_spec_kit.validator import ValidationIssue, ValidationResult
+
+_HASHTAG = re.compile(r"(?<!\w)#\w+")
+_MENTION = re.compile(r"(?<!\w)@\w+")
+_LINK = re.compile(r"https?://\S+")
+
+
+class ConstraintCheck(NamedTuple):
+    """Single compiled constraint: measure(text) compared against limit"""
+
+    code: str
+    constraint: str
+    measure: Callable[[str], int]
+    limit: float
+    is_max: bool
+    label: str
+
+
+# constraint key -> (code, measure, is_max, label)
+_CHECKS: Dict[str, Tuple[str, Callable[[str], int], bool, str]] = {
+    "max_text_length": ("CNST-01", len, True, "characters"),
+    "max_length": ("CNST-01", len, True, "characters"),
+    "min_length": ("CNST-02", len, False, "characters"),
+    "max_hashtags": ("CNST-03", lambda text: len(_HASHTAG.findall(text)), True, "hashtags"),
+    "max_mentions": ("CNST-04", lambda text: len(_MENTION.findall(text)), True, "mentions"),
+    "max_links": ("CNST-05", lambda text: len(_LINK.findall(text)), True, "links"),
+}
+
+
+def compile_constraints(constraints: Optional[Dict[str, Any]]) -> List[ConstraintCheck]:
+    """Compile a constraints mapping into checks
+
+    Unknown keys, non-numeric values and non-positive maxima are ignored
+    (the latter are reported by VR-CH06 / VR-CT04).
+    """
+    checks: List[ConstraintCheck] = []
+    if not constraints:
+        return checks
+    for key, value in constraints.items():
+        spec = _CHECKS.get(key)
+        if spec is None or isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        code, measure, is_max, label = spec
+        if is_max and value <= 0:
+            continue
+        checks.append(ConstraintCheck(code, key, measure, value, is_max, label))
+    return checks
+
+
+class ChannelConstraintEngine:
+    """Batch linter for calendar entries and template examples
+
+    Example:
+        >>> engine = ChannelConstraintEngine()
+        >>> result = engine.check(spec)
+        >>> for error in result.errors:
+        ...     print(f"[{error.code}] {error.entity_id}: {error.message}")
+    """
+
+    def __init__(self):
+        self.result = ValidationResult(valid=True)
+        self._compiled: Dict[str, List[ConstraintCheck]] = {}
+        self._compiled_titles: Dict[str, List[ConstraintCheck]] = {}
+        self._content_types: Dict[str, frozenset] = {}
+
+    def check(self, spec: MarketingSpec) -> ValidationResult:
+        """Check all scheduled content and template examples in a spec
+
+        Args:
+            spec: MarketingSpec object
+
+        Returns:
+            ValidationResult with one error per violated constraint
+        """
+        self.result = ValidationResult(valid=True)
+        self._compile_channels(spec.channels)
+
+        # Bucket calendar titles per channel: (campaign_id, field, text)
+        by_channel: Dict[str, List[Tuple[str, str, str]]] = defaultdict(list)
+        content_types: Dict[str, List[Tuple[str, str, str]]] = defaultdict(list)
+        for campaign in spec.campaigns:
+            for i, entry in enumerate(campaign.content_calendar or ()):
+                by_channel[entry.channel_id].append(
+                    (campaign.id, f"content_calendar[{i}].title", entry.title)
+                )
+                content_types[entry.channel_id].append(
+                    (campaign.id, f"content_calendar[{i}].content_type", entry.content_type)
+                )
+
+        for channel_id, items in by_channel.items():
+            checks = self._compiled_titles.get(channel_id)
+            if checks:
+                self._evaluate("campaign", channel_id, checks, items)
+
+        # CNST-06: content type supported by channel
+        for channel_id, items in content_types.items():
+            supported = self._content_types.get(channel_id)
+            if supported is None:
+                continue  # Unknown channel: reference checks are out of scope
+            self.result.rules_checked += len(items)
+            for entity_id, field, content_type in items:
+                if content_type in supported:
+                    self.result.rules_passed += 1
+                else:
+                    self._add_issue(
+                        "CNST-06",
+                        "warning",
+                        "campaign",
+                        entity_id,
+                        field,
+                        f"Channel '{channel_id}' does not support content type '{content_type}'",
+                        f"Use one of: {', '.join(sorted(supported))}",
+                    )
+
+        # Template examples: own constraints + channels supporting the type
+        channels_by_type: Dict[str, List[str]] = defaultdict(list)
+        for channel in spec.channels:
+            for content_type in channel.content_types:
+                channels_by_type[content_type].append(channel.id)
+
+        for template in spec.content_templates:
+            if not template.examples:
+                continue
+            items = [
+                (template.id, f"examples[{i}]", example)
+                for i, example in enumerate(template.examples)
+            ]
+            own = compile_constraints(template.constraints)
+            if own:
+                self._evaluate("content_template", "", own, items)
+            for channel_id in channels_by_type.get(template.type, ()):
+                checks = self._compiled.get(channel_id)
+                if checks:
+                    self._evaluate("content_template", channel_id, checks, items)
+
+        self.result.valid = len(self.result.errors) == 0
+        return self.result
+
+    def _compile_channels(self, channels: List[Channel]):
+        """Compile each channel's constraint set once"""
+        self._compiled = {ch.id: compile_constraints(ch.constraints) for ch in channels}
+        # Titles summarise the content, so only upper bounds apply to them
+        self._compiled_titles = {
+            ch_id: [check for check in checks if check.is_max]
+            for ch_id, checks in self._compiled.items()
+        }
+        self._content_types = {ch.id: frozenset(ch.content_types) for ch in channels}
+
+    def _evaluate(
+        self,
+        entity_type: str,
+        channel_id: str,
+        checks: List[ConstraintCheck],
+        items: List[Tuple[str, str, str]],
+    ):
+        """Apply every check to every text of one bucket"""
+        texts = [text for _, _, text in items]
+        source = f"channel '{channel_id}'" if channel_id else "template"
+        for check in checks:
+            measured = list(map(check.measure, texts))
+            self.result.rules_checked += len(texts)
+            if check.is_max:
+                violations = [i for i, value in enumerate(measured) if value > check.limit]
+            else:
+                violations = [i for i, value in enumerate(measured) if value < check.limit]
+            self.result.rules_passed += len(texts) - len(violations)
+
+            bound = "exceeds" if check.is_max else "is below"
+            for i in violations:
+                entity_id, field, _ = items[i]
+                self._add_issue(
+                    check.code,
+                    "error",
+                    entity_type,
+                    entity_id,
+                    field,
+                    f"{measured[i]} {check.label} {bound} {source} "
+                    f"{check.constraint}={check.limit:g}",
+                    f"{'Shorten' if check.is_max else 'Extend'} the content to respect "
+                    f"{check.constraint}",
+                )
+
+    def _add_issue(
+        self,
+        code: str,
+        level: str,
+        entity_type: str,
+        entity_id: str,
+        field: str,
+        message: str,
+        fix: str,
+    ):
+        """Add constraint violation at the given level"""
+        issues = self.result.errors if level == "error" else self.result.warnings
+        issues.append(
+            ValidationIssue(
+                code=code,
+                level=level,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                field=field,
+                message=message,
+                fix=fix,
+            )
+        )
@@ -0,0 +1,192 @@
+"""Semantic diff between two MarketingSpec versions
+
+Entities are keyed by `id` within each collection (products, plans,
+campaigns, channels, tools, content_templates, milestones, analytics; the
+singleton project is keyed by its collection name). Each entity is reduced
+to a fingerprint (BLAKE2b of its canonical JSON), so unchanged entities are
+skipped after one hash comparison and the whole diff is linear in spec size.
+Only entities whose fingerprints differ are compared field by field.
+
+Example:
+    >>> diff = SpecDiffer().diff(old_spec, new_spec)
+    >>> diff.changed_ids["campaigns"]
+    ['launch-awareness-oct']
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Tuple
+
+from pydantic import BaseModel, Field
+
+from marketing_spec_kit.models import MarketingSpec
+
+# Collections keyed by entity id, in spec order
+ENTITY_COLLECTIONS = (
+    "products",
+    "plans",
+    "campaigns",
+    "channels",
+    "tools",
+    "content_templates",
+    "milestones",
+    "analytics",
+)
+
+_MISSING = object()
+
+
+class FieldChange(BaseModel):
+    """Single changed field (dotted/indexed path for nested values)"""
+
+    field: str = Field(..., description="Field path (e.g., 'budget.total', 'channels[0]')")
+    old: Any = Field(None, description="Previous value (None if added)")
+    new: Any = Field(None, description="New value (None if removed)")
+
+
+class EntityChange(BaseModel):
+    """Added, removed or changed entity"""
+
+    collection: str = Field(..., description="Spec collection (e.g., 'campaigns')")
+    entity_id: str = Field(..., description="Entity ID")
+    change: str = Field(..., description="'added', 'removed' or 'changed'")
+    fields: List[FieldChange] = Field(default_factory=list)
+
+
+class SpecDiff(BaseModel):
+    """Structured semantic diff between two specifications"""
+
+    changes: List[EntityChange] = Field(default_factory=list)
+    unchanged: int = Field(0, description="Entities with identical fingerprints")
+
+    @property
+    def has_changes(self) -> bool:
+        return len(self.changes) > 0
+
+    @property
+    def changed_ids(self) -> Dict[str, List[str]]:
+        """Added or changed entity IDs per collection (input for re-validation)"""
+        ids: Dict[str, List[str]] = {}
+        for change in self.changes:
+            if change.change != "removed":
+                ids.setdefault(change.collection, []).append(change.entity_id)
+        return ids
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Counts of added/removed/changed entities per collection"""
+        counts: Dict[str, Dict[str, int]] = {}
+        for change in self.changes:
+            bucket = counts.setdefault(
+                change.collection, {"added": 0, "removed": 0, "changed": 0}
+            )
+            bucket[change.change] += 1
+        return counts
+
+
+def fingerprint(data: Dict[str, Any]) -> str:
+    """Stable hash of an entity's JSON-serialised fields"""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def keyed_entities(spec: MarketingSpec) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Map collection → entity id → JSON-serialised entity
+
+    The project is included as collection 'project' with key 'project'.
+    """
+    keyed: Dict[str, Dict[str, Dict[str, Any]]] = {
+        "project": {"project": spec.project.model_dump(mode="json")}
+    }
+    for collection in ENTITY_COLLECTIONS:
+        keyed[collection] = {
+            entity.id: entity.model_dump(mode="json")
+            for entity in getattr(spec, collection)
+        }
+    return keyed
+
+
+class SpecDiffer:
+    """Compute semantic diffs between MarketingSpec versions
+
+    Example:
+        >>> differ = SpecDiffer()
+        >>> diff = differ.diff(old_spec, new_spec)
+        >>> for change in diff.changes:
+        ...     print(change.change, change.collection, change.entity_id)
+    """
+
+    def diff(self, old: MarketingSpec, new: MarketingSpec) -> SpecDiff:
+        """Diff two specifications entity by entity
+
+        Args:
+            old: Previous specification
+            new: Current specification
+
+        Returns:
+            SpecDiff with changes in collection order, then old-spec order
+            (added entities follow in new-spec order)
+        """
+        result = SpecDiff()
+        old_keyed = keyed_entities(old)
+        new_keyed = keyed_entities(new)
+
+        for collection in ("project",) + ENTITY_COLLECTIONS:
+            before = old_keyed[collection]
+            after = new_keyed[collection]
+
+            for entity_id, old_data in before.items():
+                new_data = after.get(entity_id)
+                if new_data is None:
+                    result.changes.append(
+                        EntityChange(collection=collection, entity_id=entity_id, change="removed")
+                    )
+                elif fingerprint(old_data) == fingerprint(new_data):
+                    result.unchanged += 1
+                else:
+                    result.changes.append(
+                        EntityChange(
+                            collection=collection,
+                            entity_id=entity_id,
+                            change="changed",
+                            fields=[
+                                FieldChange(field=path, old=a, new=b)
+                                for path, a, b in _field_changes(old_data, new_data)
+                            ],
+                        )
+                    )
+
+            for entity_id in after:
+                if entity_id not in before:
+                    result.changes.append(
+                        EntityChange(collection=collection, entity_id=entity_id, change="added")
+                    )
+
+        return result
+
+
+def _field_changes(
+    old: Dict[str, Any], new: Dict[str, Any], prefix: str = ""
+) -> List[Tuple[str, Any, Any]]:
+    """Changed (path, old, new) triples, descending into nested values
+
+    Mappings are compared key by key ('budget.total'); lists of equal length
+    element by element ('content_calendar[2].title'). Anything else, including
+    lists that grew or shrank, is reported as a whole.
+    """
+    changes: List[Tuple[str, Any, Any]] = []
+    for key in list(old) + [k for k in new if k not in old]:
+        _compare(old.get(key, _MISSING), new.get(key, _MISSING), f"{prefix}{key}", changes)
+    return changes
+
+
+def _compare(a: Any, b: Any, path: str, changes: List[Tuple[str, Any, Any]]):
+    """Append the changes between a and b under path"""
+    if a == b:
+        return
+    if isinstance(a, dict) and isinstance(b, dict):
+        changes.extend(_field_changes(a, b, prefix=f"{path}."))
+    elif isinstance(a, list) and isinstance(b, list) and len(a) == len(b):
+        for i, (x, y) in enumerate(zip(a, b)):
+            _compare(x, y, f"{path}[{i}]", changes)
+    else:
+        changes.append((path, None if a is _MISSING else a, None if b is _MISSING else b))
@@ -7,9 +7,12 @@ MKT-VAL-002: Missing required field
 MKT-VAL-003: Invalid field value
 MKT-REF-001: Reference integrity violation (entity not found)
 MKT-REF-002: Circular dependency detected
+MKT-GEN-001: Artifact generation failed (template rendering)
+MKT-SNAP-001: Invalid or incompatible compiled snapshot
+MKT-GIT-001: Git query failed (validate --changed-since)
 """
 
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 
 class MarketingSpecError(Exception):
@@ -25,7 +28,7 @@ class MarketingSpecError(Exception):
 class ParseError(MarketingSpecError):
     """Error during specification parsing (YAML/JSON → dict)
     
-    Error codes: MKT-VAL-001, MKT-VAL-002
+    Error codes: MKT-VAL-001, MKT-VAL-002, MKT-SNAP-001
     """
 
     def __init__(self, code: str, message: str, fix: str = "", line: Optional[int] = None):
@@ -36,7 +39,10 @@ class ParseError(MarketingSpecError):
 class ValidationError(MarketingSpecError):
     """Error during specification validation (dict → MarketingSpec)
     
-    Error codes: MKT-VAL-003, MKT-REF-001, MKT-REF-002
+    Error codes: MKT-VAL-002, MKT-VAL-003, MKT-REF-001, MKT-REF-002
+
+    `details` lists every structural problem found ("path: message"), the
+    first of which is described by message/field.
     """
 
     def __init__(
@@ -47,9 +53,11 @@ class ValidationError(MarketingSpecError):
         field: str = "",
         value: Any = None,
         fix: str = "",
+        details: Optional[List[str]] = None,
     ):
         self.entity = entity
         self.field = field
         self.value = value
+        self.details = details or []
         super().__init__(code, message, fix)
 
@@ -0,0 +1,200 @@
+"""
+Exporter for turning a parsed MarketingSpec into campaign config artifacts.
+
+Where the generator scaffolds project infrastructure, the exporter renders
+the deterministic, executable side of a specification:
+
+- config/campaigns/{campaign_id}.yaml   One file per Campaign
+- config/channels/{channel_id}.yaml     One file per Channel
+- config/calendars/{channel_id}.yaml    Per-channel content calendar
+- templates/{template_id}.yaml          One file per ContentTemplate
+
+Output is a pure function of the spec (no timestamps, stable ordering), so
+re-exporting an unchanged spec produces byte-identical files.
+
+Performance:
+- Templates are compiled once per exporter and reused for every entity
+- Lookups (channels, tools, plans, calendars) are indexed in one pass
+- Files are rendered with Jinja2 template streams straight to disk
+"""
+
+import json
+from collections import defaultdict
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from jinja2 import BaseLoader, Environment, FileSystemLoader, PackageLoader
+
+from marketing_spec_kit import __version__
+from marketing_spec_kit.generator import TemplateRenderError
+from marketing_spec_kit.models import ContentCalendarEntry, MarketingSpec
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Render a value as inline YAML (JSON is a YAML 1.2 subset)"""
+    if isinstance(value, Enum):
+        value = value.value
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+class MarketingConfigExporter:
+    """
+    Export campaign, channel, calendar and template configs from a spec.
+
+    Example:
+        >>> exporter = MarketingConfigExporter()
+        >>> result = exporter.export(spec, Path("my-project"))
+        >>> result["file_count"]
+        42
+    """
+
+    # Artifact kind -> template name
+    TEMPLATES = {
+        "campaign": "campaign-config.yaml.j2",
+        "channel": "channel-config.yaml.j2",
+        "calendar": "content-calendar.yaml.j2",
+        "template": "content-template.yaml.j2",
+    }
+
+    def __init__(self, custom_template_dir: Optional[Path] = None):
+        """
+        Initialize exporter with Jinja2 environment.
+
+        Args:
+            custom_template_dir: Optional path to custom templates
+        """
+        loader: BaseLoader
+        if custom_template_dir:
+            loader = FileSystemLoader(str(custom_template_dir))
+        else:
+            loader = PackageLoader("marketing_spec_kit", "project_templates")
+
+        self.env = Environment(
+            loader=loader,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            keep_trailing_newline=True,
+        )
+        self.env.filters["yaml"] = _yaml_scalar
+
+    def export(
+        self,
+        spec: MarketingSpec,
+        output_dir: Path,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Render one config file per Campaign, Channel and ContentTemplate.
+
+        Existing artifacts are overwritten; other files are left untouched.
+
+        Args:
+            spec: Parsed specification
+            output_dir: Project directory receiving config/ and templates/
+            dry_run: If True, only return the planned file list
+
+        Returns:
+            Dictionary with output directory, files and file count
+
+        Raises:
+            TemplateRenderError: If a template fails to render or a file cannot be written
+        """
+        files: List[str] = []
+        for rel_path, template_name, context in self._plan_artifacts(spec):
+            files.append(rel_path)
+            if dry_run:
+                continue
+
+            file_path = output_dir / rel_path
+            try:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                template = self.env.get_template(template_name)
+                template.stream(**context).dump(str(file_path), encoding="utf-8")
+            except Exception as e:
+                raise TemplateRenderError(
+                    code="MKT-GEN-001",
+                    message=f"Failed to render {rel_path} from {template_name}: {e}",
+                    fix="Check the custom template directory and entity fields",
+                ) from e
+
+        return {
+            "output_dir": str(output_dir),
+            "files": files,
+            "file_count": len(files),
+        }
+
+    def _plan_artifacts(
+        self, spec: MarketingSpec
+    ) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Yield (relative path, template name, context) for every artifact.
+
+        Args:
+            spec: Parsed specification
+
+        Yields:
+            Artifact descriptors in deterministic order
+        """
+        base = {
+            "project_name": spec.project.name,
+            "toolkit_name": "marketing-spec-kit",
+            "toolkit_version": __version__,
+        }
+
+        channels = {ch.id: ch for ch in spec.channels}
+        tools = {t.id: t for t in spec.tools}
+        plans = {p.id: p for p in spec.plans}
+
+        # Single pass over all calendars: per-channel buckets and campaign users
+        by_channel: Dict[str, List[Tuple[str, ContentCalendarEntry]]] = defaultdict(list)
+        campaigns_by_channel: Dict[str, List[str]] = defaultdict(list)
+        for campaign in spec.campaigns:
+            for channel_id in campaign.channels:
+                campaigns_by_channel[channel_id].append(campaign.id)
+            for entry in campaign.content_calendar or ():
+                by_channel[entry.channel_id].append((campaign.id, entry))
+
+        for campaign in spec.campaigns:
+            calendar = sorted(campaign.content_calendar or (), key=lambda e: e.date)
+            yield (
+                f"config/campaigns/{campaign.id}.yaml",
+                self.TEMPLATES["campaign"],
+                {
+                    **base,
+                    "campaign": campaign,
+                    "plan": plans.get(campaign.plan_id),
+                    "channels": channels,
+                    "calendar": calendar,
+                },
+            )
+
+        for channel in spec.channels:
+            yield (
+                f"config/channels/{channel.id}.yaml",
+                self.TEMPLATES["channel"],
+                {
+                    **base,
+                    "channel": channel,
+                    "tool": tools.get(channel.tool_id) if channel.tool_id else None,
+                    "campaign_ids": campaigns_by_channel.get(channel.id, []),
+                },
+            )
+
+        for channel in spec.channels:
+            entries = sorted(
+                by_channel.get(channel.id, []),
+                key=lambda item: (item[1].date, item[0]),
+            )
+            yield (
+                f"config/calendars/{channel.id}.yaml",
+                self.TEMPLATES["calendar"],
+                {**base, "channel": channel, "entries": entries},
+            )
+
+        for template in spec.content_templates:
+            yield (
+                f"templates/{template.id}.yaml",
+                self.TEMPLATES["template"],
+                {**base, "template": template},
+            )
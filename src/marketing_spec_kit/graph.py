@@ -0,0 +1,234 @@
+"""Entity reference graph for a MarketingSpec
+
+Nodes are entities keyed by (kind, id); an edge A → B means "A depends on
+B" (A references B, so changing or removing B affects A):
+
+- campaign → plan       Campaign.plan_id, MarketingPlan.campaign_ids
+- campaign → product    Campaign.product_ids
+- campaign → channel    Campaign.channels, content_calendar[].channel_id
+- channel → tool        Channel.tool_id, Tool.channel_ids
+- milestone → campaign  Milestone.campaign_ids
+- milestone → product   Milestone.product_ids
+- analytics → campaign | plan   Analytics.entity_id
+
+Fields that list the inverse side of a relation (MarketingPlan.campaign_ids,
+Tool.channel_ids) are normalised onto the same edge as their counterpart,
+so declaring a relation on both sides does not create a cycle. Every edge
+points down the same layering of kinds (analytics and milestones →
+campaigns → plans, products and channels → tools), so the graph is acyclic
+by construction and needs no cycle check.
+
+The graph is built once in O(V + E) with integer node ids and adjacency
+lists (forward and reverse); orphan detection is a single in-degree pass.
+"""
+
+import hashlib
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from marketing_spec_kit.models import AnalyticsType, MarketingSpec
+
+NodeKey = Tuple[str, str]  # (kind, id)
+
+# Kinds that exist to be used by other entities → orphan when unreferenced
+ORPHAN_KINDS = ("plan", "product", "channel", "tool")
+
+
+class Edge(NamedTuple):
+    """Dependency edge with the field that declared it"""
+
+    source: NodeKey
+    target: NodeKey
+    field: str
+
+
+class SpecGraph:
+    """Dependency graph over all entities of a spec
+
+    Example:
+        >>> graph = SpecGraph.from_spec(spec)
+        >>> graph.orphans()
+        [('channel', 'podcast')]
+        >>> graph.dependents(("channel", "twitter"))
+        [('campaign', 'launch-awareness-oct')]
+    """
+
+    def __init__(self):
+        self.keys: List[NodeKey] = []
+        self.defined: List[bool] = []
+        self._ids: Dict[NodeKey, int] = {}
+        self._out: List[List[int]] = []
+        self._in: List[List[int]] = []
+        self._fields: Dict[Tuple[int, int], List[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_spec(cls, spec: MarketingSpec) -> "SpecGraph":
+        """Build the dependency graph of a specification (O(V + E))"""
+        graph = cls()
+        for plan in spec.plans:
+            graph.add_node(("plan", plan.id))
+        for product in spec.products:
+            graph.add_node(("product", product.id))
+        for campaign in spec.campaigns:
+            graph.add_node(("campaign", campaign.id))
+        for channel in spec.channels:
+            graph.add_node(("channel", channel.id))
+        for tool in spec.tools:
+            graph.add_node(("tool", tool.id))
+        for template in spec.content_templates:
+            graph.add_node(("content_template", template.id))
+        for milestone in spec.milestones:
+            graph.add_node(("milestone", milestone.id))
+        for analytics in spec.analytics:
+            graph.add_node(("analytics", analytics.id))
+
+        for plan in spec.plans:
+            for cid in plan.campaign_ids or ():
+                graph.add_edge(("campaign", cid), ("plan", plan.id), "plans.campaign_ids")
+
+        for campaign in spec.campaigns:
+            node = ("campaign", campaign.id)
+            graph.add_edge(node, ("plan", campaign.plan_id), "plan_id")
+            for pid in campaign.product_ids or ():
+                graph.add_edge(node, ("product", pid), "product_ids")
+            for ch_id in campaign.channels:
+                graph.add_edge(node, ("channel", ch_id), "channels")
+            for entry in campaign.content_calendar or ():
+                graph.add_edge(node, ("channel", entry.channel_id), "content_calendar.channel_id")
+
+        for channel in spec.channels:
+            if channel.tool_id:
+                graph.add_edge(("channel", channel.id), ("tool", channel.tool_id), "tool_id")
+
+        for tool in spec.tools:
+            for ch_id in tool.channel_ids or ():
+                graph.add_edge(("channel", ch_id), ("tool", tool.id), "tools.channel_ids")
+
+        for milestone in spec.milestones:
+            node = ("milestone", milestone.id)
+            for cid in milestone.campaign_ids or ():
+                graph.add_edge(node, ("campaign", cid), "campaign_ids")
+            for pid in milestone.product_ids or ():
+                graph.add_edge(node, ("product", pid), "product_ids")
+
+        for analytics in spec.analytics:
+            kind = "campaign" if analytics.type == AnalyticsType.CAMPAIGN else "plan"
+            graph.add_edge(("analytics", analytics.id), (kind, analytics.entity_id), "entity_id")
+
+        return graph
+
+    @staticmethod
+    def reference_digest(spec: MarketingSpec) -> str:
+        """Digest of everything from_spec() reads (entity ids and references)
+
+        Two specs with the same digest have the same graph, so graph-level
+        results can be reused without building it.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for collection in ("plans", "products", "channels", "tools", "content_templates"):
+            digest.update(repr([entity.id for entity in getattr(spec, collection)]).encode("utf-8"))
+        digest.update(repr([(plan.id, plan.campaign_ids) for plan in spec.plans]).encode("utf-8"))
+        for campaign in spec.campaigns:
+            digest.update(repr((
+                campaign.id,
+                campaign.plan_id,
+                campaign.product_ids,
+                campaign.channels,
+                [entry.channel_id for entry in campaign.content_calendar or ()],
+            )).encode("utf-8"))
+        digest.update(repr([(channel.id, channel.tool_id) for channel in spec.channels]).encode("utf-8"))
+        digest.update(repr([(tool.id, tool.channel_ids) for tool in spec.tools]).encode("utf-8"))
+        digest.update(repr([
+            (milestone.id, milestone.campaign_ids, milestone.product_ids) for milestone in spec.milestones
+        ]).encode("utf-8"))
+        for analytics in spec.analytics:
+            digest.update(repr((analytics.id, analytics.type == AnalyticsType.CAMPAIGN, analytics.entity_id)).encode("utf-8"))
+        return digest.hexdigest()
+
+    def add_node(self, key: NodeKey, defined: bool = True) -> int:
+        """Add (or look up) a node; returns its integer id"""
+        idx = self._ids.get(key)
+        if idx is not None:
+            if defined:
+                self.defined[idx] = True
+            return idx
+        idx = len(self.keys)
+        self._ids[key] = idx
+        self.keys.append(key)
+        self.defined.append(defined)
+        self._out.append([])
+        self._in.append([])
+        return idx
+
+    def add_edge(self, source: NodeKey, target: NodeKey, field: str):
+        """Add a dependency edge (targets not yet defined become dangling nodes)"""
+        src = self.add_node(source, defined=False)
+        dst = self.add_node(target, defined=False)
+        fields = self._fields.get((src, dst))
+        if fields is None:
+            self._fields[(src, dst)] = [field]
+            self._out[src].append(dst)
+            self._in[dst].append(src)
+        elif field not in fields:
+            fields.append(field)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: NodeKey) -> bool:
+        return key in self._ids
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._fields)
+
+    def node_id(self, key: NodeKey) -> Optional[int]:
+        """Integer id of a node (for adjacency access), or None"""
+        return self._ids.get(key)
+
+    def successors(self, key: NodeKey) -> List[NodeKey]:
+        """Entities this entity depends on"""
+        idx = self._ids.get(key)
+        return [] if idx is None else [self.keys[i] for i in self._out[idx]]
+
+    def dependents(self, key: NodeKey) -> List[NodeKey]:
+        """Entities that depend directly on this entity"""
+        idx = self._ids.get(key)
+        return [] if idx is None else [self.keys[i] for i in self._in[idx]]
+
+    def reverse_adjacency(self) -> List[List[int]]:
+        """Precomputed dependents per node id (shared, do not mutate)"""
+        return self._in
+
+    def edges(self) -> Iterator[Edge]:
+        """All edges with their declaring fields"""
+        for (src, dst), fields in self._fields.items():
+            for field in fields:
+                yield Edge(self.keys[src], self.keys[dst], field)
+
+    def edge_fields(self, source: NodeKey, target: NodeKey) -> List[str]:
+        """Fields that declared the edge source → target"""
+        src, dst = self._ids.get(source), self._ids.get(target)
+        if src is None or dst is None:
+            return []
+        return list(self._fields.get((src, dst), ()))
+
+    def dangling(self) -> List[Edge]:
+        """Edges pointing at entities that are not defined in the spec"""
+        return [edge for edge in self.edges() if not self.defined[self._ids[edge.target]]]
+
+    def orphans(self, kinds: Tuple[str, ...] = ORPHAN_KINDS) -> List[NodeKey]:
+        """Defined entities of the given kinds that nothing depends on"""
+        wanted: Set[str] = set(kinds)
+        return [
+            key
+            for idx, key in enumerate(self.keys)
+            if self.defined[idx] and key[0] in wanted and not self._in[idx]
+        ]
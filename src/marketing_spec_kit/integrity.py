@@ -0,0 +1,201 @@
+"""Consistency of Analytics.vs_target comparisons
+
+Each KPIComparison stores target, actual, achievement and status
+independently. This pass recomputes them for every comparison of every
+report at once and reports two kinds of drift:
+
+- ANLY-02: achievement differs from actual / target * 100 by more than
+  the tolerance (percentage points)
+- ANLY-03: status does not match the achievement bucket
+  (ACHIEVEMENT_STATUSES, see rollup). 'on_track' and 'below_target' are
+  pace statuses: reports of unfinished periods are judged by pace, not by
+  total, so each is also accepted one bucket below its own ('on_track' at
+  50-80%, 'below_target' under 50%). A pace status further from the
+  achievement is stale and reported
+
+The check runs over flat columns (row offsets, KPI name ids, target,
+actual, achievement and status ids), built from spec.analytics or read
+directly from a compiled snapshot, so the full analytics history is
+checked in one tight loop; the report of a finding is only looked up
+(bisect over the row offsets) when there is one.
+
+Example:
+    >>> report = check_kpis(spec)
+    >>> [(f.code, f.report_id, f.kpi) for f in report.findings]
+    [('ANLY-02', 'analytics-oct-awareness', 'signups')]
+    >>> check_kpi_columns(snapshot_kpi_columns(SpecSnapshot("history.mspec")))
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Sequence
+
+from pydantic import BaseModel, Field
+
+from marketing_spec_kit.models import MarketingSpec
+from marketing_spec_kit.rollup import kpi_status
+
+KPI_STATUSES = ("exceeds", "meets", "on_track", "below_target", "far_below")
+# Pace status → achievement bucket it is also accepted for
+PACE_ALLOWANCE = {"on_track": "below_target", "below_target": "far_below"}
+
+# Allowed |achievement - actual / target * 100| in percentage points
+DEFAULT_TOLERANCE = 1.0
+
+
+class KPIFinding(BaseModel):
+    """Comparison whose stored numbers or status disagree"""
+
+    code: str = Field(..., description="ANLY-02 (achievement) or ANLY-03 (status)")
+    report_id: str = Field(..., description="Analytics report id")
+    kpi: str = Field(..., description="Key in vs_target")
+    target: float
+    actual: float
+    achievement: float = Field(..., description="Stored achievement")
+    expected_achievement: float = Field(..., description="actual / target * 100")
+    status: str = Field(..., description="Stored status")
+    expected_status: str = Field(..., description="Status bucket of the expected achievement")
+
+
+class KPIIntegrityReport(BaseModel):
+    """Result of checking all vs_target comparisons"""
+
+    comparisons: int = Field(0, description="Comparisons checked (zero targets are not)")
+    findings: List[KPIFinding] = Field(default_factory=list)
+
+    @property
+    def drift_count(self) -> int:
+        return sum(1 for f in self.findings if f.code == "ANLY-02")
+
+    @property
+    def status_count(self) -> int:
+        return sum(1 for f in self.findings if f.code == "ANLY-03")
+
+
+class KPIColumns(NamedTuple):
+    """vs_target of all reports as columns (CSR by report row)"""
+
+    report_ids: Sequence[str]
+    names: Sequence[str]  # KPI names and statuses, indexed by keys / status
+    rows: Sequence[int]
+    keys: Sequence[int]
+    target: Sequence[float]
+    actual: Sequence[float]
+    achievement: Sequence[float]
+    status: Sequence[int]
+
+
+def kpi_columns(spec: MarketingSpec) -> KPIColumns:
+    """Columns of spec.analytics vs_target comparisons"""
+    names: List[str] = []
+    ids: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        key = ids.get(text)
+        if key is None:
+            key = ids[text] = len(names)
+            names.append(text)
+        return key
+
+    rows, keys, target, actual, achievement, status = [0], [], [], [], [], []
+    for report in spec.analytics:
+        for name, kpi in report.vs_target.items():
+            keys.append(intern(name))
+            target.append(kpi.target)
+            actual.append(kpi.actual)
+            achievement.append(kpi.achievement)
+            status.append(intern(kpi.status))
+        rows.append(len(keys))
+    report_ids = [report.id for report in spec.analytics]
+    return KPIColumns(report_ids, names, rows, keys, target, actual, achievement, status)
+
+
+def snapshot_kpi_columns(snapshot) -> KPIColumns:
+    """Columns of a compiled snapshot (views over the mapped file)"""
+    kpis = snapshot.kpis()
+    strings = snapshot.strings()
+    return KPIColumns(
+        snapshot.report_ids(),
+        strings,
+        kpis.rows,
+        kpis.keys,
+        kpis.target,
+        kpis.actual,
+        kpis.values,
+        kpis.status,
+    )
+
+
+def check_kpis(spec: MarketingSpec, tolerance: float = DEFAULT_TOLERANCE) -> KPIIntegrityReport:
+    """Check every vs_target comparison of a spec"""
+    return check_kpi_columns(kpi_columns(spec), tolerance)
+
+
+def check_kpi_columns(columns: KPIColumns, tolerance: float = DEFAULT_TOLERANCE) -> KPIIntegrityReport:
+    """Check comparison columns for achievement drift and status mismatches
+
+    Args:
+        columns: KPIColumns (kpi_columns() or snapshot_kpi_columns())
+        tolerance: Allowed achievement drift in percentage points
+
+    Returns:
+        KPIIntegrityReport; comparisons with a zero target are not checked
+    """
+    names = columns.names
+    # Status name per status id, resolved once
+    status_names: Dict[int, str] = {}
+    findings = []
+    unchecked = 0
+
+    target, actual, achievement, status = columns.target, columns.actual, columns.achievement, columns.status
+    for i, (t, a, stored, status_id) in enumerate(zip(target, actual, achievement, status)):
+        if t == 0:
+            unchecked += 1
+            continue
+        expected = a / t * 100
+        drift = abs(stored - expected) > tolerance
+
+        name = status_names.get(status_id)
+        if name is None:
+            name = status_names[status_id] = names[status_id]
+        bucket = kpi_status(expected)
+        status_ok = name == bucket or PACE_ALLOWANCE.get(name) == bucket
+
+        if drift or not status_ok:
+            finding = _finding(columns, i, round(expected, 1), name, bucket)
+            if drift:
+                findings.append(finding.model_copy(update={"code": "ANLY-02"}))
+            if not status_ok:
+                findings.append(finding)
+
+    return KPIIntegrityReport(comparisons=len(columns.keys) - unchecked, findings=findings)
+
+
+def _finding(columns: KPIColumns, i: int, expected: float, status: str, bucket: str) -> KPIFinding:
+    """Finding for comparison i (its report is found by bisecting the row offsets)"""
+    row = bisect_right(columns.rows, i) - 1
+    return KPIFinding(
+        code="ANLY-03",
+        report_id=columns.report_ids[row],
+        kpi=columns.names[columns.keys[i]],
+        target=columns.target[i],
+        actual=columns.actual[i],
+        achievement=columns.achievement[i],
+        expected_achievement=expected,
+        status=status,
+        expected_status=bucket,
+    )
+
+
+def describe(finding: KPIFinding) -> str:
+    """Human-readable message of a finding"""
+    if finding.code == "ANLY-02":
+        return (
+            f"achievement {finding.achievement:g}% does not match "
+            f"actual/target ({finding.actual:g}/{finding.target:g} = {finding.expected_achievement:g}%)"
+        )
+    if finding.status not in KPI_STATUSES:
+        return f"unknown status '{finding.status}' (use {', '.join(KPI_STATUSES)})"
+    return (
+        f"status '{finding.status}' does not match "
+        f"{finding.expected_achievement:g}% achievement (expected '{finding.expected_status}')"
+    )
@@ -0,0 +1,1077 @@
+"""Language server for marketing specs (LSP over stdio)
+
+`marketing_spec_kit lsp` speaks the Language Server Protocol on stdin and
+stdout (JSON-RPC with Content-Length framing; no network, no extra
+dependency). Editors get diagnostics while typing and id completion.
+
+Documents are kept in memory as segments: one per top-level key and one
+per item of a top-level collection ('- id: ...'), found with the same line
+scan as reports.entity_lines(). Work per edit is proportional to the edit:
+
+- Only the segments an edit touches (plus the one before, whose end may
+  move) are split again and re-parsed (YAML loader, `$ref` resolution via
+  MarketingSpecParser, Pydantic model of the entity); every other entity
+  keeps its model and its rule outcome
+- Entity rules re-run for the edited entities and for the entities whose
+  dependencies changed (MarketingSpecValidator.entity_dependencies), found
+  through a reverse index of references: an id they reference appeared or
+  disappeared, their plan's period or budget position moved
+- The spec-wide rules (analytics integrity, entity graph) re-run once
+  typing pauses (SPEC_RULES_DELAY), and only after edits that changed ids,
+  references or analytics
+- Saving a file re-parses the segments with `$ref` of open documents (the
+  saved file may be one of their targets)
+- Diagnostics point at the entity's line, or at the line of the offending
+  field; at most MAX_DIAGNOSTICS are published per document (errors, then
+  warnings, then info; entities edited last first)
+- Completion offers the ids of the referenced collection for reference
+  fields (plan_id, channels, tool_id, product_ids, ...)
+
+JSON documents are kept as a single segment (re-parsed as a whole).
+Documents without a project get structural diagnostics only (workspace
+fragments: validate the directory with 'marketing_spec_kit validate').
+
+Example:
+    >>> document = SpecDocument("file:///specs/spec.yaml", text)
+    >>> document.refresh()
+    True
+    >>> document.change([{"range": {...}, "text": "budget: 0"}])
+    >>> document.refresh()
+    True
+    >>> document.diagnostics()[0]["message"]
+    "Invalid value for 'budget': Input should be greater than 0"
+"""
+
+import json
+import queue
+import re
+import sys
+import threading
+from bisect import bisect_right
+from collections import Counter
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+import yaml
+from pydantic import ValidationError as PydanticValidationError
+
+from marketing_spec_kit import __version__
+from marketing_spec_kit.exceptions import MarketingSpecError
+from marketing_spec_kit.models import AnalyticsType, MarketingSpec, Project
+from marketing_spec_kit.parser import MarketingSpecParser
+from marketing_spec_kit.validator import MarketingSpecValidator, ValidationIssue
+from marketing_spec_kit.workspace import ENTITY_TYPES
+
+SERVER_NAME = "marketing-spec-kit"
+
+# Diagnostics published per document (the rest are summarised in one note)
+MAX_DIAGNOSTICS = 1000
+# Ids offered per completion request (the list is marked incomplete)
+MAX_COMPLETIONS = 200
+# Seconds without messages before the spec-wide rules re-run
+SPEC_RULES_DELAY = 0.4
+
+SEVERITY = {"error": 1, "warning": 2, "info": 3}
+# LSP CompletionItemKind.Reference
+COMPLETION_KIND = 18
+
+# Reference field → collections whose ids it takes
+REFERENCE_FIELDS = {
+    "plan_id": ("plans",),
+    "channels": ("channels",),
+    "channel_id": ("channels",),
+    "channel_ids": ("channels",),
+    "tool_id": ("tools",),
+    "product_ids": ("products",),
+    "campaign_ids": ("campaigns",),
+    "entity_id": ("campaigns", "plans"),
+}
+
+# Collection → entity model
+MODELS = {
+    name: field.annotation.__args__[0]
+    for name, field in MarketingSpec.model_fields.items()
+    if name != "project"
+}
+COLLECTIONS = {entity_type: collection for collection, entity_type in ENTITY_TYPES.items()}
+COLLECTIONS["project"] = "project"
+
+# JSON-RPC error codes
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+_KEY = re.compile(r"""\s*(?:-\s+)*["']?([\w$.-]+)["']?\s*:(?:\s|$)""")
+_KEY_ONLY = re.compile(r"""\s*(?:-\s+)?["']?([\w-]+)["']?\s*:\s*(?:#.*)?$""")
+_VALUE_FIELD = re.compile(r"""\s*(?:-\s+)?["']?([\w-]+)["']?\s*:\s""")
+_ID_VALUE = re.compile(r"""["']?\bid["']?\s*:\s*["']?([^"',}\]\s#]+)""")
+_ID_PREFIX = re.compile(r"""[^\s\[\],'"]*$""")
+_FIELD_PART = re.compile(r"[A-Za-z_][\w-]*")
+_LOCAL_REF = re.compile(r"""\$ref["']?\s*:\s*["']?#""")
+
+
+class Segment:
+    """Lines of one top-level key or collection item, and what they parse to"""
+
+    __slots__ = ("lines", "section", "indent", "start", "entities", "problems", "id_lines")
+
+    def __init__(self, section: Optional[str], indent: Optional[int], lines: List[str]):
+        self.lines = lines
+        self.section = section  # Collection the segment belongs to (None outside collections)
+        self.indent = indent  # Item indentation (None for top-level keys)
+        self.start: Optional[int] = 0  # First line in the document (None once removed)
+        self.entities: Optional[List["EntityState"]] = None  # None until parsed
+        self.problems: List[Tuple[int, ValidationIssue]] = []  # (line offset, structural issue)
+        self.id_lines: Optional[Dict[str, int]] = None
+
+    def same(self, other: "Segment") -> bool:
+        return self.indent == other.indent and self.section == other.section and self.lines == other.lines
+
+
+class EntityState:
+    """Parsed entity of a segment with its last rule outcome"""
+
+    __slots__ = ("collection", "model", "segment", "deps", "issues", "field_lines")
+
+    def __init__(self, collection: str, model: Any, segment: Segment):
+        self.collection = collection
+        self.model = model
+        self.segment = segment
+        self.deps: Optional[tuple] = None
+        self.issues: List[ValidationIssue] = []
+        self.field_lines: Dict[str, int] = {}  # Issue field → line offset in the segment
+
+    @property
+    def id(self) -> str:
+        return "" if self.collection == "project" else self.model.id
+
+
+def split_segments(
+    lines: List[str],
+    section: Optional[str] = None,
+    indent: Optional[int] = None,
+    whole: bool = False,
+) -> List[Segment]:
+    """Cut document lines into segments
+
+    Args:
+        lines: Document lines (without line breaks)
+        section, indent: Scan state before the first line (collection and
+            item indentation of the segment before)
+        whole: Keep all lines in one segment (JSON documents)
+    """
+    if whole:
+        return [Segment(None, None, list(lines))]
+    segments: List[Segment] = []
+    current: Optional[Segment] = None
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped and stripped[0] != "#":
+            depth = len(line) - len(stripped)
+            is_item = stripped[0] == "-" and stripped[1:2] in ("", " ")
+            if depth == 0 and not is_item:
+                key = stripped.split(":", 1)[0].strip().strip("'\"")
+                section = key if key in ENTITY_TYPES else None
+                indent = None
+                current = Segment(section, None, [line])
+                segments.append(current)
+                continue
+            if section is not None and is_item:
+                if indent is None:
+                    indent = depth
+                if depth == indent:
+                    current = Segment(section, indent, [line])
+                    segments.append(current)
+                    continue
+        if current is None:
+            current = Segment(section, indent, [])
+            segments.append(current)
+        current.lines.append(line)
+    return segments
+
+
+def _references(collection: str, entity) -> List[Tuple[str, str]]:
+    """(collection, id) of every entity this entity references
+
+    Covers what MarketingSpecValidator.entity_dependencies() and
+    SpecGraph.from_spec() read from other entities.
+    """
+    if collection == "campaigns":
+        refs = [("plans", entity.plan_id)]
+        refs.extend(("products", pid) for pid in entity.product_ids or ())
+        refs.extend(("channels", ch_id) for ch_id in entity.channels)
+        refs.extend(("channels", entry.channel_id) for entry in entity.content_calendar or ())
+        return refs
+    if collection == "plans":
+        return [("campaigns", cid) for cid in entity.campaign_ids or ()]
+    if collection == "channels":
+        return [("tools", entity.tool_id)] if entity.tool_id else []
+    if collection == "tools":
+        return [("channels", ch_id) for ch_id in entity.channel_ids or ()]
+    if collection == "milestones":
+        return [("campaigns", cid) for cid in entity.campaign_ids or ()] + [
+            ("products", pid) for pid in entity.product_ids or ()
+        ]
+    if collection == "analytics":
+        pool = "campaigns" if entity.type == AnalyticsType.CAMPAIGN else "plans"
+        return [(pool, entity.entity_id)]
+    return []
+
+
+def _watched(collection: str, entity) -> List[Tuple[str, str]]:
+    """Reverse index keys of an entity: its references plus id-list hints
+
+    A missing plan or campaign reference is reported with the list of known
+    ids ('Use one of: ...'), so those entities also watch (pool, '*').
+    """
+    refs = _references(collection, entity)
+    if collection == "campaigns":
+        refs.append(("plans", "*"))
+    elif collection == "analytics":
+        refs.append((refs[0][0], "*"))
+    return refs
+
+
+def _utf16_len(text: str) -> int:
+    """Length of text in UTF-16 code units (LSP character offsets)"""
+    return len(text) if text.isascii() else len(text.encode("utf-16-le")) // 2
+
+
+def _index(text: str, character: int) -> int:
+    """String index of a UTF-16 character offset"""
+    if text.isascii():
+        return min(character, len(text))
+    units = 0
+    for index, char in enumerate(text):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(text)
+
+
+def _key_of(line: str) -> Optional[str]:
+    match = _KEY.match(line)
+    return match.group(1) if match else None
+
+
+def _field_line(lines: List[str], field: str, base: int = 0) -> int:
+    """Offset of the line declaring a (dotted) field, searched from base"""
+    found = base
+    for part in _FIELD_PART.findall(field):
+        for offset in range(found, len(lines)):
+            if _key_of(lines[offset]) == part:
+                found = offset
+                break
+        else:
+            break
+    return found
+
+
+def _first_in_document(entities: List[EntityState]) -> EntityState:
+    """Entity of a duplicated id that comes first in the document
+
+    Lists in the id index are in registration order, which depends on the
+    edit history; document order gives the same answer as a fresh parse.
+    """
+    if len(entities) == 1:
+        return entities[0]
+    return min(entities, key=lambda entity: (entity.segment.start, entity.segment.entities.index(entity)))
+
+
+def _uri_path(uri: str) -> Optional[Path]:
+    """Local path of a file:// URI (None for other schemes)"""
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return None
+    return Path(url2pathname(unquote(parsed.path)))
+
+
+class SpecDocument:
+    """In-memory specification document with incremental parsing and validation
+
+    change() applies edits to the segments; refresh() re-parses and
+    re-validates what the edits touched. diagnostics() and complete()
+    answer from the in-memory state.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        text: str,
+        version: Optional[int] = None,
+        parser: Optional[MarketingSpecParser] = None,
+    ):
+        self.uri = uri
+        self.version = version
+        self.path = _uri_path(uri)
+        self.parser = parser or MarketingSpecParser()
+        self.validator = MarketingSpecValidator()
+        self.segments: List[Segment] = []
+        self.spec_rules_pending = False
+        self._starts: List[int] = []
+        self._whole = False
+        self._added: List[Segment] = []
+        self._removed: List[Segment] = []
+        self._recent: List[Segment] = []
+        self._full = True
+        self._indexed = False
+        self._day = date.today()
+        # collection → id → entities ('project' → '' → projects)
+        self._ids: Dict[str, Dict[str, List[EntityState]]] = {c: {} for c in COLLECTIONS.values()}
+        self._referrers: Dict[Tuple[str, str], Set[EntityState]] = {}
+        self._spec_issues: List[ValidationIssue] = []
+        self._counts: Counter = Counter()  # Level → entity issues and problems
+        self._document_data: Optional[Tuple[int, Any]] = None
+        self._reset(text)
+
+    # ------------------------------------------------------------------
+    # Edits
+    # ------------------------------------------------------------------
+
+    @property
+    def text(self) -> str:
+        return "\n".join(line for segment in self.segments for line in segment.lines)
+
+    @property
+    def line_count(self) -> int:
+        last = self.segments[-1]
+        return last.start + len(last.lines)
+
+    def line(self, number: int) -> str:
+        """Text of a document line ('' past the end)"""
+        if number < 0 or number >= self.line_count:
+            return ""
+        segment = self.segments[bisect_right(self._starts, number) - 1]
+        return segment.lines[number - segment.start]
+
+    def change(self, changes: List[Dict[str, Any]], version: Optional[int] = None):
+        """Apply LSP content changes (ranged or full text), in order"""
+        for change in changes:
+            if "range" in change:
+                self._apply(change["range"], change["text"])
+            else:
+                self._reset(change["text"])
+        self.version = version
+
+    def _reset(self, text: str):
+        """Replace the whole text"""
+        for segment in self.segments:
+            self._drop(segment)
+        lines = _LINE_BREAK.split(text)
+        self._whole = text.lstrip()[:1] in ("{", "[")
+        self.segments = split_segments(lines, whole=self._whole)
+        self._starts = [0] * len(self.segments)
+        self._added.extend(self.segments)
+        self._renumber(0, len(self.segments), 0)
+        self._full = True
+
+    def reload_refs(self) -> bool:
+        """Queue the segments with `$ref` for re-parsing (a target file changed)
+
+        Returns:
+            True if a segment was queued
+        """
+        queued = False
+        for index, segment in enumerate(self.segments):
+            if segment.entities is None or not any("$ref" in line for line in segment.lines):
+                continue  # Not parsed yet, or nothing to resolve
+            fresh = Segment(segment.section, segment.indent, segment.lines)
+            fresh.start = segment.start
+            self._drop(segment)
+            self._added.append(fresh)
+            self.segments[index] = fresh
+            queued = True
+        return queued
+
+    def _position(self, position: Dict[str, int]) -> Tuple[int, str, int]:
+        """(line, line text, string index) of an LSP position, clamped to the document"""
+        number = position["line"]
+        if number >= self.line_count:
+            number = self.line_count - 1
+            text = self.line(number)
+            return number, text, len(text)
+        text = self.line(number)
+        return number, text, _index(text, position["character"])
+
+    def _apply(self, change_range: Dict[str, Any], new_text: str):
+        """Apply one ranged edit by re-splitting the segments it touches"""
+        start_line, start_text, start_index = self._position(change_range["start"])
+        end_line, end_text, end_index = self._position(change_range["end"])
+        # The segment before may absorb the first edited lines
+        first = max(bisect_right(self._starts, start_line) - 2, 0)
+        end = bisect_right(self._starts, end_line)
+        base = self.segments[first].start
+        region = [line for segment in self.segments[first:end] for line in segment.lines]
+        old_count = len(region)
+        edited = start_text[:start_index] + new_text + end_text[end_index:]
+        region[start_line - base:end_line - base + 1] = _LINE_BREAK.split(edited)
+
+        section, indent = self._state_before(first)
+        new = split_segments(region, section, indent, self._whole)
+        # A changed collection or item indentation re-classifies the following
+        # items, up to the next top-level key
+        last = new[-1] if new else None
+        after = (last.section, last.indent) if last else (section, indent)
+        stop = end
+        if after != (self.segments[end - 1].section, self.segments[end - 1].indent):
+            while stop < len(self.segments) and self.segments[stop].indent is not None:
+                stop += 1
+        if stop > end:
+            following = [line for segment in self.segments[end:stop] for line in segment.lines]
+            region.extend(following)
+            old_count += len(following)
+            end = stop
+            new = split_segments(region, section, indent, self._whole)
+        self._replace(first, end, new, base, len(region) - old_count)
+
+    def _state_before(self, index: int) -> Tuple[Optional[str], Optional[int]]:
+        if index == 0:
+            return None, None
+        previous = self.segments[index - 1]
+        return previous.section, previous.indent
+
+    def _replace(self, first: int, end: int, new: List[Segment], base: int, delta: int):
+        """Put new segments in place of segments[first:end], keeping unchanged ones"""
+        old = self.segments[first:end]
+        head = 0
+        while head < min(len(old), len(new)) and old[head].same(new[head]):
+            new[head] = old[head]
+            head += 1
+        tail = 0
+        while tail < min(len(old), len(new)) - head and old[-1 - tail].same(new[-1 - tail]):
+            new[-1 - tail] = old[-1 - tail]
+            tail += 1
+        for segment in old[head:len(old) - tail]:
+            self._drop(segment)
+        self._added.extend(new[head:len(new) - tail])
+
+        self.segments[first:end] = new
+        self._starts[first:end] = [0] * len(new)
+        self._renumber(first, len(self.segments) if delta else first + len(new), base)
+
+    def _renumber(self, first: int, stop: int, line: int):
+        """Recompute the start lines of segments[first:stop]"""
+        starts = self._starts
+        for index in range(first, stop):
+            segment = self.segments[index]
+            segment.start = starts[index] = line
+            line += len(segment.lines)
+
+    def _drop(self, segment: Segment):
+        """Forget a segment removed from the document"""
+        segment.start = None
+        if segment.entities is None:
+            self._added.remove(segment)
+        else:
+            self._removed.append(segment)
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+
+    def _parse(self, segment: Segment):
+        """Parse a segment into entities (and structural problems)"""
+        segment.entities, segment.problems, segment.id_lines = [], [], None
+        text = "\n".join(segment.lines)
+        if text.strip():
+            self._load(segment, text)
+        self._counts["error"] += len(segment.problems)
+
+    def _load(self, segment: Segment, text: str):
+        """Load the YAML of a segment and validate its entity models"""
+        try:
+            Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            data = yaml.load(text, Loader=Loader)
+            if "$ref" in text:
+                document = self._whole_document() if _LOCAL_REF.search(text) else None
+                data = self.parser.resolve_refs(data, self.path, document)
+        except yaml.YAMLError as e:
+            mark = getattr(e, "problem_mark", None)
+            problem = getattr(e, "problem", None) or str(e)
+            self._problem(segment, mark.line if mark else 0, "MKT-VAL-001", f"Invalid YAML syntax: {problem}",
+                          "Check YAML syntax, ensure proper indentation and no tabs")
+            return
+        except MarketingSpecError as e:
+            value = str(getattr(e, "value", "") or "")
+            offset = next((i for i, line in enumerate(segment.lines) if value and value in line), 0)
+            self._problem(segment, offset, e.code, e.message, e.fix)
+            return
+
+        if segment.indent is not None:
+            for item in data if isinstance(data, list) else [data]:
+                self._add_entity(segment, segment.section, item)
+        elif isinstance(data, dict):
+            for key, value in data.items():
+                if key == "project":
+                    self._add_entity(segment, "project", value)
+                elif key in MODELS and value is not None:
+                    if not isinstance(value, list):
+                        self._problem(segment, _field_line(segment.lines, key), "MKT-VAL-003",
+                                      f"Invalid value for '{key}': Input should be a valid list",
+                                      f"Check the value and type for '{key}'")
+                        continue
+                    for item in value:
+                        self._add_entity(segment, key, item)
+        elif data is not None:
+            self._problem(segment, 0, "MKT-VAL-001", f"Expected dict, got {type(data).__name__}",
+                          "Ensure YAML root is a mapping (key-value pairs)")
+
+    def _add_entity(self, segment: Segment, collection: str, item: Any):
+        """Validate the model of one entity of a segment"""
+        model = Project if collection == "project" else MODELS[collection]
+        try:
+            entity = model.model_validate(item)
+        except PydanticValidationError as e:
+            entity_id = item.get("id", "") if isinstance(item, dict) else ""
+            if collection == "project":
+                base = _field_line(segment.lines, "project")
+            else:
+                base = self._id_line(segment, str(entity_id)) if entity_id else 0
+            for error in e.errors():
+                path = ".".join(str(loc) for loc in error["loc"])
+                if error["type"] == "missing":
+                    code, message, fix = (
+                        "MKT-VAL-002",
+                        f"Missing required field: '{path}'",
+                        f"Add '{path}' field to your specification",
+                    )
+                else:
+                    code, message, fix = (
+                        "MKT-VAL-003",
+                        f"Invalid value for '{path}': {error['msg']}" if path else error["msg"],
+                        f"Check the value and type for '{path}'",
+                    )
+                self._problem(segment, _field_line(segment.lines, path, base), code, message, fix,
+                              ENTITY_TYPES.get(collection, collection), str(entity_id))
+            return
+        segment.entities.append(EntityState(collection, entity, segment))
+
+    @staticmethod
+    def _problem(
+        segment: Segment,
+        offset: int,
+        code: str,
+        message: str,
+        fix: str,
+        entity_type: str = "",
+        entity_id: str = "",
+    ):
+        segment.problems.append((offset, ValidationIssue(
+            code=code,
+            level="error",
+            entity_type=entity_type or ENTITY_TYPES.get(segment.section or "", "file"),
+            entity_id=entity_id,
+            message=message,
+            fix=fix,
+        )))
+
+    def _whole_document(self) -> Any:
+        """Data of the whole text, for '#/pointer' refs (loaded once per version)"""
+        if self._document_data is None or self._document_data[0] != self.version:
+            Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            self._document_data = (self.version, yaml.load(self.text, Loader=Loader))
+        return self._document_data[1]
+
+    @staticmethod
+    def _id_line(segment: Segment, entity_id: str) -> int:
+        """Offset of the 'id: <entity_id>' line of a segment"""
+        if segment.id_lines is None:
+            segment.id_lines = {}
+            for offset, line in enumerate(segment.lines):
+                for match in _ID_VALUE.finditer(line):
+                    segment.id_lines.setdefault(match.group(1), offset)
+        return segment.id_lines.get(entity_id, 0)
+
+    def _entity_line(self, entity: EntityState) -> int:
+        """Offset of an entity inside its segment"""
+        segment = entity.segment
+        if segment.indent is not None and len(segment.entities) == 1:
+            return 0
+        if entity.collection == "project":
+            return _field_line(segment.lines, "project")
+        return self._id_line(segment, entity.id)
+
+    # ------------------------------------------------------------------
+    # Validation
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> bool:
+        """Re-parse and re-validate what changed since the last refresh
+
+        Returns:
+            True if diagnostics may have changed
+        """
+        removed, added = self._removed, self._added
+        self._removed, self._added = [], []
+        full = self._full or self._day != date.today()
+        self._full = False
+        if not (removed or added or full):
+            return False
+        for segment in added:
+            self._parse(segment)
+        self._recent = [segment for segment in added if segment.entities or segment.problems] or self._recent
+
+        for segment in removed:
+            self._counts["error"] -= len(segment.problems)
+            for entity in segment.entities:
+                self._counts.subtract(issue.level for issue in entity.issues)
+        old = [entity for segment in removed for entity in segment.entities]
+        new = [entity for segment in added for entity in segment.entities]
+        keys = {(entity.collection, entity.id) for entity in old + new}
+        existed = {key: bool(self._ids[key[0]].get(key[1])) for key in keys}
+        for entity in old:
+            self._unregister(entity)
+        for entity in new:
+            self._register(entity)
+
+        # Keys whose change can alter other entities' dependencies
+        touched = {key for key in keys if bool(self._ids[key[0]].get(key[1])) != existed[key]}
+        for pool in ("plans", "campaigns"):
+            if any(collection == pool for collection, _ in touched):
+                touched.add((pool, "*"))
+        # A plan's period and budget are read by its campaigns; a campaign's
+        # plan and budget feed that plan's budget ledger
+        touched.update(("plans", entity.id) for entity in old + new if entity.collection == "plans")
+        old_budgets = Counter((e.model.plan_id, e.model.budget) for e in old if e.collection == "campaigns")
+        new_budgets = Counter((e.model.plan_id, e.model.budget) for e in new if e.collection == "campaigns")
+        touched.update(("plans", plan_id) for plan_id, _ in (old_budgets - new_budgets) + (new_budgets - old_budgets))
+
+        facts = Counter(
+            (entity.collection, entity.id, tuple(_references(entity.collection, entity.model)))
+            for entity in old
+        )
+        facts.subtract(
+            (entity.collection, entity.id, tuple(_references(entity.collection, entity.model)))
+            for entity in new
+        )
+        if full or any(facts.values()) or any(e.collection == "analytics" for e in old + new):
+            self.spec_rules_pending = True
+
+        project = self._project()
+        if project is None:
+            if self._indexed:
+                for entity in self._entities():
+                    self._counts.subtract(issue.level for issue in entity.issues)
+                    entity.deps, entity.issues = None, []
+            self._indexed = False
+            self._spec_issues = []
+            self.spec_rules_pending = False
+            return True
+
+        full = full or not self._indexed
+        # The entity rules read ids, plans and plan ledgers only: edits that
+        # touch none of them keep the index
+        if full or touched:
+            self.validator.index(self._spec(project))
+        self._indexed, self._day = True, date.today()
+        if full:
+            for entity in self._entities():
+                self._check(entity)
+            return True
+
+        for entity in new:
+            self._check(entity)
+        fresh = set(new)
+        for key in touched:
+            for entity in list(self._referrers.get(key, ())):
+                if entity in fresh or entity.collection == "project":
+                    continue
+                if self.validator.entity_dependencies(entity.collection, entity.model) != entity.deps:
+                    self._check(entity)
+                    fresh.add(entity)
+        return True
+
+    def run_spec_rules(self):
+        """Re-run the spec-wide rules (analytics integrity, entity graph)"""
+        self.spec_rules_pending = False
+        project = self._project()
+        if project is None or not self._indexed:
+            self._spec_issues = []
+            return
+        result = self.validator.validate_spec_rules(self._spec(project))
+        self._spec_issues = result.errors + result.warnings + result.info
+
+    def _check(self, entity: EntityState):
+        """Run the rules of one entity and remember what they depended on"""
+        if entity.collection == "project":
+            entity.deps = ()
+        else:
+            entity.deps = self.validator.entity_dependencies(entity.collection, entity.model)
+        result = self.validator.validate_entity(entity.collection, entity.model)
+        self._counts.subtract(issue.level for issue in entity.issues)
+        entity.issues = result.errors + result.warnings + result.info
+        self._counts.update(issue.level for issue in entity.issues)
+
+    def _register(self, entity: EntityState):
+        self._ids[entity.collection].setdefault(entity.id, []).append(entity)
+        if entity.collection != "project":
+            for key in _watched(entity.collection, entity.model):
+                self._referrers.setdefault(key, set()).add(entity)
+
+    def _unregister(self, entity: EntityState):
+        by_id = self._ids[entity.collection]
+        entities = by_id[entity.id]
+        entities.remove(entity)
+        if not entities:
+            del by_id[entity.id]
+        if entity.collection != "project":
+            for key in _watched(entity.collection, entity.model):
+                referrers = self._referrers.get(key)
+                if referrers is not None:
+                    referrers.discard(entity)
+                    if not referrers:
+                        del self._referrers[key]
+
+    def _project(self) -> Optional[EntityState]:
+        projects = self._ids["project"].get("")
+        return _first_in_document(projects) if projects else None
+
+    def _entities(self):
+        for segment in self.segments:
+            yield from segment.entities or ()
+
+    def _spec(self, project: EntityState) -> MarketingSpec:
+        """MarketingSpec of the current entities (models are already validated)"""
+        collections: Dict[str, List[Any]] = {collection: [] for collection in MODELS}
+        for segment in self.segments:
+            for entity in segment.entities or ():
+                if entity.collection != "project":
+                    collections[entity.collection].append(entity.model)
+        return MarketingSpec.model_construct(project=project.model, **collections)
+
+    # ------------------------------------------------------------------
+    # Answers
+    # ------------------------------------------------------------------
+
+    def diagnostics(self) -> List[Dict[str, Any]]:
+        """LSP diagnostics of the last refresh (at most MAX_DIAGNOSTICS)"""
+        recent = [segment for segment in self._recent if segment.start is not None]
+        items: List[Tuple[Segment, Optional[EntityState], Optional[int], ValidationIssue]] = []
+        for level in SEVERITY:
+            items.extend(islice(self._issues(level, recent), MAX_DIAGNOSTICS - len(items)))
+            if len(items) >= MAX_DIAGNOSTICS:
+                break
+        diagnostics = [self._diagnostic(*item) for item in items]
+
+        total = sum(self._counts.values()) + len(self._spec_issues)
+        if total > len(items):
+            diagnostics.append({
+                "range": {"start": {"line": 0, "character": 0}, "end": {"line": 0, "character": 0}},
+                "severity": SEVERITY["info"],
+                "source": SERVER_NAME,
+                "message": f"{total - len(items)} more issues not shown "
+                           "(run 'marketing_spec_kit validate' for the full report)",
+            })
+        return diagnostics
+
+    def _issues(
+        self, level: str, recent: List[Segment]
+    ) -> Iterator[Tuple[Segment, Optional[EntityState], Optional[int], ValidationIssue]]:
+        """Issues of one level: per segment (recent ones first), then the spec-wide ones"""
+        if self._counts[level] > 0:
+            seen = set(map(id, recent))
+            yield from self._segment_issues(level, recent)
+            yield from self._segment_issues(level, (s for s in self.segments if id(s) not in seen))
+        if self._indexed:
+            for issue in self._spec_issues:
+                if issue.level != level:
+                    continue
+                collection = COLLECTIONS.get(issue.entity_type)
+                entities = self._ids[collection].get(issue.entity_id if collection != "project" else "") if collection else None
+                if entities:
+                    entity = _first_in_document(entities)
+                    yield entity.segment, entity, None, issue
+        elif level == "info" and any(segment.entities for segment in self.segments):
+            yield self.segments[0], None, 0, ValidationIssue(
+                code="MKT-VAL-002",
+                level="info",
+                entity_type="project",
+                message="Missing required field: 'project' (only structural checks run)",
+                fix="Add the project, or validate the workspace directory with 'marketing_spec_kit validate'",
+            )
+
+    @staticmethod
+    def _segment_issues(
+        level: str, segments: Iterable[Segment]
+    ) -> Iterator[Tuple[Segment, Optional[EntityState], Optional[int], ValidationIssue]]:
+        for segment in segments:
+            if level == "error":
+                for offset, issue in segment.problems:
+                    yield segment, None, offset, issue
+            for entity in segment.entities or ():
+                for issue in entity.issues:
+                    if issue.level == level:
+                        yield segment, entity, None, issue
+
+    def _diagnostic(
+        self,
+        segment: Segment,
+        entity: Optional[EntityState],
+        offset: Optional[int],
+        issue: ValidationIssue,
+    ) -> Dict[str, Any]:
+        if offset is None:
+            offset = entity.field_lines.get(issue.field)
+            if offset is None:
+                offset = _field_line(segment.lines, issue.field, self._entity_line(entity))
+                entity.field_lines[issue.field] = offset
+        offset = min(offset, len(segment.lines) - 1)
+        text = segment.lines[offset]
+        line = segment.start + offset
+        return {
+            "range": {
+                "start": {"line": line, "character": len(text) - len(text.lstrip())},
+                "end": {"line": line, "character": _utf16_len(text)},
+            },
+            "severity": SEVERITY.get(issue.level, SEVERITY["info"]),
+            "code": issue.code,
+            "source": SERVER_NAME,
+            "message": f"{issue.message} (fix: {issue.fix})" if issue.fix else issue.message,
+        }
+
+    def complete(self, line: int, character: int) -> Dict[str, Any]:
+        """LSP completion list: ids for the reference field at a position"""
+        text = self.line(line)
+        before = text[:_index(text, character)]
+        match = _VALUE_FIELD.match(before)
+        field = match.group(1) if match else self._list_field(line, before)
+        collections = REFERENCE_FIELDS.get(field or "", ())
+        prefix = _ID_PREFIX.search(before).group()
+        matches = sorted(
+            (entity_id, collection)
+            for collection in collections
+            for entity_id in self._ids[collection]
+            if entity_id.startswith(prefix)
+        )
+        start = {"line": line, "character": _utf16_len(before) - _utf16_len(prefix)}
+        end = {"line": line, "character": _utf16_len(before)}
+        items = []
+        for entity_id, collection in matches[:MAX_COMPLETIONS]:
+            model = _first_in_document(self._ids[collection][entity_id]).model
+            name = getattr(model, "name", "")
+            items.append({
+                "label": entity_id,
+                "kind": COMPLETION_KIND,
+                "detail": f"{ENTITY_TYPES[collection]}: {name}" if name else ENTITY_TYPES[collection],
+                "textEdit": {"range": {"start": start, "end": end}, "newText": entity_id},
+            })
+        return {"isIncomplete": len(matches) > MAX_COMPLETIONS, "items": items}
+
+    def _list_field(self, line: int, before: str) -> Optional[str]:
+        """Key of the block list a '- ' item line belongs to"""
+        stripped = before.lstrip()
+        if not (stripped[:1] == "-" and stripped[1:2] in ("", " ")):
+            return None
+        indent = len(before) - len(stripped)
+        for number in range(line - 1, max(line - 200, -1), -1):
+            text = self.line(number)
+            content = text.lstrip()
+            if not content or content[0] == "#":
+                continue
+            depth = len(text) - len(content)
+            if depth > indent or (depth == indent and content[0] == "-"):
+                continue
+            match = _KEY_ONLY.match(text)
+            return match.group(1) if match else None
+        return None
+
+
+def _read_messages(stream: BinaryIO, inbox: "queue.Queue"):
+    """Reader thread: framed JSON-RPC messages → inbox (None at end of input)"""
+    try:
+        while True:
+            length = None
+            while True:
+                header = stream.readline()
+                if not header:
+                    return
+                header = header.strip()
+                if not header:
+                    break
+                name, _, value = header.decode("ascii", "replace").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value.strip())
+            if length is None:
+                continue
+            body = stream.read(length)
+            if len(body) < length:
+                return
+            try:
+                inbox.put(json.loads(body))
+            except ValueError:
+                continue
+    finally:
+        inbox.put(None)
+
+
+class LanguageServer:
+    """JSON-RPC loop of the language server
+
+    Messages are read on a background thread and handled in order on the
+    calling thread. Edits are applied as they arrive; documents are
+    re-validated and their diagnostics published once no message is
+    waiting, so a burst of keystrokes is validated once.
+
+    Example:
+        >>> LanguageServer(sys.stdin.buffer, sys.stdout.buffer).serve()
+        0
+    """
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO):
+        self.documents: Dict[str, SpecDocument] = {}
+        self.parser = MarketingSpecParser()
+        self._reader = reader
+        self._writer = writer
+        self._inbox: "queue.Queue" = queue.Queue()
+        self._stale: Set[str] = set()
+        self._shutdown = False
+        self._requests: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "initialize": self._initialize,
+            "shutdown": self._shutdown_request,
+            "textDocument/completion": self._completion,
+        }
+        self._notifications: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didClose": self._did_close,
+            "textDocument/didSave": self._did_save,
+        }
+
+    def serve(self) -> int:
+        """Handle messages until 'exit' or end of input
+
+        Returns:
+            Process exit code: 0 after a shutdown request, 1 otherwise
+        """
+        threading.Thread(target=_read_messages, args=(self._reader, self._inbox), daemon=True).start()
+        while True:
+            pending = any(document.spec_rules_pending for document in self.documents.values())
+            try:
+                message = self._inbox.get(timeout=SPEC_RULES_DELAY if pending else None)
+            except queue.Empty:
+                self._run_spec_rules()
+                continue
+            if message is None or message.get("method") == "exit":
+                break
+            self._handle(message)
+            if self._inbox.empty():
+                for uri in list(self._stale):
+                    self._publish(uri)
+        return 0 if self._shutdown else 1
+
+    def _handle(self, message: Dict[str, Any]):
+        method = message.get("method")
+        if method is None:
+            return  # Response to a server request (none are sent)
+        params = message.get("params") or {}
+        is_request = "id" in message
+        handler = (self._requests if is_request else self._notifications).get(method)
+        if handler is None:
+            if is_request:
+                self._error(message["id"], METHOD_NOT_FOUND, f"Unsupported method: {method}")
+            return
+        try:
+            result = handler(params)
+        except Exception as e:  # keep serving: report the failure to the client
+            self._log(f"{method} failed: {e}")
+            if is_request:
+                self._error(message["id"], INTERNAL_ERROR, str(e))
+            return
+        if is_request:
+            self._send({"jsonrpc": "2.0", "id": message["id"], "result": result})
+
+    def _send(self, message: Dict[str, Any]):
+        body = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._writer.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        self._writer.flush()
+
+    def _error(self, request_id: Union[int, str], code: int, message: str):
+        self._send({"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}})
+
+    def _log(self, message: str):
+        self._send({"jsonrpc": "2.0", "method": "window/logMessage", "params": {"type": 1, "message": message}})
+
+    def _publish(self, uri: str):
+        """Refresh a document and publish its diagnostics"""
+        self._stale.discard(uri)
+        document = self.documents.get(uri)
+        if document is None:
+            return
+        document.refresh()
+        self._send({
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": {"uri": uri, "version": document.version, "diagnostics": document.diagnostics()},
+        })
+
+    def _run_spec_rules(self):
+        for uri, document in list(self.documents.items()):
+            if document.spec_rules_pending:
+                document.refresh()
+                document.run_spec_rules()
+                self._publish(uri)
+
+    # ------------------------------------------------------------------
+    # Handlers
+    # ------------------------------------------------------------------
+
+    def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": 2, "save": {"includeText": False}},
+                "completionProvider": {"triggerCharacters": [" ", "[", ",", "-"]},
+            },
+            "serverInfo": {"name": SERVER_NAME, "version": __version__},
+        }
+
+    def _shutdown_request(self, params: Dict[str, Any]) -> None:
+        self._shutdown = True
+        return None
+
+    def _did_open(self, params: Dict[str, Any]):
+        item = params["textDocument"]
+        self.documents[item["uri"]] = SpecDocument(item["uri"], item["text"], item.get("version"), self.parser)
+        self._stale.add(item["uri"])
+
+    def _did_change(self, params: Dict[str, Any]):
+        item = params["textDocument"]
+        document = self.documents.get(item["uri"])
+        if document is not None:
+            document.change(params["contentChanges"], item.get("version"))
+            self._stale.add(item["uri"])
+
+    def _did_close(self, params: Dict[str, Any]):
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self._stale.discard(uri)
+        self._send({
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": {"uri": uri, "diagnostics": []},
+        })
+
+    def _did_save(self, params: Dict[str, Any]):
+        # Saved files may be `$ref` targets of open documents
+        self.parser.clear_ref_cache()
+        for uri, document in self.documents.items():
+            if document.reload_refs():
+                self._stale.add(uri)
+
+    def _completion(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        uri = params["textDocument"]["uri"]
+        document = self.documents.get(uri)
+        if document is None:
+            return {"isIncomplete": False, "items": []}
+        if uri in self._stale:
+            self._publish(uri)
+        position = params["position"]
+        return document.complete(position["line"], position["character"])
+
+
+def serve(reader: Optional[BinaryIO] = None, writer: Optional[BinaryIO] = None) -> int:
+    """Run the language server on stdin/stdout (or the given binary streams)"""
+    return LanguageServer(reader or sys.stdin.buffer, writer or sys.stdout.buffer).serve()
@@ -4,7 +4,21 @@ Supports:
 - YAML files (.yaml, .yml)
 - JSON files (.json)
 - Python dictionaries
-- String content (YAML/JSON)
+- String or bytes content (YAML/JSON)
+- File-like objects and streams (e.g. sys.stdin.buffer), see SpecSource
+- Multi-document YAML streams ('---' separated), parsed lazily one
+  document at a time with parse_documents()
+- `$ref` directives to shared fragments ("file.yaml", "file.yaml#/pointer",
+  "#/pointer"), resolved once per parser and checked for cycles (MKT-REF-002)
+- String interning: mapping keys and identifier-like values (ids, dates,
+  statuses, content types) loaded from YAML/JSON share one object per
+  distinct value, so the parsed spec does not hold thousands of copies
+- JSON fast path: JSON without `$ref` is validated straight from the raw
+  bytes with MarketingSpec.model_validate_json (no intermediate dict tree;
+  pydantic-core caches repeated short strings itself)
+- Optional JSON Schema pre-validation (prevalidate=True): the loaded data
+  is checked against the exported schema (see schema.py) before Pydantic,
+  reporting every structural problem at once
 
 v2.0.0 Changes:
 - Automatically parses 'plans' field (MarketingPlan entities)
@@ -15,14 +29,19 @@ Performance Target: Parse <100ms for typical specs (<1000 lines)
 """
 
 import json
+import re
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import yaml
 from pydantic import ValidationError as PydanticValidationError
 
-from marketing_spec_kit.exceptions import ParseError, ValidationError
+from marketing_spec_kit.exceptions import MarketingSpecError, ParseError, ValidationError
 from marketing_spec_kit.models import MarketingSpec
+from marketing_spec_kit.source import SourceLike, SpecSource
+
+# Strings worth interning: short, no whitespace (ids, dates, enum values)
+_INTERNABLE = re.compile(r"\S{1,64}").fullmatch
 
 
 class MarketingSpecParser:
@@ -33,17 +52,41 @@ class MarketingSpecParser:
         >>> spec = parser.parse("my-spec.yaml")  # From file
         >>> spec = parser.parse(yaml_string, format="yaml")  # From string
         >>> spec = parser.parse({"project": {...}}, format="dict")  # From dict
+    
+    Shared fragments:
+        target_audience:
+          - $ref: "shared/audiences.yaml#/enterprise"
+          - $ref: "shared/audiences.yaml#/startups"
+            priority: "medium"   # sibling keys override the fragment
     """
 
+    def __init__(self, intern_strings: bool = True, prevalidate: bool = False):
+        """
+        Args:
+            intern_strings: Share one string object per distinct key or
+                identifier-like value in loaded documents
+            prevalidate: Check loaded data against the JSON Schema first
+                (compiled once per process; slower than Pydantic alone)
+        """
+        self.intern_strings = intern_strings
+        self.prevalidate = prevalidate
+        self._source_path: Optional[Path] = None
+        # $ref memoisation: loaded files and resolved (file, pointer) targets
+        self._ref_documents: Dict[Path, Any] = {}
+        self._ref_values: Dict[Tuple[str, str], Any] = {}
+        self._root_document: Any = None
+        self._root_values: Dict[Tuple[str, str], Any] = {}
+
     def parse(
         self,
-        source: Union[str, Path, dict],
+        source: SourceLike,
         format: str = "auto",
     ) -> MarketingSpec:
         """Parse marketing specification from various sources
         
         Args:
-            source: File path (str/Path), string content, or dict
+            source: File path (str/Path), string or bytes content, file-like
+                object (e.g. sys.stdin.buffer), dict, or SpecSource
             format: "auto" (detect), "yaml", "json", or "dict"
         
         Returns:
@@ -56,10 +99,20 @@ class MarketingSpecParser:
         Performance:
             - Typical spec (<1000 lines): <100ms
             - Uses yaml.CSafeLoader when available (10x faster)
+            - JSON without `$ref` is validated directly from bytes
         """
         try:
+            spec_source = SpecSource.resolve(source, format)
+
+            # Fast path: JSON bytes → MarketingSpec in one pass
+            if spec_source.format == "json" and not self.prevalidate:
+                raw = spec_source.read()
+                if not _has_refs(raw):
+                    self._source_path = spec_source.path
+                    return self._parse_spec_json(raw)
+
             # Step 1: Load data from source → dict
-            data = self._load_data(source, format)
+            data = self._load_data(spec_source)
 
             # Step 2: Validate and parse dict → MarketingSpec (Pydantic validation)
             spec = self._parse_spec(data)
@@ -77,63 +130,114 @@ class MarketingSpecParser:
                 fix="Check file format and syntax",
             ) from e
 
+    def parse_documents(
+        self,
+        source: SourceLike,
+        format: str = "auto",
+    ) -> Iterator[Union[MarketingSpec, MarketingSpecError]]:
+        """Parse every document of a YAML stream ('---' separated), lazily
+
+        Documents are read incrementally with yaml.load_all, so a stream on
+        stdin is validated while the producer is still writing it. JSON and
+        dict sources are a single document. Empty documents are skipped.
+
+        Args:
+            source: Anything parse() accepts (e.g. SpecSource.stdin())
+            format: "auto" (detect), "yaml", "json", or "dict"
+
+        Yields:
+            MarketingSpec per document, or the ParseError/ValidationError of
+            a document that is not a valid spec (the stream continues)
+
+        Raises:
+            ParseError: On YAML syntax errors (the stream cannot continue
+                past them) or if the source cannot be read (MKT-VAL-001)
+        """
+        spec_source = SpecSource.resolve(source, format)
+        if spec_source.format != "yaml":
+            try:
+                yield self.parse(spec_source)
+            except MarketingSpecError as e:
+                yield e
+            return
+
+        Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with spec_source.open() as stream:
+            documents = yaml.load_all(stream, Loader=Loader)
+            while True:
+                try:
+                    data = next(documents)
+                except StopIteration:
+                    return
+                except yaml.YAMLError as e:
+                    line = e.problem_mark.line + 1 if getattr(e, "problem_mark", None) else None
+                    raise ParseError(
+                        code="MKT-VAL-001",
+                        message=f"Invalid YAML syntax in {spec_source.name}: "
+                        + (f"Line {line}: {e.problem}" if line else str(e)),
+                        fix="Check YAML syntax, ensure proper indentation and no tabs",
+                        line=line,
+                    ) from e
+
+                if data is None:
+                    continue
+                if not isinstance(data, dict):
+                    yield ParseError(
+                        code="MKT-VAL-001",
+                        message=f"Expected dict, got {type(data).__name__}",
+                        fix="Ensure each YAML document is a mapping (key-value pairs)",
+                    )
+                    continue
+
+                try:
+                    self._source_path = spec_source.path
+                    data = self._resolve_refs(data, spec_source.path)
+                    if self.intern_strings:
+                        data = self._intern(data, {})
+                    yield self._parse_spec(data)
+                except MarketingSpecError as e:
+                    yield e
+
     def _load_data(
         self,
-        source: Union[str, Path, dict],
-        format: str,
+        source: SourceLike,
+        format: str = "auto",
     ) -> dict:
-        """Load data from source into dictionary
+        """Load data from source into dictionary and resolve `$ref` directives
         
         Args:
-            source: File path, string content, or dict
+            source: Anything SpecSource.resolve() accepts
             format: Format hint ("auto", "yaml", "json", "dict")
         
         Returns:
-            dict: Parsed data
+            dict: Parsed data with all references inlined
         
         Raises:
             ParseError: If loading fails
+            ValidationError: If a reference is missing (MKT-REF-001) or
+                circular (MKT-REF-002)
         """
-        # If already dict, return directly
-        if isinstance(source, dict):
-            return source
-
-        # Detect format from file extension
-        if format == "auto":
-            if isinstance(source, (str, Path)):
-                path = Path(source)
-                if path.exists() and path.is_file():
-                    suffix = path.suffix.lower()
-                    if suffix in [".yaml", ".yml"]:
-                        format = "yaml"
-                    elif suffix == ".json":
-                        format = "json"
-                    else:
-                        # Default to YAML for unknown extensions
-                        format = "yaml"
-                else:
-                    # Assume string content is YAML
-                    format = "yaml"
-            else:
-                format = "yaml"
+        spec_source = SpecSource.resolve(source, format)
+        self._source_path = spec_source.path
+        content = spec_source.read()
 
-        # Load based on format
-        if format == "yaml":
-            return self._load_yaml(source)
-        elif format == "json":
-            return self._load_json(source)
+        if spec_source.format == "dict":
+            data = content
+        elif spec_source.format == "json":
+            data = self._load_json(content)
         else:
-            raise ParseError(
-                code="MKT-VAL-001",
-                message=f"Unsupported format: {format}",
-                fix="Use 'yaml', 'json', or 'dict' format",
-            )
+            data = self._load_yaml(content)
+
+        data = self._resolve_refs(data, self._source_path)
+        if self.intern_strings and spec_source.kind != "dict":
+            data = self._intern(data, {})
+        return data
 
-    def _load_yaml(self, source: Union[str, Path]) -> dict:
-        """Load YAML from file or string
+    def _load_yaml(self, content: Union[bytes, str]) -> dict:
+        """Load YAML content
         
         Args:
-            source: File path or YAML string
+            content: YAML bytes (encoding detected by the loader) or text
         
         Returns:
             dict: Parsed YAML
@@ -142,17 +246,9 @@ class MarketingSpecParser:
             ParseError: If YAML parsing fails (MKT-VAL-001)
         """
         try:
-            # Check if source is a file path
-            path = Path(source)
-            if path.exists() and path.is_file():
-                with open(path, "r", encoding="utf-8") as f:
-                    # Use CSafeLoader if available (C implementation, 10x faster)
-                    Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
-                    data = yaml.load(f, Loader=Loader)
-            else:
-                # Treat as YAML string
-                Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
-                data = yaml.load(str(source), Loader=Loader)
+            # Use CSafeLoader if available (C implementation, 10x faster)
+            Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            data = yaml.load(content, Loader=Loader)
 
             if not isinstance(data, dict):
                 raise ParseError(
@@ -170,18 +266,21 @@ class MarketingSpecParser:
                 line = e.problem_mark.line + 1
                 error_msg = f"Line {line}: {e.problem}"
 
+            fix = "Check YAML syntax, ensure proper indentation and no tabs"
+            if getattr(e, "problem", None) == "but found another document":
+                fix = "Validate multi-document streams with 'validate --stream' or StreamValidator"
             raise ParseError(
                 code="MKT-VAL-001",
                 message=f"Invalid YAML syntax: {error_msg}",
-                fix="Check YAML syntax, ensure proper indentation and no tabs",
+                fix=fix,
                 line=line,
             ) from e
 
-    def _load_json(self, source: Union[str, Path]) -> dict:
-        """Load JSON from file or string
+    def _load_json(self, content: Union[bytes, str]) -> dict:
+        """Load JSON content
         
         Args:
-            source: File path or JSON string
+            content: JSON bytes or text
         
         Returns:
             dict: Parsed JSON
@@ -190,14 +289,7 @@ class MarketingSpecParser:
             ParseError: If JSON parsing fails (MKT-VAL-001)
         """
         try:
-            # Check if source is a file path
-            path = Path(source)
-            if path.exists() and path.is_file():
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                # Treat as JSON string
-                data = json.loads(str(source))
+            data = json.loads(content)
 
             if not isinstance(data, dict):
                 raise ParseError(
@@ -216,52 +308,355 @@ class MarketingSpecParser:
                 line=e.lineno,
             ) from e
 
-    def _parse_spec(self, data: dict) -> MarketingSpec:
+    @staticmethod
+    def _intern(node: Any, table: Dict[str, str]) -> Any:
+        """Replace repeated keys and identifier-like strings by one shared object
+
+        Args:
+            node: Loaded YAML/JSON value (mutated in place where possible)
+            table: Interned strings seen so far in this document
+
+        Returns:
+            The node, or an equal value sharing interned strings
+        """
+        intern = MarketingSpecParser._intern
+        if isinstance(node, str):
+            return table.setdefault(node, node) if _INTERNABLE(node) else node
+        if isinstance(node, dict):
+            return {
+                (table.setdefault(key, key) if isinstance(key, str) else key): intern(value, table)
+                for key, value in node.items()
+            }
+        if isinstance(node, list):
+            for i, item in enumerate(node):
+                node[i] = intern(item, table)
+        return node
+
+    # ========================================================================
+    # $ref Resolution
+    # ========================================================================
+
+    def clear_ref_cache(self):
+        """Forget memoised `$ref` documents (e.g. after fragments changed on disk)"""
+        self._ref_documents.clear()
+        self._ref_values.clear()
+
+    def _resolve_refs(self, data: Any, source_path: Optional[Path]) -> Any:
+        """Inline every `$ref` directive in data
+        
+        Unchanged subtrees are returned as-is (copy-on-write), so specs
+        without references are walked once and never copied.
+        
+        Args:
+            data: Loaded document
+            source_path: File the document came from (None for strings/dicts)
+        
+        Returns:
+            Data with references replaced by their targets
+        """
+        return self.resolve_refs(data, source_path)
+
+    def resolve_refs(self, data: Any, source_path: Optional[Path] = None, document: Any = None) -> Any:
+        """Inline the `$ref` directives of already loaded data (e.g. one entity)
+
+        Args:
+            data: Loaded document or part of one
+            source_path: File the data came from (base of relative file refs)
+            document: Whole document that "#/pointer" refs point into
+                (default: data itself)
+
+        Raises:
+            ValidationError: MKT-REF-001 (target not found), MKT-REF-002 (cycle)
+        """
+        base = source_path.resolve() if source_path else None
+        root = data if document is None else document
+        # Targets inside the document being parsed are only memoised per run
+        self._root_document = root
+        self._root_values: Dict[Tuple[str, str], Any] = {}
+        return self._resolve_node(data, base, root, [])
+
+    def _resolve_node(
+        self,
+        node: Any,
+        doc_path: Optional[Path],
+        doc_root: Any,
+        stack: List[Tuple[str, str]],
+    ) -> Any:
+        """Resolve references inside one node of a document"""
+        if isinstance(node, dict):
+            if "$ref" in node:
+                target = self._resolve_ref(node["$ref"], doc_path, doc_root, stack)
+                if len(node) == 1:
+                    return target
+                # Sibling keys override fields of a mapping target
+                if not isinstance(target, dict):
+                    raise ValidationError(
+                        code="MKT-VAL-003",
+                        message=f"$ref '{node['$ref']}' with sibling keys must point to a mapping",
+                        entity="$ref",
+                        value=node["$ref"],
+                        fix="Remove the sibling keys or reference a mapping",
+                    )
+                merged = dict(target)
+                for key, value in node.items():
+                    if key != "$ref":
+                        merged[key] = self._resolve_node(value, doc_path, doc_root, stack)
+                return merged
+
+            result = node
+            for key, value in node.items():
+                resolved = self._resolve_node(value, doc_path, doc_root, stack)
+                if resolved is not value:
+                    if result is node:
+                        result = dict(node)
+                    result[key] = resolved
+            return result
+
+        if isinstance(node, list):
+            result = node
+            for i, value in enumerate(node):
+                resolved = self._resolve_node(value, doc_path, doc_root, stack)
+                if resolved is not value:
+                    if result is node:
+                        result = list(node)
+                    result[i] = resolved
+            return result
+
+        return node
+
+    def _resolve_ref(
+        self,
+        ref: Any,
+        doc_path: Optional[Path],
+        doc_root: Any,
+        stack: List[Tuple[str, str]],
+    ) -> Any:
+        """Resolve a single `$ref` target (memoised per file and pointer)
+        
+        Targets:
+            "shared/audiences.yaml"                 Whole file
+            "shared/audiences.yaml#/enterprise"     JSON pointer into a file
+            "#/definitions/strategy"                JSON pointer into this document
+        
+        Raises:
+            ValidationError: MKT-REF-001 (target not found), MKT-REF-002 (cycle)
+        """
+        if not isinstance(ref, str):
+            raise ValidationError(
+                code="MKT-VAL-003",
+                message=f"$ref must be a string (got {type(ref).__name__})",
+                entity="$ref",
+                value=ref,
+                fix="Use 'file.yaml', 'file.yaml#/pointer' or '#/pointer'",
+            )
+
+        file_part, _, pointer = ref.partition("#")
+        if file_part:
+            base_dir = doc_path.parent if doc_path else Path.cwd()
+            target_path: Optional[Path] = (base_dir / file_part).resolve()
+            target_root = self._load_ref_document(target_path, ref)
+        else:
+            target_path, target_root = doc_path, doc_root
+
+        key = (str(target_path) if target_path else "<string>", pointer)
+        cache = self._root_values if target_root is self._root_document else self._ref_values
+        if key in cache:
+            return cache[key]
+        if key in stack:
+            chain = " → ".join(f"{p}#{ptr}" for p, ptr in stack[stack.index(key):] + [key])
+            raise ValidationError(
+                code="MKT-REF-002",
+                message=f"Circular $ref detected: {chain}",
+                entity="$ref",
+                value=ref,
+                fix="Break the cycle so no fragment references itself",
+            )
+
+        stack.append(key)
+        try:
+            value = self._resolve_pointer(target_root, pointer, ref)
+            value = self._resolve_node(value, target_path, target_root, stack)
+        finally:
+            stack.pop()
+
+        cache[key] = value
+        return value
+
+    def _load_ref_document(self, path: Path, ref: str) -> Any:
+        """Load a referenced file once per parser (any YAML/JSON root type)"""
+        if path in self._ref_documents:
+            return self._ref_documents[path]
+        try:
+            content = path.read_bytes()
+            if path.suffix.lower() == ".json":
+                data = json.loads(content)
+            else:
+                Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                data = yaml.load(content, Loader=Loader)
+        except OSError as e:
+            raise ValidationError(
+                code="MKT-REF-001",
+                message=f"$ref '{ref}' points to a missing file: {path}",
+                entity="$ref",
+                value=ref,
+                fix="Check the path (relative to the referencing file)",
+            ) from e
+        except (yaml.YAMLError, json.JSONDecodeError) as e:
+            raise ParseError(
+                code="MKT-VAL-001",
+                message=f"Invalid syntax in referenced file {path}: {e}",
+                fix="Check YAML/JSON syntax of the referenced file",
+            ) from e
+        self._ref_documents[path] = data
+        return data
+
+    @staticmethod
+    def _resolve_pointer(document: Any, pointer: str, ref: str) -> Any:
+        """Follow an RFC 6901 JSON pointer ("" is the whole document)"""
+        if not pointer:
+            return document
+        node = document
+        for token in pointer.lstrip("/").split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            try:
+                if isinstance(node, list):
+                    node = node[int(token)]
+                else:
+                    node = node[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise ValidationError(
+                    code="MKT-REF-001",
+                    message=f"$ref '{ref}' not found (no '{token}' in target)",
+                    entity="$ref",
+                    value=ref,
+                    fix="Check the JSON pointer after '#'",
+                ) from None
+        return node
+
+    def _parse_spec(self, data: dict, model: Type[MarketingSpec] = MarketingSpec) -> MarketingSpec:
         """Parse dict into MarketingSpec using Pydantic validation
         
         Args:
             data: Parsed YAML/JSON data
+            model: Root model (MarketingSpec, or a subclass such as SpecFragment)
         
         Returns:
             MarketingSpec: Validated specification object
         
         Raises:
-            ValidationError: If Pydantic validation fails (MKT-VAL-002, MKT-VAL-003)
+            ValidationError: If schema pre-validation or Pydantic validation
+                fails (MKT-VAL-002, MKT-VAL-003)
         """
+        if self.prevalidate and model is MarketingSpec:
+            self._prevalidate(data)
         try:
-            spec = MarketingSpec(**data)
+            spec = model(**data)
             return spec
 
         except PydanticValidationError as e:
-            # Extract first error for clear messaging
-            errors = e.errors()
-            first_error = errors[0]
-
-            # Determine error code and create helpful message
-            error_type = first_error["type"]
-            field_path = ".".join(str(loc) for loc in first_error["loc"])
-            error_msg = first_error["msg"]
-
-            if error_type == "missing":
-                code = "MKT-VAL-002"
-                message = f"Missing required field: '{field_path}'"
-                fix = f"Add '{field_path}' field to your specification"
-            else:
-                code = "MKT-VAL-003"
-                message = f"Invalid value for '{field_path}': {error_msg}"
-                fix = f"Check the value and type for '{field_path}'"
+            self._raise_validation_error(e)
 
-            # Extract entity name if possible
-            entity = ""
-            if first_error["loc"]:
-                entity = str(first_error["loc"][0])
+    def _parse_spec_json(self, raw: bytes, model: Type[MarketingSpec] = MarketingSpec) -> MarketingSpec:
+        """Parse raw JSON bytes into MarketingSpec in one pass (model_validate_json)
+
+        Raises:
+            ParseError: If the JSON is malformed or not an object (MKT-VAL-001)
+            ValidationError: If Pydantic validation fails (MKT-VAL-002, MKT-VAL-003)
+        """
+        try:
+            return model.model_validate_json(raw)
+
+        except PydanticValidationError as e:
+            first_error = e.errors()[0]
+            if first_error["type"] == "json_invalid":
+                message = first_error.get("ctx", {}).get("error", first_error["msg"])
+                raise ParseError(
+                    code="MKT-VAL-001",
+                    message=f"Invalid JSON syntax: {message}",
+                    fix="Check JSON syntax, ensure proper quoting and commas",
+                    line=_error_line(message),
+                ) from e
+            if first_error["loc"] == () and first_error["type"] == "model_type":
+                raise ParseError(
+                    code="MKT-VAL-001",
+                    message=f"Expected dict, got {type(first_error.get('input')).__name__}",
+                    fix="Ensure JSON root is an object {...}",
+                ) from e
+            self._raise_validation_error(e)
+
+    @staticmethod
+    def _prevalidate(data: dict):
+        """Raise ValidationError listing every JSON Schema violation of data"""
+        from marketing_spec_kit.schema import structural_errors
+
+        issues = structural_errors(data)
+        if not issues:
+            return
+        first = issues[0]
+        field_path = first.path.lstrip("$.")
+        missing = first.validator == "required"
+        raise ValidationError(
+            code="MKT-VAL-002" if missing else "MKT-VAL-003",
+            message=f"Schema violation at '{first.path}': {first.message}"
+            + (f" (and {len(issues) - 1} more)" if len(issues) > 1 else ""),
+            entity=field_path.split(".")[0].split("[")[0],
+            field=field_path,
+            fix="Fix the listed structural problems (see the exported JSON Schema)",
+            details=[f"{issue.path}: {issue.message}" for issue in issues],
+        )
+
+    @staticmethod
+    def _raise_validation_error(e: PydanticValidationError):
+        """Raise ValidationError (MKT-VAL-002/003) for the first Pydantic error
+
+        Every error is listed in ValidationError.details.
+        """
+        # Extract first error for clear messaging
+        errors = e.errors()
+        first_error = errors[0]
+
+        # Determine error code and create helpful message
+        error_type = first_error["type"]
+        field_path = ".".join(str(loc) for loc in first_error["loc"])
+        error_msg = first_error["msg"]
+
+        if error_type == "missing":
+            code = "MKT-VAL-002"
+            message = f"Missing required field: '{field_path}'"
+            fix = f"Add '{field_path}' field to your specification"
+        else:
+            code = "MKT-VAL-003"
+            message = f"Invalid value for '{field_path}': {error_msg}"
+            fix = f"Check the value and type for '{field_path}'"
+
+        # Extract entity name if possible
+        entity = ""
+        if first_error["loc"]:
+            entity = str(first_error["loc"][0])
+
+        if len(errors) > 1:
+            message += f" (and {len(errors) - 1} more)"
+
+        raise ValidationError(
+            code=code,
+            message=message,
+            entity=entity,
+            field=field_path,
+            value=first_error.get("input"),
+            fix=fix,
+            details=[
+                f"{'.'.join(str(loc) for loc in error['loc']) or '(root)'}: {error['msg']}"
+                for error in errors
+            ],
+        ) from e
+
+
+def _error_line(message: str) -> Optional[int]:
+    """Line number from a pydantic-core JSON error ('... at line 3 column 5')"""
+    match = re.search(r"at line (\d+)", message)
+    return int(match.group(1)) if match else None
 
-            raise ValidationError(
-                code=code,
-                message=message,
-                entity=entity,
-                field=field_path,
-                value=first_error.get("input"),
-                fix=fix,
-            ) from e
 
+def _has_refs(content: Union[bytes, str]) -> bool:
+    """True if JSON content may contain `$ref` directives"""
+    return (b'"$ref"' if isinstance(content, bytes) else '"$ref"') in content
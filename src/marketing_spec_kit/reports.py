@@ -0,0 +1,325 @@
+"""CI report writers: SARIF 2.1.0 and JUnit XML
+
+Both writers stream a ValidationResult straight to disk: the document
+header is written first, then one record per issue (SARIF) or per rule and
+entity (JUnit), so the report of a 100k-entity spec is never held in
+memory as a JSON tree or XML DOM.
+
+- SARIF (code scanning): one result per issue, level error / warning /
+  note, with the rule, the entity as a logical location and the file and
+  line of the entity as the physical location
+- JUnit: one test case per rule per entity (classname = rule code, name =
+  entity), failing for errors (and for warnings with strict=True); the
+  messages of all issues of the pair become the failure text
+
+Locations come from an IssueLocator: the YAML file is scanned line by line
+for the start of each entity ('- id: ...' items of the top-level
+collections), without building a YAML node tree. JSON sources and
+entities that cannot be found get the file without a line.
+
+Example:
+    >>> locator = IssueLocator.for_file("spec.yaml")
+    >>> write_sarif(result, "validation.sarif", locator)
+    12
+    >>> write_junit(result, "validation.xml", locator)
+    9
+"""
+
+import json
+from itertools import groupby
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from marketing_spec_kit import __version__
+from marketing_spec_kit.validator import ValidationIssue, ValidationResult
+from marketing_spec_kit.workspace import ENTITY_TYPES
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {"error": "error", "warning": "warning", "info": "note"}
+TOOL_NAME = "marketing-spec-kit"
+TOOL_URI = "https://github.com/ACNet-AI/marketing-spec-kit"
+
+# Issues written per file write
+_WRITE_BATCH = 1000
+
+
+class IssueLocation(NamedTuple):
+    """File (and line, if known) an issue points at"""
+
+    path: str
+    line: Optional[int] = None
+
+
+def entity_lines(path: Union[str, Path]) -> Dict[Tuple[str, str], int]:
+    """First line of every entity of a YAML spec
+
+    Only block-style YAML is recognised: a top-level collection key
+    ('campaigns:') followed by list items whose 'id' key sits at the item's
+    key indentation. The project is keyed as ('project', '').
+
+    Returns:
+        (entity_type, entity_id) → 1-based line of the item
+    """
+    lines: Dict[Tuple[str, str], int] = {}
+    section: Optional[str] = None
+    item_indent: Optional[int] = None
+    key_indent = -1
+    start = 0
+    with open(path, "rb") as f:
+        for number, raw in enumerate(f, 1):
+            text = raw.decode("utf-8", "replace").rstrip()
+            stripped = text.lstrip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            indent = len(text) - len(stripped)
+            is_item = stripped[0] == "-" and stripped[1:2] in ("", " ")
+            if indent == 0 and not is_item:
+                key = stripped.split(":", 1)[0].strip().strip("'\"")
+                section = ENTITY_TYPES.get(key)
+                item_indent, key_indent = None, -1
+                if key == "project":
+                    lines[("project", "")] = number
+                continue
+            if section is None:
+                continue
+
+            if is_item:
+                if item_indent is None:
+                    item_indent = indent
+                if indent == item_indent:
+                    rest = stripped[1:].lstrip()
+                    start, key_indent = number, len(text) - len(rest)
+                    stripped, indent = rest, key_indent
+            if indent == key_indent and stripped.startswith("id:"):
+                value = stripped[3:].split(" #", 1)[0].strip().strip("'\"")
+                lines.setdefault((section, value), start)
+                key_indent = -1
+    return lines
+
+
+class IssueLocator:
+    """Resolve issues to the file and line of their entity
+
+    Example:
+        >>> IssueLocator.for_file("spec.yaml").locate(issue)
+        IssueLocation(path='spec.yaml', line=42)
+    """
+
+    def __init__(self, file_of: Callable[[ValidationIssue], Optional[Path]], default: Union[str, Path]):
+        """
+        Args:
+            file_of: File defining the entity of an issue (None = default)
+            default: File used for issues without a known entity file
+        """
+        self._file_of = file_of
+        self._default = Path(default)
+        self._lines: Dict[Path, Dict[Tuple[str, str], int]] = {}
+
+    @classmethod
+    def for_file(cls, path: Union[str, Path]) -> "IssueLocator":
+        """Locator for a single spec file"""
+        return cls(lambda issue: None, path)
+
+    @classmethod
+    def for_workspace(cls, workspace) -> "IssueLocator":
+        """Locator for a MarketingWorkspace (entities are found via its id index)"""
+        collections = {entity_type: collection for collection, entity_type in ENTITY_TYPES.items()}
+        projects = workspace.projects
+        project_file = projects[0][0] if projects else None
+
+        def file_of(issue: ValidationIssue) -> Optional[Path]:
+            if issue.entity_type == "file":
+                return Path(issue.entity_id)
+            if issue.entity_type == "project":
+                return project_file
+            collection = collections.get(issue.entity_type)
+            return workspace.file_of(collection, issue.entity_id) if collection else None
+
+        return cls(file_of, workspace.root)
+
+    def locate(self, issue: ValidationIssue) -> IssueLocation:
+        """File and line of an issue (line None when unknown)"""
+        path = self._file_of(issue) or self._default
+        if issue.entity_type == "file":
+            line = issue.field[5:] if issue.field.startswith("line ") else ""
+            return IssueLocation(str(path), int(line) if line.isdigit() else None)
+        lines = self._lines.get(path)
+        if lines is None:
+            lines = self._lines[path] = self._scan(path)
+        key = (issue.entity_type, "" if issue.entity_type == "project" else issue.entity_id)
+        return IssueLocation(str(path), lines.get(key))
+
+    @staticmethod
+    def _scan(path: Path) -> Dict[Tuple[str, str], int]:
+        """Entity lines of a YAML file (empty for JSON, directories and unreadable files)"""
+        if path.suffix.lower() not in (".yaml", ".yml") or not path.is_file():
+            return {}
+        try:
+            return entity_lines(path)
+        except OSError:
+            return {}
+
+
+def _issues(result: ValidationResult, info: bool) -> Iterator[ValidationIssue]:
+    """Errors, warnings and (optionally) info of a result"""
+    yield from result.errors
+    yield from result.warnings
+    if info:
+        yield from result.info
+
+
+def _uri(path: str) -> str:
+    """Artifact URI: relative posix path when possible"""
+    candidate = Path(path)
+    try:
+        candidate = candidate.resolve().relative_to(Path.cwd())
+    except (OSError, ValueError):
+        pass
+    return candidate.as_posix()
+
+
+def _write_batched(out: IO[str], records: Iterable[str]):
+    """Write records in batches of _WRITE_BATCH"""
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == _WRITE_BATCH:
+            out.write("".join(batch))
+            batch = []
+    out.write("".join(batch))
+
+
+def write_sarif(
+    result: ValidationResult,
+    path: Union[str, Path],
+    locator: IssueLocator,
+    info: bool = False,
+) -> int:
+    """Stream a validation result as a SARIF 2.1.0 log
+
+    Args:
+        result: ValidationResult to report
+        path: Output file
+        locator: IssueLocator of the validated file or workspace
+        info: Include info-level issues (as 'note')
+
+    Returns:
+        Number of results written
+    """
+    # Rules are listed before the results: one cheap pass for their ids
+    rule_index: Dict[str, int] = {}
+    for issue in _issues(result, info):
+        rule_index.setdefault(issue.code, len(rule_index))
+    rules = [{"id": code, "name": code} for code in rule_index]
+    uris: Dict[str, str] = {}
+    count = 0
+
+    def records() -> Iterator[str]:
+        nonlocal count
+        for issue in _issues(result, info):
+            location = locator.locate(issue)
+            uri = uris.get(location.path)
+            if uri is None:
+                uri = uris[location.path] = _uri(location.path)
+            physical: Dict[str, object] = {"artifactLocation": {"uri": uri}}
+            if location.line:
+                physical["region"] = {"startLine": location.line}
+            logical = {"kind": "object", "name": issue.entity_id or issue.entity_type}
+            logical["fullyQualifiedName"] = "/".join(
+                part for part in (issue.entity_type, issue.entity_id, issue.field) if part
+            )
+            record = {
+                "ruleId": issue.code,
+                "ruleIndex": rule_index[issue.code],
+                "level": SARIF_LEVELS.get(issue.level, "note"),
+                "message": {"text": f"{issue.message} (fix: {issue.fix})" if issue.fix else issue.message},
+                "locations": [{"physicalLocation": physical, "logicalLocations": [logical]}],
+            }
+            yield ("," if count else "") + "\n" + json.dumps(record, ensure_ascii=False)
+            count += 1
+
+    driver = {
+        "name": TOOL_NAME,
+        "version": __version__,
+        "informationUri": TOOL_URI,
+        "rules": rules,
+    }
+    header = json.dumps({"$schema": SARIF_SCHEMA, "version": "2.1.0"}, ensure_ascii=False)[:-1]
+    with open(path, "w", encoding="utf-8") as out:
+        out.write(f'{header}, "runs": [{{"tool": {{"driver": {json.dumps(driver, ensure_ascii=False)}}}, "results": [')
+        _write_batched(out, records())
+        out.write("\n]}]}\n")
+    return count
+
+
+def _case_key(issue: ValidationIssue) -> Tuple[str, str, str]:
+    return issue.code, issue.entity_type, issue.entity_id
+
+
+def write_junit(
+    result: ValidationResult,
+    path: Union[str, Path],
+    locator: IssueLocator,
+    name: str = TOOL_NAME,
+    strict: bool = False,
+) -> int:
+    """Stream a validation result as JUnit XML, one test case per rule per entity
+
+    Consecutive issues of the same rule and entity (the validator reports
+    an entity's issues together) form one test case. A result without
+    errors or warnings is a single passing test case.
+
+    Args:
+        result: ValidationResult to report
+        path: Output file
+        locator: IssueLocator of the validated file or workspace
+        name: Test suite name (e.g. the validated file)
+        strict: Warnings fail their test case too
+
+    Returns:
+        Number of test cases written
+    """
+    # Counts are attributes of the opening tags: one cheap pass first
+    cases = failures = 0
+    for level, issues in (("error", result.errors), ("warning", result.warnings)):
+        for _ in groupby(issues, key=_case_key):
+            cases += 1
+            failures += level == "error" or strict
+
+    def records() -> Iterator[str]:
+        for level, issues in (("error", result.errors), ("warning", result.warnings)):
+            failing = level == "error" or strict
+            for (code, entity_type, entity_id), group in groupby(issues, key=_case_key):
+                group = list(group)
+                location = locator.locate(group[0])
+                entity = f"{entity_type}:{entity_id}" if entity_id else entity_type
+                where = f"{location.path}:{location.line}" if location.line else location.path
+                text = "\n".join(
+                    f"{issue.field + ': ' if issue.field else ''}{issue.message}"
+                    + (f" (fix: {issue.fix})" if issue.fix else "")
+                    for issue in group
+                ) + f"\n{where}"
+                attrs = f"classname={quoteattr(code)} name={quoteattr(entity)} file={quoteattr(location.path)}"
+                if location.line:
+                    attrs += f' line="{location.line}"'
+                if failing:
+                    body = (
+                        f"<failure type={quoteattr(level)} message={quoteattr(group[0].message)}>"
+                        f"{escape(text)}</failure>"
+                    )
+                else:
+                    body = f"<system-out>{escape(f'{level}: {text}')}</system-out>"
+                yield f"    <testcase {attrs}>{body}</testcase>\n"
+
+    tests = cases or 1
+    suite = f"name={quoteattr(name)} tests=\"{tests}\" failures=\"{failures}\" errors=\"0\""
+    with open(path, "w", encoding="utf-8") as out:
+        out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        out.write(f"<testsuites {suite}>\n  <testsuite {suite}>\n")
+        if cases:
+            _write_batched(out, records())
+        else:
+            out.write(f'    <testcase classname="{TOOL_NAME}" name="validate"/>\n')
+        out.write("  </testsuite>\n</testsuites>\n")
+    return tests
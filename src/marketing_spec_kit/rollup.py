@@ -0,0 +1,252 @@
+"""Roll campaign analytics up to plan-level KPIs
+
+Campaign reports (Analytics with type 'campaign') are grouped by
+entity_id → Campaign.plan_id, and their metrics are aggregated per plan:
+
+- sum       total across reports (default)
+- mean      average over the reports that have the metric (default for
+            metrics named '*_rate')
+- weighted  mean weighted by another metric of the same report, e.g.
+            'weighted:impressions' for an engagement rate
+
+Each PlanKPI is then compared against the aggregated metric named like the
+KPI ('Website Traffic' → website_traffic, or an explicit mapping) and a
+KPIComparison is recomputed: achievement = actual / target * 100, status
+from ACHIEVEMENT_STATUSES.
+
+The aggregation is a single pass over columnar metric data (row offsets,
+metric name ids, values), either built from spec.analytics or read
+directly from a compiled snapshot, so 200k reports roll up without
+building per-report objects.
+
+Example:
+    >>> report = AnalyticsRollup({"engagement_rate": "weighted:impressions"}).rollup(spec)
+    >>> report.plans[0].kpis["website_traffic"].status
+    'on_track'
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+from marketing_spec_kit.models import AnalyticsType, KPIComparison, MarketingSpec
+
+AGGREGATIONS = ("sum", "mean", "weighted")
+
+# Lowest achievement (%) for each status, highest first; below all: far_below
+ACHIEVEMENT_STATUSES: Tuple[Tuple[float, str], ...] = (
+    (110.0, "exceeds"),
+    (100.0, "meets"),
+    (80.0, "on_track"),
+    (50.0, "below_target"),
+)
+
+
+def kpi_achievement(target: float, actual: float) -> float:
+    """Achievement percentage of actual against target (1 decimal)"""
+    if target == 0:
+        return 100.0 if actual >= 0 else 0.0
+    return round(actual / target * 100, 1)
+
+
+def kpi_status(achievement: float) -> str:
+    """Status for an achievement percentage (see ACHIEVEMENT_STATUSES)"""
+    for threshold, status in ACHIEVEMENT_STATUSES:
+        if achievement >= threshold:
+            return status
+    return "far_below"
+
+
+def metric_key(kpi_name: str) -> str:
+    """Metric name a KPI is measured by ('Website Traffic' → 'website_traffic')"""
+    return re.sub(r"[^a-z0-9]+", "_", kpi_name.lower()).strip("_")
+
+
+class PlanRollup(BaseModel):
+    """Aggregated campaign analytics of one plan"""
+
+    plan_id: str
+    campaigns: List[str] = Field(default_factory=list, description="Campaigns with reports")
+    reports: int = Field(0, description="Campaign reports aggregated")
+    metrics: Dict[str, float] = Field(default_factory=dict, description="Aggregated metrics")
+    kpis: Dict[str, KPIComparison] = Field(
+        default_factory=dict, description="Plan KPIs recomputed from the metrics (by metric_key(name))"
+    )
+    missing_kpis: List[str] = Field(
+        default_factory=list, description="Plan KPIs without a matching metric"
+    )
+
+
+class RollupReport(BaseModel):
+    """Plan-level rollup of all campaign reports"""
+
+    plans: List[PlanRollup] = Field(default_factory=list)
+    skipped_reports: int = Field(
+        0, description="Reports not rolled up (plan reports, unknown campaigns)"
+    )
+
+    def plan(self, plan_id: str) -> Optional[PlanRollup]:
+        """Rollup of one plan"""
+        return next((p for p in self.plans if p.plan_id == plan_id), None)
+
+
+class AnalyticsRollup:
+    """Aggregate campaign analytics per plan and recompute plan KPIs
+
+    Example:
+        >>> rollup = AnalyticsRollup(kpi_metrics={"Qualified Signups": "signups"})
+        >>> rollup.rollup_snapshot(SpecSnapshot("spec.mspec")).plan("q4-2025-launch-plan")
+    """
+
+    def __init__(
+        self,
+        aggregations: Optional[Dict[str, str]] = None,
+        kpi_metrics: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Args:
+            aggregations: Metric → 'sum', 'mean' or 'weighted:<metric>'
+            kpi_metrics: PlanKPI name → metric (default: metric_key(name))
+
+        Raises:
+            ValueError: If an aggregation is unknown
+        """
+        self.aggregations: Dict[str, Tuple[str, Optional[str]]] = {}
+        for metric, spec in (aggregations or {}).items():
+            method, _, weight = spec.partition(":")
+            if method not in AGGREGATIONS or (method == "weighted") != bool(weight):
+                raise ValueError(
+                    f"Unknown aggregation '{spec}' for '{metric}' "
+                    "(use sum, mean or weighted:<metric>)"
+                )
+            self.aggregations[metric] = (method, weight or None)
+        self.kpi_metrics = dict(kpi_metrics or {})
+
+    def aggregation(self, metric: str) -> Tuple[str, Optional[str]]:
+        """(method, weight metric) used for a metric"""
+        if metric in self.aggregations:
+            return self.aggregations[metric]
+        return ("mean", None) if metric.endswith("_rate") else ("sum", None)
+
+    def rollup(self, spec: MarketingSpec) -> RollupReport:
+        """Roll up spec.analytics"""
+        names: List[str] = []
+        name_ids: Dict[str, int] = {}
+        rows, keys, values = [0], [], []
+        entities = []
+        for report in spec.analytics:
+            entities.append(report.entity_id if report.type == AnalyticsType.CAMPAIGN else None)
+            for name, value in report.metrics.items():
+                key = name_ids.get(name)
+                if key is None:
+                    key = name_ids[name] = len(names)
+                    names.append(name)
+                keys.append(key)
+                values.append(value)
+            rows.append(len(keys))
+        return self._rollup(spec, entities, names, rows, keys, values)
+
+    def rollup_snapshot(self, snapshot) -> RollupReport:
+        """Roll up a compiled snapshot straight from its metric columns
+
+        Only plans and campaigns are rebuilt (spec(analytics=False)); report
+        types and entities are read from their columns, so the same reports
+        count as campaign reports as in rollup().
+        """
+        spec = snapshot.spec(analytics=False)
+        strings = snapshot.strings()
+        names = [strings[i] for i in range(len(strings))]
+        metrics = snapshot.metrics()
+        campaign = AnalyticsType.CAMPAIGN.value
+        entities = [
+            names[entity] if names[kind] == campaign else None
+            for entity, kind in zip(snapshot.report_entities(), snapshot.report_types())
+        ]
+        return self._rollup(spec, entities, names, metrics.rows, metrics.keys, metrics.values)
+
+    def _rollup(
+        self,
+        spec: MarketingSpec,
+        entities: Sequence[Optional[str]],
+        names: Sequence[str],
+        rows: Sequence[int],
+        keys: Sequence[int],
+        values: Sequence[float],
+    ) -> RollupReport:
+        """Aggregate CSR metric columns (row offsets, name ids, values) per plan"""
+        plan_index = {plan.id: i for i, plan in enumerate(spec.plans)}
+        campaign_group = {
+            campaign.id: plan_index[campaign.plan_id]
+            for campaign in spec.campaigns
+            if campaign.plan_id in plan_index
+        }
+
+        # Per name id: aggregation method and weight name id
+        methods = []
+        weight_ids: List[Optional[int]] = []
+        name_ids = {name: i for i, name in enumerate(names)}
+        for name in names:
+            method, weight = self.aggregation(name)
+            if method == "weighted" and weight not in name_ids:
+                method, weight = "mean", None
+            methods.append(method)
+            weight_ids.append(name_ids[weight] if weight else None)
+        weighted = any(w is not None for w in weight_ids)
+
+        groups = len(spec.plans)
+        totals: List[Dict[int, float]] = [{} for _ in range(groups)]
+        weights: List[Dict[int, float]] = [{} for _ in range(groups)]
+        reports = [0] * groups
+        campaigns: List[Dict[str, None]] = [{} for _ in range(groups)]
+        skipped = 0
+
+        for row, entity in enumerate(entities):
+            group = campaign_group.get(entity) if entity is not None else None
+            if group is None:
+                skipped += 1
+                continue
+            reports[group] += 1
+            campaigns[group][entity] = None
+            total, weight = totals[group], weights[group]
+            start, end = rows[row], rows[row + 1]
+            row_values = {keys[i]: values[i] for i in range(start, end)} if weighted else None
+            for i in range(start, end):
+                key = keys[i]
+                weight_id = weight_ids[key]
+                if weight_id is None:
+                    total[key] = total.get(key, 0.0) + values[i]
+                    weight[key] = weight.get(key, 0.0) + 1.0
+                else:
+                    w = row_values.get(weight_id, 0.0)
+                    total[key] = total.get(key, 0.0) + values[i] * w
+                    weight[key] = weight.get(key, 0.0) + w
+
+        report = RollupReport(skipped_reports=skipped)
+        for group, plan in enumerate(spec.plans):
+            metrics = {}
+            for key, total in totals[group].items():
+                if methods[key] == "sum":
+                    metrics[names[key]] = total
+                elif weights[group][key]:
+                    metrics[names[key]] = total / weights[group][key]
+            rollup = PlanRollup(
+                plan_id=plan.id,
+                campaigns=list(campaigns[group]),
+                reports=reports[group],
+                metrics=metrics,
+            )
+            for kpi in plan.kpis:
+                key = self.kpi_metrics.get(kpi.name) or metric_key(kpi.name)
+                if key not in metrics:
+                    rollup.missing_kpis.append(kpi.name)
+                    continue
+                achievement = kpi_achievement(kpi.target, metrics[key])
+                rollup.kpis[metric_key(kpi.name)] = KPIComparison(
+                    target=kpi.target,
+                    actual=metrics[key],
+                    achievement=achievement,
+                    status=kpi_status(achievement),
+                )
+            report.plans.append(rollup)
+        return report
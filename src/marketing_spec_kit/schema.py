@@ -0,0 +1,101 @@
+"""JSON Schema of the MarketingSpec model
+
+The schema is generated from the Pydantic models (model_json_schema) and
+versioned, so services outside Python validate against exactly the same
+structure:
+
+    $schema  JSON Schema draft 2020-12
+    $id      .../schema/<toolkit version>/marketing-spec.schema.json
+    x-marketing-spec-kit  {"version": ..., "fingerprint": ...}
+
+The fingerprint is a hash of the model schema; compiled snapshots record
+it too and are rejected when it changes.
+
+structural_validator() compiles a jsonschema validator for the schema once
+per process. MarketingSpecParser(prevalidate=True) runs it over the raw
+data and reports every structural problem at once. It is opt-in: the
+jsonschema validator is pure Python and an order of magnitude slower than
+Pydantic's own validation (which already reports all errors, see
+ValidationError.details).
+
+Example:
+    >>> write_schema("marketing-spec.schema.json")
+    >>> structural_errors({"project": {}})[0]
+    SchemaIssue(path='$.project', message="'name' is a required property", validator='required')
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from marketing_spec_kit import __version__
+from marketing_spec_kit.models import MarketingSpec
+
+SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+SCHEMA_ID = "https://github.com/ACNet-AI/marketing-spec-kit/schema/{version}/marketing-spec.schema.json"
+
+
+class SchemaIssue(NamedTuple):
+    """Structural problem found by the JSON Schema validator"""
+
+    path: str  # JSON path of the offending value ('$.campaigns[0].budget')
+    message: str
+    validator: str  # Failed keyword ('required', 'type', 'enum', ...)
+
+
+@lru_cache(maxsize=None)
+def _model_schema() -> str:
+    """MarketingSpec.model_json_schema() as canonical JSON (generated once)"""
+    return json.dumps(MarketingSpec.model_json_schema(), sort_keys=True)
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint() -> str:
+    """Fingerprint of the MarketingSpec model schema (changes invalidate snapshots)"""
+    return hashlib.blake2b(_model_schema().encode("utf-8"), digest_size=16).hexdigest()
+
+
+def spec_schema() -> Dict[str, Any]:
+    """Versioned JSON Schema of MarketingSpec (a fresh copy)"""
+    schema = {
+        "$schema": SCHEMA_DIALECT,
+        "$id": SCHEMA_ID.format(version=__version__),
+        "x-marketing-spec-kit": {"version": __version__, "fingerprint": schema_fingerprint()},
+    }
+    schema.update(json.loads(_model_schema()))
+    return schema
+
+
+def write_schema(path: Union[str, Path]) -> int:
+    """Write the versioned schema as JSON; returns the size in bytes"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = json.dumps(spec_schema(), indent=2) + "\n"
+    path.write_text(content, encoding="utf-8")
+    return len(content.encode("utf-8"))
+
+
+@lru_cache(maxsize=None)
+def structural_validator():
+    """jsonschema validator for spec_schema(), compiled once per process"""
+    from jsonschema.validators import validator_for
+
+    schema = spec_schema()
+    return validator_for(schema)(schema)
+
+
+def structural_errors(data: Any, limit: Optional[int] = None) -> List[SchemaIssue]:
+    """Every structural problem of raw spec data
+
+    Args:
+        data: Loaded YAML/JSON data
+        limit: Stop after this many problems (None = all)
+    """
+    issues = []
+    for error in structural_validator().iter_errors(data):
+        issues.append(SchemaIssue(error.json_path, error.message, str(error.validator)))
+        if limit is not None and len(issues) >= limit:
+            break
+    return issues
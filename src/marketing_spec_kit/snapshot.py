@@ -0,0 +1,597 @@
+"""Compiled binary snapshots of a MarketingSpec
+
+A snapshot stores an already validated spec so read-only consumers can
+skip YAML parsing and Pydantic validation on every start-up. Layout
+(little-endian):
+
+    header     8s magic b"MSKSNAP\\0", u16 format version, u16 section count
+    directory  per section: 4s tag, u64 offset, u64 length
+    sections   META  JSON: kit version, model schema fingerprint, source
+               SPEC  JSON: spec.model_dump(mode="json", exclude_unset=True),
+                     without analytics
+               ANLY  JSON: analytics reports, without metrics / vs_target
+               SOFF, SBLB      string table (metric/KPI names, statuses,
+                     report entity ids and types): u32 offsets, UTF-8 blob
+               ROFF, RBLB      analytics report ids, same layout
+               RENT  u32 string ids of Analytics.entity_id by report row
+               RTYP  u32 string ids of Analytics.type by report row
+               MROW, MKEY, MVAL  metrics: u32 row offsets (CSR), u32 name
+                     ids, f64 values
+               TROW, TKEY, TTGT, TACT, TACH, TSTA  vs_target: row offsets,
+                     KPI name ids, f64 target/actual/achievement, u32 status ids
+
+Sections are addressed through the directory, so new section types can be
+added without breaking the header; every section starts 8-byte aligned.
+
+Analytics metrics are stored as packed columns with one shared string
+table, so SpecSnapshot.metrics() / kpis() can scan every report's numbers
+through memoryviews over the mapped file without building a Python object
+per report. spec() rebuilds the dicts only when full models are needed;
+spec(analytics=False) skips the analytics reports entirely.
+
+The loader memory-maps the file and rebuilds models with model_construct()
+(no re-validation), converting nested models and enums from per-class
+plans computed once per process. A snapshot is rejected (MKT-SNAP-001) if
+the format version or the model schema fingerprint differs from the
+running toolkit — recompile it.
+
+Example:
+    >>> write_snapshot(spec, "spec.mspec", source="spec.yaml")
+    >>> spec = load_snapshot("spec.mspec")
+"""
+
+import enum
+import gc
+import json
+import mmap
+import struct
+import sys
+import typing
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+from marketing_spec_kit import __version__
+from marketing_spec_kit.exceptions import ParseError
+from marketing_spec_kit.models import KPIComparison, MarketingSpec
+from marketing_spec_kit.schema import schema_fingerprint
+
+SNAPSHOT_MAGIC = b"MSKSNAP\0"
+SNAPSHOT_VERSION = 3
+SNAPSHOT_SUFFIX = ".mspec"
+
+_HEADER = struct.Struct("<8sHH")
+_DIRECTORY_ENTRY = struct.Struct("<4sQQ")
+_ALIGNMENT = 8
+
+Converter = Callable[[Any], Any]
+
+_JSON_SCALARS = (str, int, float, bool)
+
+
+def is_snapshot(path: Union[str, Path]) -> bool:
+    """True if the file starts with the snapshot magic"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
+
+
+def write_snapshot(
+    spec: MarketingSpec,
+    path: Union[str, Path],
+    source: str = "",
+) -> int:
+    """Serialise a validated spec to a snapshot file
+
+    Args:
+        spec: Parsed (and ideally validated) MarketingSpec
+        path: Output file (conventionally *.mspec)
+        source: Source spec path recorded in META
+
+    Returns:
+        Size of the written file in bytes
+    """
+    meta = {
+        "kit_version": __version__,
+        "schema": schema_fingerprint(),
+        "source": source,
+    }
+    data = spec.model_dump(mode="json", exclude_unset=True, exclude={"analytics"})
+    analytics = [
+        report.model_dump(mode="json", exclude_unset=True, exclude={"metrics", "vs_target"})
+        for report in spec.analytics
+    ]
+    sections = [
+        (b"META", _dump_json(meta)),
+        (b"SPEC", _dump_json(data)),
+        (b"ANLY", _dump_json(analytics)),
+    ]
+    sections.extend(_metric_sections(spec))
+    return _write_sections(Path(path), sections)
+
+
+def load_snapshot(path: Union[str, Path]) -> MarketingSpec:
+    """Load a spec from a snapshot file without re-validation
+
+    Raises:
+        ParseError: If the file is missing, not a snapshot or incompatible
+    """
+    with SpecSnapshot(path) as snapshot:
+        return snapshot.spec()
+
+
+class SpecSnapshot:
+    """Memory-mapped snapshot file with access to its sections
+
+    Example:
+        >>> with SpecSnapshot("spec.mspec") as snapshot:
+        ...     snapshot.meta["source"]
+        ...     spec = snapshot.spec()
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise ParseError(
+                "MKT-SNAP-001",
+                f"Cannot open snapshot {self.path}: {e}",
+                "Run 'marketing_spec_kit compile' to create it",
+            )
+        self._buffer = memoryview(self._mmap)
+        self.sections: Dict[str, Tuple[int, int]] = self._read_directory()
+        self.meta: Dict[str, Any] = json.loads(self.section("META").tobytes())
+        if self.meta.get("schema") != schema_fingerprint():
+            self.close()
+            raise ParseError(
+                "MKT-SNAP-001",
+                f"Snapshot {self.path} was compiled with a different model schema "
+                f"(marketing-spec-kit {self.meta.get('kit_version', '?')})",
+                "Recompile the snapshot with the installed version",
+            )
+
+    def __enter__(self) -> "SpecSnapshot":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the memory map
+
+        Views returned by section(), metrics() or kpis() that are still
+        referenced keep the mapping alive until they are dropped.
+        """
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+
+    def section(self, tag: str) -> memoryview:
+        """Zero-copy view of a section's bytes
+
+        Raises:
+            ParseError: If the snapshot has no such section
+        """
+        if tag not in self.sections:
+            raise ParseError(
+                "MKT-SNAP-001",
+                f"Snapshot {self.path} has no '{tag}' section",
+                "Recompile the snapshot with the installed version",
+            )
+        offset, length = self.sections[tag]
+        return self._buffer[offset:offset + length]
+
+    def spec(self, analytics: bool = True) -> MarketingSpec:
+        """Rebuild the MarketingSpec (model_construct, no validation)
+
+        Args:
+            analytics: Include the analytics reports (False leaves
+                spec.analytics empty and is much faster on large snapshots)
+
+        The cyclic garbage collector is paused while the object tree is
+        built: none of it is garbage yet, and millions of allocations would
+        otherwise trigger repeated full collections.
+        """
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            data = json.loads(self.section("SPEC").tobytes())
+            if analytics:
+                reports = json.loads(self.section("ANLY").tobytes())
+                metrics, kpis = self.metrics(), self.kpis()
+                for row, report in enumerate(reports):
+                    report["metrics"] = metrics.row(row)
+                    report["vs_target"] = kpis.raw_row(row)
+                data["analytics"] = reports
+            return _model_builder(MarketingSpec)(data)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def strings(self) -> "StringTable":
+        """Shared string table (metric and KPI names, KPI statuses, entity ids)"""
+        return StringTable(self._array("SOFF", "I"), self.section("SBLB"))
+
+    def report_ids(self) -> "StringTable":
+        """Analytics report ids by row (report_ids()[row], .index(id))"""
+        return StringTable(self._array("ROFF", "I"), self.section("RBLB"))
+
+    def report_entities(self):
+        """String ids (strings()[id]) of Analytics.entity_id by report row"""
+        return self._array("RENT", "I")
+
+    def report_types(self):
+        """String ids (strings()[id]) of Analytics.type by report row"""
+        return self._array("RTYP", "I")
+
+    def metrics(self) -> "MetricTable":
+        """Read-only columnar view of Analytics.metrics for all reports"""
+        return MetricTable(
+            self.strings(),
+            self._array("MROW", "I"),
+            self._array("MKEY", "I"),
+            self._array("MVAL", "d"),
+        )
+
+    def kpis(self) -> "KPITable":
+        """Read-only columnar view of Analytics.vs_target for all reports"""
+        return KPITable(
+            self.strings(),
+            self._array("TROW", "I"),
+            self._array("TKEY", "I"),
+            self._array("TTGT", "d"),
+            self._array("TACT", "d"),
+            self._array("TACH", "d"),
+            self._array("TSTA", "I"),
+        )
+
+    def _array(self, tag: str, typecode: str):
+        """Typed view of a little-endian section (zero-copy on little-endian hosts)"""
+        view = self.section(tag)
+        if sys.byteorder == "little":
+            return view.cast(typecode)
+        values = array(typecode, view.tobytes())
+        values.byteswap()
+        return values
+
+    def _read_directory(self) -> Dict[str, Tuple[int, int]]:
+        """Check the header and read the section directory"""
+        buffer = self._buffer
+        invalid = ParseError(
+            "MKT-SNAP-001",
+            f"{self.path} is not a marketing-spec-kit snapshot",
+            "Run 'marketing_spec_kit compile' on the source specification",
+        )
+        if len(buffer) < _HEADER.size:
+            self.close()
+            raise invalid
+        magic, version, count = _HEADER.unpack_from(buffer, 0)
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise invalid
+        if version != SNAPSHOT_VERSION:
+            self.close()
+            raise ParseError(
+                "MKT-SNAP-001",
+                f"Snapshot format version {version} is not supported (expected {SNAPSHOT_VERSION})",
+                "Recompile the snapshot with the installed version",
+            )
+
+        sections = {}
+        for i in range(count):
+            position = _HEADER.size + i * _DIRECTORY_ENTRY.size
+            if position + _DIRECTORY_ENTRY.size > len(buffer):
+                self.close()
+                raise invalid
+            tag, offset, length = _DIRECTORY_ENTRY.unpack_from(buffer, position)
+            if offset + length > len(buffer):
+                self.close()
+                raise invalid
+            sections[tag.decode("ascii")] = (offset, length)
+        return sections
+
+
+def _dump_json(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _packed(typecode: str, values) -> bytes:
+    """Little-endian packed array bytes"""
+    packed = array(typecode, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _metric_sections(spec: MarketingSpec) -> List[Tuple[bytes, bytes]]:
+    """String table plus CSR metric and KPI columns for all analytics reports"""
+    string_ids: Dict[str, int] = {}
+    intern = lambda text: string_ids.setdefault(text, len(string_ids))  # noqa: E731
+
+    m_rows, m_keys, m_values = [0], [], []
+    t_rows, t_keys, t_target, t_actual, t_achievement, t_status = [0], [], [], [], [], []
+    entities, types = [], []
+    for analytics in spec.analytics:
+        entities.append(intern(analytics.entity_id))
+        types.append(intern(analytics.type.value))
+        for name, value in analytics.metrics.items():
+            m_keys.append(intern(name))
+            m_values.append(value)
+        m_rows.append(len(m_keys))
+        for name, kpi in analytics.vs_target.items():
+            t_keys.append(intern(name))
+            t_target.append(kpi.target)
+            t_actual.append(kpi.actual)
+            t_achievement.append(kpi.achievement)
+            t_status.append(intern(kpi.status))
+        t_rows.append(len(t_keys))
+
+    string_offsets, string_blob = _string_table(string_ids)
+    id_offsets, id_blob = _string_table(analytics.id for analytics in spec.analytics)
+
+    return [
+        (b"SOFF", string_offsets),
+        (b"SBLB", string_blob),
+        (b"ROFF", id_offsets),
+        (b"RBLB", id_blob),
+        (b"RENT", _packed("I", entities)),
+        (b"RTYP", _packed("I", types)),
+        (b"MROW", _packed("I", m_rows)),
+        (b"MKEY", _packed("I", m_keys)),
+        (b"MVAL", _packed("d", m_values)),
+        (b"TROW", _packed("I", t_rows)),
+        (b"TKEY", _packed("I", t_keys)),
+        (b"TTGT", _packed("d", t_target)),
+        (b"TACT", _packed("d", t_actual)),
+        (b"TACH", _packed("d", t_achievement)),
+        (b"TSTA", _packed("I", t_status)),
+    ]
+
+
+def _string_table(strings) -> Tuple[bytes, bytes]:
+    """Packed u32 offsets and UTF-8 blob for a sequence of strings"""
+    blob = bytearray()
+    offsets = [0]
+    for text in strings:
+        blob += text.encode("utf-8")
+        offsets.append(len(blob))
+    return _packed("I", offsets), bytes(blob)
+
+
+def _write_sections(path: Path, sections: List[Tuple[bytes, bytes]]) -> int:
+    """Write header, directory and 8-byte aligned payloads; returns the file size"""
+    offset = _HEADER.size + len(sections) * _DIRECTORY_ENTRY.size
+    directory = []
+    padding = []
+    for tag, payload in sections:
+        pad = -offset % _ALIGNMENT
+        offset += pad
+        padding.append(pad)
+        directory.append(_DIRECTORY_ENTRY.pack(tag, offset, len(payload)))
+        offset += len(payload)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(sections)))
+        f.writelines(directory)
+        for pad, (_, payload) in zip(padding, sections):
+            f.write(b"\0" * pad)
+            f.write(payload)
+    return offset
+
+
+class StringTable:
+    """Read-only string table over offset and UTF-8 blob views
+
+    Strings are decoded on access; index() builds a lookup dict on first use.
+    """
+
+    def __init__(self, offsets, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+        self._ids: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return bytes(self._blob[self._offsets[index]:self._offsets[index + 1]]).decode("utf-8")
+
+    def index(self, text: str) -> Optional[int]:
+        """String id of text, or None if the table does not contain it"""
+        if self._ids is None:
+            self._ids = {self[i]: i for i in range(len(self))}
+        return self._ids.get(text)
+
+
+class MetricTable:
+    """Analytics.metrics of all reports as packed columns (CSR by report row)
+
+    Example:
+        >>> metrics = snapshot.metrics()
+        >>> metrics.sum("reach")
+        1250000.0
+        >>> for row, value in metrics.column("conversions"):
+        ...     ...
+    """
+
+    def __init__(self, strings: StringTable, rows, keys, values):
+        self.strings = strings
+        self.rows = rows
+        self.keys = keys
+        self.values = values
+
+    def __len__(self) -> int:
+        """Number of reports"""
+        return len(self.rows) - 1
+
+    def row(self, row: int) -> Dict[str, float]:
+        """Metrics of one report as a dict"""
+        start, end = self.rows[row], self.rows[row + 1]
+        strings = self.strings
+        return {strings[self.keys[i]]: self.values[i] for i in range(start, end)}
+
+    def column(self, name: str) -> Iterator[Tuple[int, float]]:
+        """(report row, value) for every report that has the metric"""
+        key = self.strings.index(name)
+        if key is None:
+            return
+        rows, keys, values = self.rows, self.keys, self.values
+        for row in range(len(rows) - 1):
+            for i in range(rows[row], rows[row + 1]):
+                if keys[i] == key:
+                    yield row, values[i]
+                    break
+
+    def sum(self, name: str) -> float:
+        """Total of one metric across all reports"""
+        key = self.strings.index(name)
+        if key is None:
+            return 0.0
+        values = self.values
+        return sum(values[i] for i, k in enumerate(self.keys) if k == key)
+
+
+class KPITable(MetricTable):
+    """Analytics.vs_target of all reports as packed columns
+
+    `values` is the achievement column; `target`, `actual` and `status`
+    hold the remaining KPIComparison fields.
+    """
+
+    def __init__(self, strings: StringTable, rows, keys, target, actual, achievement, status):
+        super().__init__(strings, rows, keys, achievement)
+        self.target = target
+        self.actual = actual
+        self.status = status
+
+    def row(self, row: int) -> Dict[str, KPIComparison]:
+        """KPI comparisons of one report (constructed without validation)"""
+        build = _model_builder(KPIComparison)
+        return {name: build(fields) for name, fields in self.raw_row(row).items()}
+
+    def raw_row(self, row: int) -> Dict[str, Dict[str, Any]]:
+        """KPI comparisons of one report as plain dicts"""
+        start, end = self.rows[row], self.rows[row + 1]
+        strings = self.strings
+        return {
+            strings[self.keys[i]]: {
+                "target": self.target[i],
+                "actual": self.actual[i],
+                "achievement": self.values[i],
+                "status": strings[self.status[i]],
+            }
+            for i in range(start, end)
+        }
+
+
+# ----------------------------------------------------------------------
+# model_construct() builders
+# ----------------------------------------------------------------------
+
+
+@lru_cache(maxsize=None)
+def _model_builder(model: Type[BaseModel]) -> Converter:
+    """Converter dict → model instance, recursing into nested fields"""
+    fields = model.model_fields
+    plan: List[Tuple[str, Converter]] = []
+    for name, info in fields.items():
+        convert = _converter(info.annotation)
+        if convert is not None:
+            plan.append((name, convert))
+
+    construct = _fast_construct(model) or (lambda data: model.model_construct(**data))
+
+    def build(data: Dict[str, Any]) -> BaseModel:
+        for name, convert in plan:
+            value = data.get(name)
+            if value is not None:
+                data[name] = convert(value)
+        return construct(data)
+
+    return build
+
+
+def _fast_construct(model: Type[BaseModel]) -> Optional[Converter]:
+    """Precompiled equivalent of model.model_construct() for plain models
+
+    model_construct() re-inspects every field (aliases, defaults) on each
+    call, which dominates load time at millions of objects. For models
+    without aliases, extra fields, private attributes or post-init hooks,
+    the same instance state is set directly and the input dict becomes the
+    instance __dict__ (missing optional fields get their defaults). Returns
+    None for any other model (model_construct() is used instead).
+    """
+    fields = model.model_fields
+    if (
+        model.model_config.get("extra") == "allow"
+        or model.__private_attributes__
+        or model.__pydantic_post_init__
+        or any(info.alias or info.validation_alias for info in fields.values())
+    ):
+        return None
+
+    field_count = len(fields)
+    optional = [(name, info) for name, info in fields.items() if not info.is_required()]
+    new = model.__new__
+    set_attr = object.__setattr__
+
+    def construct(data: Dict[str, Any]) -> BaseModel:
+        # data holds only field names (it was dumped from the same model)
+        fields_set = set(data)
+        if len(fields_set) < field_count:
+            for name, info in optional:
+                if name not in fields_set:
+                    data[name] = info.get_default(call_default_factory=True)
+        instance = new(model)
+        set_attr(instance, "__dict__", data)
+        set_attr(instance, "__pydantic_fields_set__", fields_set)
+        set_attr(instance, "__pydantic_extra__", None)
+        set_attr(instance, "__pydantic_private__", None)
+        return instance
+
+    return construct
+
+
+def _converter(annotation: Any) -> Optional[Converter]:
+    """Converter for a field annotation, or None if JSON values are used as-is"""
+    origin = typing.get_origin(annotation)
+
+    if origin is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _converter(args[0]) if len(args) == 1 else None
+
+    if origin in (list, List):
+        (item,) = typing.get_args(annotation) or (Any,)
+        convert = _converter(item)
+        if convert is None:
+            return None
+        return lambda values: [convert(v) for v in values]
+
+    if origin in (dict, Dict):
+        _, item = typing.get_args(annotation) or (str, Any)
+        convert = _converter(item)
+        if convert is None:
+            return None
+        return lambda values: {k: convert(v) for k, v in values.items()}
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _model_builder(annotation)
+        if issubclass(annotation, enum.Enum):
+            return annotation
+        if annotation not in _JSON_SCALARS:
+            # Rare non-JSON scalars (e.g. HttpUrl): validate just this value
+            return TypeAdapter(annotation).validate_python
+    return None
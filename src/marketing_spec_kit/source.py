@@ -0,0 +1,206 @@
+"""Specification sources for MarketingSpecParser
+
+Whatever is passed to MarketingSpecParser.parse() is resolved exactly once
+into a SpecSource of one kind:
+
+- path    Path objects, or strings naming an existing file
+- bytes   bytes / bytearray / memoryview content
+- text    string content (YAML or JSON)
+- stream  file-like objects with .read() (open files, sys.stdin)
+- dict    already loaded data
+
+Strings are only probed as paths when they could be one (single line,
+short, not starting with '{' or '['), with a single is_file() call, so
+YAML/JSON content is never stat'ed. Files are read as bytes in one read;
+the YAML and JSON loaders both accept bytes directly.
+
+Example:
+    >>> source = SpecSource.resolve("spec.yaml")
+    >>> source.kind, source.format
+    ('path', 'yaml')
+    >>> spec = MarketingSpecParser().parse(SpecSource.stdin())
+"""
+
+import io
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from typing import IO, Any, ContextManager, Optional, Union
+
+from marketing_spec_kit.exceptions import ParseError
+
+FORMATS = ("auto", "yaml", "json", "dict")
+
+# Longest string still probed as a path (PATH_MAX on most systems)
+_MAX_PATH_LENGTH = 4096
+
+SourceLike = Union[str, Path, bytes, bytearray, memoryview, dict, IO[Any], "SpecSource"]
+
+
+class SpecSource:
+    """Resolved specification source (kind and format decided once)"""
+
+    __slots__ = ("kind", "format", "path", "name", "_value", "_content")
+
+    def __init__(
+        self,
+        kind: str,
+        format: str,
+        value: Any,
+        path: Optional[Path] = None,
+        name: str = "",
+    ):
+        """
+        Args:
+            kind: 'path', 'bytes', 'text', 'stream' or 'dict'
+            format: 'yaml', 'json' or 'dict'
+            value: Path, content, stream or dict
+            path: File path (for relative `$ref` resolution and messages)
+            name: Display name (file path, '<stdin>', '<string>')
+        """
+        self.kind = kind
+        self.format = format
+        self.path = path
+        self.name = name or (str(path) if path else f"<{kind}>")
+        self._value = value
+        self._content: Any = None
+
+    def __repr__(self) -> str:
+        return f"SpecSource(kind={self.kind!r}, format={self.format!r}, name={self.name!r})"
+
+    @classmethod
+    def resolve(cls, source: SourceLike, format: str = "auto") -> "SpecSource":
+        """Decide the kind and format of a parse() source
+
+        Args:
+            source: Path, string content, bytes, file-like object, dict or SpecSource
+            format: "auto" (detect), "yaml", "json" or "dict"
+
+        Raises:
+            ParseError: If the format is unknown or does not fit the source (MKT-VAL-001)
+        """
+        if isinstance(source, SpecSource):
+            return source
+        if format not in FORMATS:
+            raise ParseError(
+                code="MKT-VAL-001",
+                message=f"Unsupported format: {format}",
+                fix="Use 'yaml', 'json', or 'dict' format",
+            )
+
+        if isinstance(source, dict):
+            return cls("dict", "dict", source)
+        if format == "dict":
+            raise ParseError(
+                code="MKT-VAL-001",
+                message=f"Format 'dict' requires a dict, got {type(source).__name__}",
+                fix="Pass the loaded data as a dict, or use 'yaml' or 'json' format",
+            )
+
+        if isinstance(source, Path):
+            return cls("path", _format_for(source, format), source, path=source)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return cls("bytes", _content_format(format), bytes(source), name="<bytes>")
+        if isinstance(source, str):
+            if _could_be_path(source):
+                path = Path(source)
+                try:
+                    is_file = path.is_file()
+                except (OSError, ValueError):
+                    is_file = False
+                if is_file:
+                    return cls("path", _format_for(path, format), path, path=path)
+            return cls("text", _content_format(format), source, name="<string>")
+        if hasattr(source, "read"):
+            name = getattr(source, "name", "")
+            path = Path(name) if isinstance(name, str) and name and not name.startswith("<") else None
+            fmt = _format_for(path, format) if path else _content_format(format)
+            return cls("stream", fmt, source, path=path, name=name if isinstance(name, str) else "")
+
+        raise ParseError(
+            code="MKT-VAL-001",
+            message=f"Unsupported source type: {type(source).__name__}",
+            fix="Pass a file path, YAML/JSON content, a file-like object or a dict",
+        )
+
+    @classmethod
+    def stdin(cls, format: str = "auto") -> "SpecSource":
+        """Source reading standard input as bytes"""
+        return cls("stream", _content_format(format), sys.stdin.buffer, name="<stdin>")
+
+    def read(self) -> Any:
+        """Content as bytes/str (dict for dict sources), read at most once
+
+        Raises:
+            ParseError: If the file or stream cannot be read (MKT-VAL-001)
+        """
+        if self._content is not None:
+            return self._content
+        if self.kind == "path":
+            try:
+                self._content = self._value.read_bytes()
+            except OSError as e:
+                raise ParseError(
+                    code="MKT-VAL-001",
+                    message=f"Cannot read {self.name}: {e.strerror or e}",
+                    fix="Check that the file exists and is readable",
+                ) from e
+        elif self.kind == "stream":
+            try:
+                self._content = self._value.read()
+            except OSError as e:
+                raise ParseError(
+                    code="MKT-VAL-001",
+                    message=f"Cannot read {self.name}: {e}",
+                    fix="Check the input stream",
+                ) from e
+        else:
+            self._content = self._value
+        return self._content
+
+    def open(self) -> ContextManager[IO[Any]]:
+        """Readable stream over the content, for incremental (multi-document) loading
+
+        Files are opened in binary mode and closed on exit; streams that
+        were not read yet are used as they are (never closed here).
+
+        Raises:
+            ParseError: If the file cannot be opened (MKT-VAL-001)
+        """
+        if self.kind == "path" and self._content is None:
+            try:
+                return open(self._value, "rb")
+            except OSError as e:
+                raise ParseError(
+                    code="MKT-VAL-001",
+                    message=f"Cannot read {self.name}: {e.strerror or e}",
+                    fix="Check that the file exists and is readable",
+                ) from e
+        if self.kind == "stream" and self._content is None:
+            return nullcontext(self._value)
+        content = self.read()
+        if isinstance(content, bytes):
+            return nullcontext(io.BytesIO(content))
+        return nullcontext(io.StringIO(content))
+
+
+def _could_be_path(text: str) -> bool:
+    """Cheap check before stat'ing a string: content is never a path"""
+    return (
+        0 < len(text) <= _MAX_PATH_LENGTH
+        and "\n" not in text
+        and "\0" not in text
+        and text.lstrip()[:1] not in ("{", "[")
+    )
+
+
+def _format_for(path: Path, format: str) -> str:
+    """Format of a file: explicit, else .json → json, anything else → yaml"""
+    if format != "auto":
+        return format
+    return "json" if path.suffix.lower() == ".json" else "yaml"
+
+
+def _content_format(format: str) -> str:
+    """Format of in-memory content: explicit, else yaml (JSON is valid YAML)"""
+    return "yaml" if format == "auto" else format
@@ -0,0 +1,220 @@
+"""Multi-document stream validation
+
+An exporter can emit thousands of specs as one YAML stream, one document
+per brand, separated by '---'. StreamValidator validates such a stream
+without splitting it into files:
+
+- The stream is read line by line and cut at document markers ('---' at
+  column 0, ending at '...'), so only the documents being validated are
+  held in memory and stdin is processed while it is still being written
+- Each document is parsed on its own (yaml.load_all via
+  MarketingSpecParser.parse_documents), so a syntax error only fails its
+  own document and line numbers are reported relative to the stream
+- With jobs > 1, batches of documents are parsed and validated in worker
+  processes; a bounded number of batches is in flight and results are
+  yielded in document order
+
+Example:
+    >>> for doc in StreamValidator(jobs=4).validate("brands.yaml"):
+    ...     print(doc.index, doc.name, doc.valid)
+    1 Acme True
+    2 Globex False
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from marketing_spec_kit.exceptions import MarketingSpecError
+from marketing_spec_kit.parser import MarketingSpecParser
+from marketing_spec_kit.source import SourceLike, SpecSource
+from marketing_spec_kit.validator import MarketingSpecValidator, ValidationResult
+
+# (index, first line, content) of one document of the stream
+_Chunk = Tuple[int, int, bytes]
+
+
+class DocumentError(BaseModel):
+    """Reason a stream document could not be parsed"""
+
+    code: str
+    message: str
+    fix: str = ""
+    line: Optional[int] = Field(None, description="Line in the stream (1-based)")
+
+
+class DocumentResult(BaseModel):
+    """Validation outcome of one document of a stream"""
+
+    index: int = Field(..., description="Document number in the stream (1-based)")
+    line: int = Field(..., description="First line of the document in the stream")
+    name: str = Field("", description="Project name (empty if not parsed)")
+    result: Optional[ValidationResult] = None
+    error: Optional[DocumentError] = None
+
+    @property
+    def parsed(self) -> bool:
+        return self.result is not None
+
+    @property
+    def valid(self) -> bool:
+        return self.result is not None and self.result.valid
+
+
+def split_documents(stream: Iterable[Union[bytes, str]]) -> Iterator[Tuple[int, bytes]]:
+    """Cut a YAML stream into documents, reading it line by line
+
+    A '---' line starts a new document unless the current one has no
+    content yet (only comments, directives or blank lines), and '...'
+    ends one. Content-free documents are skipped.
+
+    Yields:
+        (first line number, document bytes)
+    """
+    lines: List[bytes] = []
+    start = 1
+    has_content = False
+    number = 0
+    for number, raw in enumerate(stream, 1):
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        if raw.startswith(b"---") and raw[3:4] in (b"", b" ", b"\t", b"\r", b"\n") and has_content:
+            yield start, b"".join(lines)
+            lines, start, has_content = [], number, False
+        elif raw.startswith(b"...") and raw[3:].strip() == b"":
+            if has_content:
+                yield start, b"".join(lines)
+            lines, start, has_content = [], number + 1, False
+            continue
+
+        lines.append(raw)
+        stripped = raw.strip()
+        if not has_content and stripped and not stripped.startswith((b"#", b"%")):
+            # A bare '---' opening the first document is not content either
+            has_content = stripped != b"---"
+    if has_content:
+        yield start, b"".join(lines)
+
+
+def _validate_chunks(chunks: List[_Chunk], path: Optional[Path], name: str) -> List[DocumentResult]:
+    """Parse and validate documents (runs in a worker process when jobs > 1)
+
+    Errors are returned as DocumentError rather than raised, so results
+    can be sent back from worker processes.
+    """
+    parser = MarketingSpecParser()
+    validator = MarketingSpecValidator()
+    results = []
+    for index, start, content in chunks:
+        doc = DocumentResult(index=index, line=start)
+        source = SpecSource("bytes", "yaml", content, path=path, name=f"{name}#{index}")
+        try:
+            for item in parser.parse_documents(source):
+                if isinstance(item, MarketingSpecError):
+                    doc.error = _document_error(item, start)
+                else:
+                    doc.name = item.project.name
+                    doc.result = validator.validate(item)
+        except MarketingSpecError as e:
+            doc.error = _document_error(e, start)
+        except Exception as e:
+            doc.error = DocumentError(code="MKT-VAL-001", message=f"Unexpected parsing error: {e}")
+        results.append(doc)
+    return results
+
+
+def _document_error(e: MarketingSpecError, start: int) -> DocumentError:
+    """DocumentError with the line translated to the stream"""
+    line = getattr(e, "line", None)
+    message = e.message
+    if line:
+        message = message.replace(f"Line {line}:", f"Line {start + line - 1}:", 1)
+        line = start + line - 1
+    return DocumentError(code=e.code, message=message, fix=e.fix or "", line=line)
+
+
+class StreamValidator:
+    """Validate every document of a YAML stream lazily
+
+    Example:
+        >>> validator = StreamValidator(jobs=4)
+        >>> failed = [d.index for d in validator.validate(SpecSource.stdin()) if not d.valid]
+    """
+
+    def __init__(self, jobs: int = 1, batch_size: int = 16):
+        """
+        Args:
+            jobs: Worker processes (1 = in-process, 0 or None = CPU count)
+            batch_size: Documents sent to a worker at once
+        """
+        self.jobs = jobs
+        self.batch_size = max(1, batch_size)
+
+    def validate(self, source: SourceLike, format: str = "auto") -> Iterator[DocumentResult]:
+        """Validate each document of a stream, in stream order
+
+        Args:
+            source: Path, content, stream or SpecSource (e.g. SpecSource.stdin())
+            format: "auto", "yaml" or "json" (a JSON source is one document)
+
+        Yields:
+            DocumentResult per non-empty document
+
+        Raises:
+            ParseError: If the source cannot be read (MKT-VAL-001)
+        """
+        spec_source = SpecSource.resolve(source, format)
+        if spec_source.format != "yaml":
+            yield from self._validate_single(spec_source)
+            return
+
+        with spec_source.open() as stream:
+            chunks = (
+                (index, start, content)
+                for index, (start, content) in enumerate(split_documents(stream), 1)
+            )
+            batches = _batched(chunks, self.batch_size)
+            if self.jobs == 1:
+                for batch in batches:
+                    yield from _validate_chunks(batch, spec_source.path, spec_source.name)
+            else:
+                yield from self._validate_parallel(batches, spec_source)
+
+    def _validate_single(self, spec_source: SpecSource) -> Iterator[DocumentResult]:
+        """A JSON (or dict) source holds a single document"""
+        doc = DocumentResult(index=1, line=1)
+        try:
+            spec = MarketingSpecParser().parse(spec_source)
+            doc.name = spec.project.name
+            doc.result = MarketingSpecValidator().validate(spec)
+        except MarketingSpecError as e:
+            doc.error = _document_error(e, 1)
+        yield doc
+
+    def _validate_parallel(self, batches: Iterator[List[_Chunk]], spec_source: SpecSource) -> Iterator[DocumentResult]:
+        """Validate batches in worker processes, keeping 2 batches per worker in flight"""
+        with ProcessPoolExecutor(max_workers=self.jobs or None) as pool:
+            limit = 2 * (self.jobs or os.cpu_count() or 1)
+            pending: deque = deque()
+            for batch in batches:
+                pending.append(pool.submit(_validate_chunks, batch, spec_source.path, spec_source.name))
+                if len(pending) >= limit:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+def _batched(items: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    """Consecutive lists of up to size items"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
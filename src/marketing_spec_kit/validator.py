@@ -10,17 +10,33 @@ Implements 45 validation rules from domain specification v0.3.0:
 - ContentTemplate: VR-CT01 to VR-CT05 (5 rules)
 - Milestone: VR-M01 to VR-M05 (5 rules)
 - Analytics: VR-A01 to VR-A05 (5 rules) [NEW in v0.2.0]
+- Analytics integrity: ANLY-02 (achievement drift), ANLY-03 (status bucket),
+  checked in bulk over all vs_target comparisons
+- Entity graph: VR-G01 (orphaned entities)
 
 Performance Target: Validate <250ms for typical specs
+
+Entity rules only read the id index built by _collect_ids, so for large
+specs (MarketingSpecValidator(jobs=N)) entity families are cut into chunks
+and validated in worker processes; issues are merged in entity order.
+The same property lets callers re-check single entities: index() builds
+the id index, validate_entity() runs one entity's rules against it and
+entity_dependencies() tells which outside values those rules read.
 """
 
+import hashlib
+import multiprocessing
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field
 
-from marketing_spec_kit.models import MarketingSpec
+from marketing_spec_kit.budget import BudgetLedger, PlanLedger
+from marketing_spec_kit.graph import SpecGraph
+from marketing_spec_kit.integrity import check_kpis, describe
+from marketing_spec_kit.models import AnalyticsType, MarketingSpec
 
 
 class ValidationIssue(BaseModel):
@@ -61,6 +77,53 @@ class ValidationResult(BaseModel):
         return (self.rules_passed / self.rules_checked) * 100
 
 
+# (MarketingSpec collection, validator method) in validation order
+ENTITY_FAMILIES = (
+    ("products", "_validate_product"),
+    ("plans", "_validate_plan"),
+    ("campaigns", "_validate_campaign"),
+    ("channels", "_validate_channel"),
+    ("tools", "_validate_tool"),
+    ("content_templates", "_validate_content_template"),
+    ("milestones", "_validate_milestone"),
+    ("analytics", "_validate_analytics"),
+)
+
+# Ids listed by 'Use one of: ...' fixes of missing references
+MAX_LISTED_IDS = 10
+
+# Smaller specs are validated in-process even with jobs > 1
+PARALLEL_MIN_ENTITIES = 20000
+
+# Validator and spec of a worker process (set by _init_family_worker)
+_family_worker: Optional[Tuple["MarketingSpecValidator", MarketingSpec]] = None
+
+
+def _init_family_worker(validator: "MarketingSpecValidator", spec: MarketingSpec):
+    """Pool initializer: keep the read-only validator index and spec"""
+    global _family_worker
+    _family_worker = (validator, spec)
+
+
+def _validate_family_chunk(collection: str, method: str, start: int, end: int) -> ValidationResult:
+    """Validate entities [start, end) of one family (runs in a worker process)"""
+    validator, spec = _family_worker
+    validator.result = ValidationResult(valid=True)
+    check = getattr(validator, method)
+    for entity in getattr(spec, collection)[start:end]:
+        check(entity)
+    return validator.result
+
+
+def _merge_result(result: ValidationResult, part: ValidationResult):
+    """Append the issues and counters of part to result"""
+    result.errors.extend(part.errors)
+    result.warnings.extend(part.warnings)
+    result.info.extend(part.info)
+    result.rules_checked += part.rules_checked
+    result.rules_passed += part.rules_passed
+
+
 class MarketingSpecValidator:
     """Validator for enforcing 42 validation rules
     
@@ -77,7 +140,19 @@ class MarketingSpecValidator:
         ...         print(f"[{error.code}] {error.message}")
     """
 
-    def __init__(self):
+    def __init__(self, jobs: int = 1, chunk_size: int = 5000, cache=None):
+        """
+        Args:
+            jobs: Worker processes for entity rules (1 = in-process, 0 or
+                None = CPU count); used for specs with at least
+                PARALLEL_MIN_ENTITIES entities
+            chunk_size: Entities of one family validated per task
+            cache: ValidationCache reusing outcomes of unchanged entities
+                (entities missing from it are validated in-process)
+        """
+        self.jobs = jobs
+        self.chunk_size = max(1, chunk_size)
+        self.cache = cache
         self.result = ValidationResult(valid=True)
         self._project_id: str = ""
         self._product_ids: Set[str] = set()
@@ -90,6 +165,12 @@ class MarketingSpecValidator:
         self._analytics_ids: Set[str] = set()  # NEW in v2.0.0
         self._plans: List[Any] = []  # Store plans for budget validation
         self._campaigns: List[Any] = []  # Store campaigns for budget validation
+        self._plans_by_id: Dict[str, Any] = {}
+        self._plan_budgets: Dict[str, PlanLedger] = {}
+        self.budget: Optional[BudgetLedger] = None  # Budget ledger of the last validated spec
+        self._graph: Optional[SpecGraph] = None
+        self._graph_spec: Optional[MarketingSpec] = None  # Spec whose graph is built on access
+        self._id_hints: Dict[str, str] = {}
 
     def validate(self, spec: MarketingSpec) -> ValidationResult:
         """Validate a MarketingSpec against all 45 rules (v2.0.0)
@@ -107,33 +188,228 @@ class MarketingSpecValidator:
         # Validate each entity type
         self._validate_project(spec.project)
 
-        for product in spec.products:
-            self._validate_product(product)
+        entities = sum(len(getattr(spec, collection)) for collection, _ in ENTITY_FAMILIES)
+        if self.cache is not None:
+            self._validate_families_cached(spec)
+        elif self.jobs != 1 and entities >= PARALLEL_MIN_ENTITIES:
+            self._validate_families_parallel(spec)
+        else:
+            for collection, method in ENTITY_FAMILIES:
+                check = getattr(self, method)
+                for entity in getattr(spec, collection):
+                    check(entity)
+            self._validate_analytics_integrity(spec)
+            self._validate_graph(spec)
 
-        for plan in spec.plans:
-            self._validate_plan(plan)
+        # Final result
+        self.result.valid = len(self.result.errors) == 0
+        return self.result
 
-        for campaign in spec.campaigns:
-            self._validate_campaign(campaign)
+    def _validate_families_parallel(self, spec: MarketingSpec):
+        """Run the per-entity rules in worker processes
+
+        Families are cut into chunks of chunk_size entities. Each worker
+        receives this validator (with the id index built by _collect_ids)
+        and the spec once, through the pool initializer: with the 'fork'
+        start method they are inherited without copying. Tasks are only
+        (family, start, end); their issues and counters are merged in
+        submission order, so the result is identical to a sequential run.
+        The bulk checks (analytics integrity, entity graph) run in this
+        process meanwhile.
+        """
+        tasks = [
+            (collection, method, start, min(start + self.chunk_size, len(getattr(spec, collection))))
+            for collection, method in ENTITY_FAMILIES
+            for start in range(0, len(getattr(spec, collection)), self.chunk_size)
+        ]
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        head = self.result
+        with ProcessPoolExecutor(
+            max_workers=self.jobs or None,
+            mp_context=context,
+            initializer=_init_family_worker,
+            initargs=(self, spec),
+        ) as pool:
+            futures = [pool.submit(_validate_family_chunk, *task) for task in tasks]
+
+            self.result = ValidationResult(valid=True)
+            self._validate_analytics_integrity(spec)
+            self._validate_graph(spec)
+            tail = self.result
+
+            self.result = head
+            for future in futures:
+                _merge_result(self.result, future.result())
+        _merge_result(self.result, tail)
 
-        for channel in spec.channels:
-            self._validate_channel(channel)
+    @property
+    def graph(self) -> Optional[SpecGraph]:
+        """Entity graph of the last validated spec
 
-        for tool in spec.tools:
-            self._validate_tool(tool)
+        Built on first access when the graph rules were reused from the cache.
+        """
+        if self._graph is None and self._graph_spec is not None:
+            self._graph = SpecGraph.from_spec(self._graph_spec)
+            self._graph_spec = None
+        return self._graph
+
+    def _validate_families_cached(self, spec: MarketingSpec):
+        """Run the entity rules through the cache (see marketing_spec_kit.cache)
+
+        Each entity's outcome is looked up by _entity_key(); misses are
+        validated and stored. The spec-wide rules are keyed by what they
+        read: analytics integrity by the analytics keys, the graph rules by
+        SpecGraph.reference_digest().
+        """
+        analytics = hashlib.blake2b(digest_size=16)
+        for collection, method in ENTITY_FAMILIES:
+            check = getattr(self, method)
+            for entity in getattr(spec, collection):
+                key = self._entity_key(collection, entity)
+                if collection == "analytics":
+                    analytics.update(key.encode("ascii"))
+                self._cached_outcome(key, check, entity)
+
+        self._cached_outcome(f"integrity:{analytics.hexdigest()}", self._validate_analytics_integrity, spec)
+        self._graph = None
+        self._graph_spec = spec
+        self._cached_outcome(f"graph:{SpecGraph.reference_digest(spec)}", self._validate_graph, spec)
+
+    def _cached_outcome(self, key: str, check, target):
+        """Merge the cached outcome of key, or run check(target) and cache it"""
+        outcome = self.cache.get(key)
+        if outcome is None:
+            part = self._isolated(check, target)
+            self.cache.put(key, [
+                part.rules_checked,
+                part.rules_passed,
+                [
+                    [i.level, i.code, i.entity_type, i.entity_id, i.field, i.message, i.fix]
+                    for i in part.errors + part.warnings + part.info
+                ],
+            ])
+            _merge_result(self.result, part)
+            return
+
+        checked, passed, issues = outcome
+        self.result.rules_checked += checked
+        self.result.rules_passed += passed
+        levels = {"error": self.result.errors, "warning": self.result.warnings, "info": self.result.info}
+        for level, code, entity_type, entity_id, field, message, fix in issues:
+            # Stored issues were validated when they were first reported
+            levels[level].append(ValidationIssue.model_construct(
+                code=code,
+                level=level,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                field=field,
+                message=message,
+                fix=fix,
+            ))
 
-        for template in spec.content_templates:
-            self._validate_content_template(template)
+    def _isolated(self, check, target) -> ValidationResult:
+        """Run check(target) into a fresh result, leaving self.result untouched"""
+        result, self.result = self.result, ValidationResult(valid=True)
+        try:
+            check(target)
+            part = self.result
+        finally:
+            self.result = result
+        part.valid = not part.errors
+        return part
+
+    def index(self, spec: MarketingSpec):
+        """Build the id index and budget ledger read by the entity rules, without validating
+
+        Example:
+            >>> validator.index(spec)
+            >>> validator.validate_entity("campaigns", spec.campaigns[0]).errors
+            []
+        """
+        self._collect_ids(spec)
 
-        for milestone in spec.milestones:
-            self._validate_milestone(milestone)
+    def validate_entity(self, collection: str, entity) -> ValidationResult:
+        """Run the rules of one entity against the current index (see index())
 
-        for analytics in spec.analytics:
-            self._validate_analytics(analytics)
+        Args:
+            collection: 'project' or a spec collection ('campaigns', ...)
+            entity: Entity of that collection
+        """
+        if collection == "project":
+            return self._isolated(self._validate_project, entity)
+        return self._isolated(getattr(self, dict(ENTITY_FAMILIES)[collection]), entity)
+
+    def validate_spec_rules(self, spec: MarketingSpec) -> ValidationResult:
+        """Run the spec-wide rules only: analytics integrity and the entity graph"""
+        part = self._isolated(self._validate_analytics_integrity, spec)
+        _merge_result(part, self._isolated(self._validate_graph, spec))
+        part.valid = not part.errors
+        return part
+
+    def _entity_key(self, collection: str, entity) -> str:
+        """Cache key: entity content plus the state its rules read outside the entity"""
+        digest = hashlib.blake2b(entity.__pydantic_serializer__.to_json(entity), digest_size=16)
+        digest.update(repr(self.entity_dependencies(collection, entity)).encode("utf-8"))
+        return f"{collection}:{digest.hexdigest()}"
+
+    def entity_dependencies(self, collection: str, entity) -> tuple:
+        """Values outside the entity that its rules depend on
+
+        An entity whose content and dependencies are unchanged gets the same
+        outcome from validate_entity() (given the same day).
+        """
+        if collection == "campaigns":
+            plan = self._plans_by_id.get(entity.plan_id)
+            if plan is None:
+                plan_state: tuple = ("missing", self._one_of("plans"))
+            else:
+                ledger = self._plan_budgets[plan.id]
+                plan_state = (
+                    plan.period.start_date,
+                    plan.period.end_date,
+                    plan.budget.total,
+                    ledger.committed if ledger.over_committed else None,
+                )
+            return (
+                tuple(pid in self._product_ids for pid in entity.product_ids or ()),
+                tuple(ch_id in self._channel_ids for ch_id in entity.channels),
+                plan_state,
+            )
+        if collection == "channels":
+            return (entity.tool_id in self._tool_ids,)
+        if collection == "tools":
+            return tuple(ch_id in self._channel_ids for ch_id in entity.channel_ids or ())
+        if collection == "milestones":
+            return (
+                tuple(pid in self._product_ids for pid in entity.product_ids or ()),
+                tuple(cid in self._campaign_ids for cid in entity.campaign_ids or ()),
+            )
+        if collection == "analytics":
+            ids, pool = (
+                (self._campaign_ids, "campaigns")
+                if entity.type == AnalyticsType.CAMPAIGN
+                else (self._plan_ids, "plans")
+            )
+            return (True,) if entity.entity_id in ids else (False, self._one_of(pool))
+        return ()
 
-        # Final result
-        self.result.valid = len(self.result.errors) == 0
-        return self.result
+    def _one_of(self, collection: str) -> str:
+        """'Use one of: ...' fix for a missing plan or campaign reference
+
+        Lists the first MAX_LISTED_IDS ids in sorted order (built once per run).
+        """
+        hint = self._id_hints.get(collection)
+        if hint is None:
+            ids = sorted({"plans": self._plan_ids, "campaigns": self._campaign_ids}[collection])
+            if not ids:
+                hint = f"Use one of: (no {collection} defined)"
+            else:
+                hint = "Use one of: " + ", ".join(ids[:MAX_LISTED_IDS])
+                if len(ids) > MAX_LISTED_IDS:
+                    hint += f", … ({len(ids) - MAX_LISTED_IDS} more)"
+            self._id_hints[collection] = hint
+        return hint
 
     def _collect_ids(self, spec: MarketingSpec):
         """Collect all entity IDs for reference validation (v2.0.0)"""
@@ -146,9 +422,18 @@ class MarketingSpecValidator:
         self._template_ids = {ct.id for ct in spec.content_templates}
         self._milestone_ids = {m.id for m in spec.milestones}
         self._analytics_ids = {a.id for a in spec.analytics}
+        self._id_hints = {}
         # Store entities for cross-validation
         self._plans = list(spec.plans)
         self._campaigns = list(spec.campaigns)
+        self._plans_by_id = {}
+        for plan in spec.plans:
+            self._plans_by_id.setdefault(plan.id, plan)
+        # Committed budgets per plan, computed once for CAMP-11
+        self.budget = BudgetLedger.from_spec(spec)
+        self._plan_budgets = {}
+        for entry in self.budget.plans:
+            self._plan_budgets.setdefault(entry.plan_id, entry)
 
     # ========================================================================
     # Project Validation (6 rules)
@@ -438,14 +723,14 @@ class MarketingSpecValidator:
                 campaign.id,
                 "plan_id",
                 f"Campaign references non-existent plan '{campaign.plan_id}'",
-                f"Use one of: {', '.join(self._plan_ids) if self._plan_ids else '(no plans defined)'}",
+                self._one_of("plans"),
             )
         else:
             self.result.rules_passed += 1
 
         # CAMP-09 & CAMP-10: Campaign dates must be within plan's period (NEW in v2.0.0)
         if campaign.plan_id in self._plan_ids:
-            plan = next((p for p in self._plans if p.id == campaign.plan_id), None)
+            plan = self._plans_by_id.get(campaign.plan_id)
             if plan:
                 # CAMP-09: start_date within plan period
                 self.result.rules_checked += 1
@@ -496,10 +781,10 @@ class MarketingSpecValidator:
                 # CAMP-11: Budget check (warning) (NEW in v2.0.0)
                 self.result.rules_checked += 1
                 plan_total_budget = plan.budget.total
-                campaigns_in_plan = [c for c in self._campaigns if c.plan_id == plan.id]
-                total_campaign_budgets = sum(c.budget for c in campaigns_in_plan)
+                plan_budget = self._plan_budgets[plan.id]
+                total_campaign_budgets = plan_budget.committed
 
-                if total_campaign_budgets > plan_total_budget * 1.05:  # Allow 5% over
+                if plan_budget.over_committed:  # Allow 5% over
                     self._add_issue(
                         "CAMP-11",
                         "warning",
@@ -751,7 +1036,7 @@ class MarketingSpecValidator:
                     analytics.id,
                     "entity_id",
                     f"Analytics references non-existent campaign '{analytics.entity_id}'",
-                    f"Use one of: {', '.join(self._campaign_ids) if self._campaign_ids else '(no campaigns defined)'}",
+                    self._one_of("campaigns"),
                 )
             else:
                 self.result.rules_passed += 1
@@ -764,11 +1049,59 @@ class MarketingSpecValidator:
                     analytics.id,
                     "entity_id",
                     f"Analytics references non-existent plan '{analytics.entity_id}'",
-                    f"Use one of: {', '.join(self._plan_ids) if self._plan_ids else '(no plans defined)'}",
+                    self._one_of("plans"),
                 )
             else:
                 self.result.rules_passed += 1
 
+    def _validate_analytics_integrity(self, spec: MarketingSpec):
+        """Check all vs_target comparisons at once (ANLY-02, ANLY-03)"""
+        report = check_kpis(spec)
+        fixes = {
+            "ANLY-02": "Recompute achievement as actual / target * 100",
+            "ANLY-03": "Update status to match the achievement (or regenerate the report)",
+        }
+        for code in ("ANLY-02", "ANLY-03"):
+            self._check_rule(code)
+            findings = [f for f in report.findings if f.code == code]
+            for finding in findings:
+                self._add_warning(
+                    code,
+                    "analytics",
+                    finding.report_id,
+                    f"vs_target.{finding.kpi}",
+                    describe(finding),
+                    fixes[code],
+                )
+            if not findings:
+                self._pass_rule()
+
+    # ========================================================================
+    # Entity Graph Validation (orphans)
+    # ========================================================================
+
+    def _validate_graph(self, spec: MarketingSpec):
+        """Validate the entity dependency graph (VR-G01)
+
+        The graph is acyclic by construction (see graph.py), so there is no
+        cycle rule; `$ref` cycles are reported by the parser (MKT-REF-002).
+        """
+        self._graph = SpecGraph.from_spec(spec)
+        self._graph_spec = None
+
+        # VR-G01: plans, products, channels and tools are used by something
+        self._check_rule("VR-G01")
+        for kind, entity_id in self.graph.orphans():
+            self._add_info(
+                "VR-G01",
+                kind,
+                entity_id,
+                "id",
+                f"{kind.replace('_', ' ').capitalize()} '{entity_id}' is not referenced by any entity",
+                "Reference it from a campaign, channel or milestone, or remove it",
+            )
+        self._pass_rule()
+
     # ========================================================================
     # Helper Methods
     # ========================================================================
@@ -781,6 +1114,24 @@ class MarketingSpecValidator:
         """Increment rules_passed counter"""
         self.result.rules_passed += 1
 
+    def _add_issue(
+        self,
+        code: str,
+        level: str,
+        entity_type: str,
+        entity_id: str,
+        field: str,
+        message: str,
+        fix: str,
+    ):
+        """Add validation issue at the given level ('error', 'warning' or 'info')"""
+        if level == "error":
+            self._add_error(code, entity_type, entity_id, field, message, fix)
+        elif level == "warning":
+            self._add_warning(code, entity_type, entity_id, field, message, fix)
+        else:
+            self._add_info(code, entity_type, entity_id, field, message, fix)
+
     def _add_error(
         self,
         code: str,
@@ -0,0 +1,311 @@
+"""Multi-spec workspace loading and validation
+
+A workspace is a directory of specification files that together describe
+one or more projects. Files may be complete specs (with `project`) or
+fragments that only contribute shared entity pools, e.g.:
+
+    workspace/
+    ├── brand.yaml          project + products + plans
+    ├── shared/channels.yaml  channels + tools (no project)
+    └── teams/growth.yaml   campaigns (no project)
+
+Loading parses every file in parallel worker processes, builds a global
+id index (collection → id → file) and merges all entities so cross-file
+references resolve. Validation then runs the single-spec rules once over
+the merged spec, plus the workspace-level rules a single file cannot check:
+
+- VR-P01: project name unique across the workspace
+- VR-PR02 / VR-C02 / VR-CT02 / VR-M02: project_id references a known project
+- VR-PR01 / VR-MP01 / VR-C01 / VR-CH01 / VR-T01 / VR-CT01 / VR-M01 / VR-A01:
+  entity id unique across the workspace
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from pydantic import Field
+
+from marketing_spec_kit.exceptions import MarketingSpecError
+from marketing_spec_kit.models import MarketingSpec, Project
+from marketing_spec_kit.parser import MarketingSpecParser
+from marketing_spec_kit.validator import MarketingSpecValidator, ValidationResult
+
+DEFAULT_PATTERNS = ("*.yaml", "*.yml", "*.json")
+
+# Collection → entity_type used in ValidationIssue
+ENTITY_TYPES = {
+    "products": "product",
+    "plans": "plan",
+    "campaigns": "campaign",
+    "channels": "channel",
+    "tools": "tool",
+    "content_templates": "content_template",
+    "milestones": "milestone",
+    "analytics": "analytics",
+}
+
+# Collections keyed by entity id → uniqueness rule code
+ID_RULES = {
+    "products": "VR-PR01",
+    "plans": "VR-MP01",
+    "campaigns": "VR-C01",
+    "channels": "VR-CH01",
+    "tools": "VR-T01",
+    "content_templates": "VR-CT01",
+    "milestones": "VR-M01",
+    "analytics": "VR-A01",
+}
+
+# Collections with a project_id reference → rule code
+PROJECT_REF_RULES = {
+    "products": "VR-PR02",
+    "campaigns": "VR-C02",
+    "content_templates": "VR-CT02",
+    "milestones": "VR-M02",
+}
+
+
+class SpecFragment(MarketingSpec):
+    """Workspace document without its own project (shared entity pool)"""
+
+    project: Optional[Project] = Field(None, description="Project brand identity (optional in fragments)")
+
+
+class WorkspaceDocument(NamedTuple):
+    """Successfully parsed workspace file"""
+
+    path: Path
+    spec: MarketingSpec
+
+
+class WorkspaceLoadError(NamedTuple):
+    """Workspace file that failed to parse"""
+
+    path: Path
+    code: str
+    message: str
+    fix: str
+    line: Optional[int]
+
+
+def project_slug(project: Project) -> str:
+    """Project identifier as referenced by project_id fields"""
+    return project.name.lower().replace(" ", "-")
+
+
+def _load_document(path: Path) -> Union[WorkspaceDocument, WorkspaceLoadError]:
+    """Parse one workspace file (runs in a worker process)
+
+    Errors are returned rather than raised: MarketingSpecError subclasses
+    need extra constructor arguments, so they cannot be unpickled from a
+    worker process.
+    """
+    parser = MarketingSpecParser()
+    try:
+        data = parser._load_data(path, "auto")
+        model = MarketingSpec if "project" in data else SpecFragment
+        return WorkspaceDocument(path, parser._parse_spec(data, model=model))
+    except MarketingSpecError as e:
+        return WorkspaceLoadError(path, e.code, e.message, e.fix, getattr(e, "line", None))
+    except Exception as e:
+        return WorkspaceLoadError(path, "MKT-VAL-001", f"Unexpected parsing error: {e}", "", None)
+
+
+def spec_files(root: Path, patterns: Sequence[str] = DEFAULT_PATTERNS) -> List[Path]:
+    """Spec files under root in path order (hidden directories are skipped)"""
+    return sorted({
+        path
+        for pattern in patterns
+        for path in root.rglob(pattern)
+        if path.is_file()
+        and not any(part.startswith(".") for part in path.relative_to(root).parts)
+    })
+
+
+def load_documents(
+    paths: Sequence[Path],
+    max_workers: Optional[int] = None,
+) -> List[Union[WorkspaceDocument, WorkspaceLoadError]]:
+    """Parse files in worker processes (None = CPU count, 1 = in-process), in order"""
+    if max_workers == 1 or len(paths) < 2:
+        return [_load_document(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_load_document, paths))
+
+
+class MarketingWorkspace:
+    """Directory of specs merged into one id space
+
+    Example:
+        >>> workspace = MarketingWorkspace.load("specs/")
+        >>> workspace.file_of("channels", "twitter")
+        PosixPath('specs/shared/channels.yaml')
+        >>> result = WorkspaceValidator().validate_workspace(workspace)
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        documents: List[WorkspaceDocument],
+        load_errors: List[WorkspaceLoadError],
+    ):
+        self.root = root
+        self.documents = documents
+        self.load_errors = load_errors
+        # collection → id → files defining it (more than one = duplicate)
+        self.index: Dict[str, Dict[str, List[Path]]] = {c: {} for c in ID_RULES}
+        for doc in documents:
+            for collection in ID_RULES:
+                ids = self.index[collection]
+                for entity in getattr(doc.spec, collection):
+                    ids.setdefault(entity.id, []).append(doc.path)
+
+    @classmethod
+    def load(
+        cls,
+        root: Union[str, Path],
+        patterns: Sequence[str] = DEFAULT_PATTERNS,
+        max_workers: Optional[int] = None,
+    ) -> "MarketingWorkspace":
+        """Load every spec file under root (hidden directories are skipped)
+
+        Args:
+            root: Workspace directory
+            patterns: Glob patterns for spec files
+            max_workers: Worker processes (None = CPU count, 1 = in-process)
+
+        Returns:
+            MarketingWorkspace with documents in path order
+        """
+        root = Path(root)
+        loaded = load_documents(spec_files(root, patterns), max_workers)
+        documents = [item for item in loaded if isinstance(item, WorkspaceDocument)]
+        errors = [item for item in loaded if isinstance(item, WorkspaceLoadError)]
+        return cls(root, documents, errors)
+
+    @property
+    def projects(self) -> List[Tuple[Path, Project]]:
+        """(file, project) for every document that defines a project"""
+        return [(doc.path, doc.spec.project) for doc in self.documents if doc.spec.project]
+
+    def file_of(self, collection: str, entity_id: str) -> Optional[Path]:
+        """First file defining the entity, or None"""
+        paths = self.index.get(collection, {}).get(entity_id)
+        return paths[0] if paths else None
+
+    def merged(self) -> MarketingSpec:
+        """All entities of the workspace as one spec (first project as root)
+
+        Entities are already validated per file, so the merged spec is built
+        with model_construct() instead of re-running Pydantic validation.
+        """
+        projects = self.projects
+        fields = {collection: [] for collection in ID_RULES}
+        for doc in self.documents:
+            for collection, entities in fields.items():
+                entities.extend(getattr(doc.spec, collection))
+        return MarketingSpec.model_construct(
+            project=projects[0][1] if projects else None,
+            **fields,
+        )
+
+
+class WorkspaceValidator(MarketingSpecValidator):
+    """Validator for a whole workspace (single-spec rules + workspace rules)"""
+
+    def validate_workspace(self, workspace: MarketingWorkspace) -> ValidationResult:
+        """Validate all documents of a workspace together
+
+        Args:
+            workspace: Loaded MarketingWorkspace
+
+        Returns:
+            ValidationResult; parse failures are reported as errors with
+            entity_type 'file'
+        """
+        projects = workspace.projects
+        if not projects:
+            self.result = ValidationResult(valid=True)
+            self._add_error(
+                "MKT-VAL-002",
+                "workspace",
+                str(workspace.root),
+                "project",
+                "No file in the workspace defines a project",
+                "Add a spec file with a 'project' section",
+            )
+        else:
+            # Single-spec rules over the merged entity pool (resets result)
+            self.validate(workspace.merged())
+            for _, project in projects[1:]:
+                self._validate_project(project)
+            self._validate_workspace_rules(workspace)
+
+        for error in workspace.load_errors:
+            self._add_error(
+                error.code,
+                "file",
+                str(error.path),
+                f"line {error.line}" if error.line else "",
+                error.message,
+                error.fix,
+            )
+
+        self.result.valid = len(self.result.errors) == 0
+        return self.result
+
+    def _validate_workspace_rules(self, workspace: MarketingWorkspace):
+        """Rules that need every document (VR-P01, project_id, id uniqueness)"""
+
+        # VR-P01: project name unique (workspace-level)
+        self._check_rule("VR-P01")
+        seen: Dict[str, Path] = {}
+        for path, project in workspace.projects:
+            slug = project_slug(project)
+            if slug in seen:
+                self._add_error(
+                    "VR-P01",
+                    "project",
+                    slug,
+                    "name",
+                    f"Project '{project.name}' in {path} is already defined in {seen[slug]}",
+                    "Rename one project or merge the two files",
+                )
+            else:
+                seen[slug] = path
+        self._pass_rule()
+
+        # VR-PR02 / VR-C02 / VR-CT02 / VR-M02: project_id exists
+        for collection, code in PROJECT_REF_RULES.items():
+            for doc in workspace.documents:
+                for entity in getattr(doc.spec, collection):
+                    self._check_rule(code)
+                    if entity.project_id not in seen:
+                        self._add_error(
+                            code,
+                            ENTITY_TYPES[collection],
+                            entity.id,
+                            "project_id",
+                            f"Project '{entity.project_id}' does not exist (in {doc.path})",
+                            f"Use one of: {', '.join(sorted(seen))}",
+                        )
+                    else:
+                        self._pass_rule()
+
+        # VR-*01: id unique across the workspace
+        for collection, code in ID_RULES.items():
+            for entity_id, paths in workspace.index[collection].items():
+                self._check_rule(code)
+                if len(paths) > 1:
+                    self._add_error(
+                        code,
+                        ENTITY_TYPES[collection],
+                        entity_id,
+                        "id",
+                        f"Duplicate id '{entity_id}' defined {len(paths)} times "
+                        f"({', '.join(sorted({str(p) for p in paths}))})",
+                        "Give each entity a unique id or remove the duplicate",
+                    )
+                else:
+                    self._pass_rule()
@@ -0,0 +1,15 @@
+"""Shared fixtures"""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def spec_data():
+    """Raw data of a valid spec (one campaign with product_ids, one without)"""
+    with open(FIXTURES / "valid-spec.yaml", "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
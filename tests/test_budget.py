@@ -0,0 +1,18 @@
+"""Tests for the budget ledger"""
+
+import copy
+
+from marketing_spec_kit.budget import BudgetLedger
+from marketing_spec_kit.models import MarketingSpec
+
+
+def test_duplicate_plan_ids_commit_to_first_plan_and_its_lines(spec_data):
+    spec_data["plans"][0]["budget"]["allocation"] = {"email": 20000}
+    spec_data["plans"].append(copy.deepcopy(spec_data["plans"][0]))
+
+    first, second = BudgetLedger.from_spec(MarketingSpec.model_validate(spec_data)).plans
+
+    assert first.committed == 15000
+    assert [(line.key, line.committed) for line in first.lines] == [("email", 15000)]
+    assert second.committed == 0
+    assert [(line.key, line.committed) for line in second.lines] == [("email", 0)]
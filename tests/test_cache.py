@@ -0,0 +1,59 @@
+"""Tests for the per-entity validation cache"""
+
+import pytest
+
+from marketing_spec_kit.cache import ValidationCache
+from marketing_spec_kit.models import MarketingSpec
+from marketing_spec_kit.validator import MarketingSpecValidator
+
+
+def _issues(result):
+    return [
+        (issue.level, issue.code, issue.entity_type, issue.entity_id, issue.field, issue.message)
+        for issue in result.errors + result.warnings + result.info
+    ]
+
+
+@pytest.mark.parametrize("product_ids", [True, False], ids=["with-product-ids", "without-product-ids"])
+def test_cached_validation_matches_uncached(spec_data, product_ids):
+    if not product_ids:
+        for campaign in spec_data["campaigns"]:
+            campaign.pop("product_ids", None)
+    spec = MarketingSpec.model_validate(spec_data)
+
+    expected = MarketingSpecValidator().validate(spec)
+    cache = ValidationCache()
+    result = MarketingSpecValidator(cache=cache).validate(spec)
+
+    assert result.valid == expected.valid
+    assert _issues(result) == _issues(expected)
+    assert (result.rules_checked, result.rules_passed) == (expected.rules_checked, expected.rules_passed)
+    assert cache.hits == 0 and cache.misses > 0
+
+
+def test_cache_file_is_reused(spec_data, tmp_path):
+    spec = MarketingSpec.model_validate(spec_data)
+    path = tmp_path / "cache.json"
+
+    first = ValidationCache.load(path)
+    expected = MarketingSpecValidator(cache=first).validate(spec)
+    assert first.save() == len(first)
+
+    second = ValidationCache.load(path)
+    result = MarketingSpecValidator(cache=second).validate(spec)
+    assert second.misses == 0 and second.hits == first.misses
+    assert _issues(result) == _issues(expected)
+
+
+def test_changed_entity_is_revalidated(spec_data):
+    cache = ValidationCache()
+    MarketingSpecValidator(cache=cache).validate(MarketingSpec.model_validate(spec_data))
+
+    spec_data["campaigns"][1]["channels"] = ["missing-channel"]
+    spec = MarketingSpec.model_validate(spec_data)
+    hits = cache.hits
+    result = MarketingSpecValidator(cache=cache).validate(spec)
+
+    assert any(issue.entity_id == "newsletter-campaign" for issue in result.errors)
+    assert _issues(result) == _issues(MarketingSpecValidator().validate(spec))
+    assert cache.hits > hits
@@ -0,0 +1,27 @@
+"""Tests for the calendar command"""
+
+import pytest
+import yaml
+from rich.console import Console
+from typer.testing import CliRunner
+
+from marketing_spec_kit import cli
+
+
+@pytest.mark.parametrize("args", [[], ["--conflicts", "--max-per-day", "1"]], ids=["range", "conflicts"])
+def test_calendar_prints_markup_literally(args, spec_data, tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "console", Console(width=200))
+    entry = {"date": "2025-01-15", "content_type": "[b]post", "channel_id": "email", "status": "planned"}
+    spec_data["campaigns"][0]["content_calendar"] = [
+        {**entry, "title": "Launch [/bold] day"},
+        {**entry, "title": "Second [red]post"},
+    ]
+    path = tmp_path / "spec.yaml"
+    path.write_text(yaml.safe_dump(spec_data), encoding="utf-8")
+
+    result = CliRunner().invoke(cli.app, ["calendar", str(path), *args])
+
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    assert "Launch [/bold] day" in result.output
+    assert "Second [red]post" in result.output
+    assert "[b]post" in result.output
@@ -0,0 +1,90 @@
+"""Rendering of validation results (terminal tables and plain text)"""
+
+import io
+import time
+
+import pytest
+from rich.console import Console
+
+from marketing_spec_kit import cli
+from marketing_spec_kit.validator import ValidationIssue, ValidationResult
+
+
+def _result(count: int, codes: int = 60) -> ValidationResult:
+    """Invalid result with `count` errors and warnings spread over `codes` codes
+
+    Issues repeat in blocks of 1,000 distinct ones (rendering only reads them).
+    """
+
+    def issues(level: str):
+        block = [
+            ValidationIssue.model_construct(
+                code=f"VR-T{i % codes:02d}",
+                level=level,
+                entity_type="campaign",
+                entity_id=f"campaign-{i}",
+                field="budget",
+                message=f"Issue {i}",
+                fix="Fix it",
+            )
+            for i in range(min(count, 1_000))
+        ]
+        return (block * (count // len(block) + 1))[:count]
+
+    return ValidationResult.model_construct(
+        valid=False,
+        errors=issues("error"),
+        warnings=issues("warning"),
+        info=[],
+        rules_checked=100,
+        rules_passed=40,
+    )
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    """Route cli output to a terminal console writing into a buffer"""
+    buffer = io.StringIO()
+    monkeypatch.setattr(
+        cli, "console", Console(file=buffer, force_terminal=True, color_system=None, width=160)
+    )
+    return buffer
+
+
+def test_small_result_lists_every_issue(terminal):
+    cli._display_validation_result(_result(10))
+    output = terminal.getvalue()
+
+    assert "campaign-9" in output
+    assert "groups" not in output
+
+
+def test_large_result_is_grouped_in_bounded_time(terminal):
+    cli._display_validation_result(_result(1_000))
+    small = terminal.getvalue()
+    terminal.seek(0)
+    terminal.truncate()
+
+    result = _result(100_000)
+    start = time.perf_counter()
+    cli._display_validation_result(result)
+    elapsed = time.perf_counter() - start
+    output = terminal.getvalue()
+
+    assert "100,000 in 60 groups" in output
+    assert f"… {60 - cli.MAX_GROUPS} more groups" in output
+    # One row per group: the output does not grow with the issue count
+    assert len(output.splitlines()) == len(small.splitlines())
+    assert elapsed < 2.0
+
+
+def test_plain_output_streams_every_issue(capsys):
+    result = _result(100_000)
+    start = time.perf_counter()
+    cli._print_validation_result_plain(result)
+    elapsed = time.perf_counter() - start
+    lines = capsys.readouterr().out.splitlines()
+
+    assert len(lines) == 2 + 200_000
+    assert lines[2] == "ERROR VR-T00 campaign:campaign-0 budget: Issue 0 (fix: Fix it)"
+    assert elapsed < 2.0
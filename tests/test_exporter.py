@@ -0,0 +1,26 @@
+"""Tests for the config exporter"""
+
+import pytest
+
+from marketing_spec_kit.exporter import MarketingConfigExporter
+from marketing_spec_kit.generator import TemplateRenderError
+from marketing_spec_kit.models import MarketingSpec
+
+
+def test_export_writes_config_files(spec_data, tmp_path):
+    spec = MarketingSpec.model_validate(spec_data)
+    result = MarketingConfigExporter().export(spec, tmp_path)
+
+    assert result["file_count"] == len(result["files"]) > 0
+    for rel_path in result["files"]:
+        assert (tmp_path / rel_path).is_file()
+
+
+def test_unwritable_output_raises_render_error(spec_data, tmp_path):
+    spec = MarketingSpec.model_validate(spec_data)
+    # A file where the config/ directory should be
+    (tmp_path / "config").write_text("", encoding="utf-8")
+
+    with pytest.raises(TemplateRenderError) as excinfo:
+        MarketingConfigExporter().export(spec, tmp_path)
+    assert excinfo.value.code == "MKT-GEN-001"
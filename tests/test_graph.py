@@ -0,0 +1,51 @@
+"""Tests for the entity dependency graph"""
+
+from marketing_spec_kit.graph import SpecGraph
+from marketing_spec_kit.models import MarketingSpec
+from marketing_spec_kit.validator import MarketingSpecValidator
+
+
+def test_graph_edges_and_dependents(spec_data):
+    graph = SpecGraph.from_spec(MarketingSpec.model_validate(spec_data))
+
+    # Declared on both sides (plan_id and campaign_ids): one edge, two fields
+    assert graph.edge_fields(("campaign", "launch-campaign"), ("plan", "q1-plan")) == [
+        "plans.campaign_ids",
+        "plan_id",
+    ]
+    assert sorted(graph.dependents(("channel", "email"))) == [
+        ("campaign", "launch-campaign"),
+        ("campaign", "newsletter-campaign"),
+    ]
+    assert graph.dangling() == []
+
+
+def test_channel_and_tool_declared_on_both_sides(spec_data):
+    spec_data["channels"][0]["tool_id"] = "mailer"
+    spec_data["tools"] = [{
+        "id": "mailer",
+        "name": "Mailer",
+        "type": "email_platform",
+        "capabilities": ["send"],
+        "status": "active",
+        "channel_ids": ["email"],
+    }]
+    graph = SpecGraph.from_spec(MarketingSpec.model_validate(spec_data))
+
+    assert graph.successors(("channel", "email")) == [("tool", "mailer")]
+    assert graph.successors(("tool", "mailer")) == []
+    assert graph.edge_fields(("channel", "email"), ("tool", "mailer")) == ["tool_id", "tools.channel_ids"]
+
+
+def test_orphans_are_reported_as_info(spec_data):
+    spec_data["channels"].append({
+        "id": "podcast",
+        "name": "Podcast",
+        "type": "podcast",
+        "platform": "spotify",
+        "content_types": ["audio"],
+    })
+    result = MarketingSpecValidator().validate(MarketingSpec.model_validate(spec_data))
+
+    orphans = [(issue.entity_type, issue.entity_id) for issue in result.info if issue.code == "VR-G01"]
+    assert orphans == [("channel", "podcast")]
@@ -0,0 +1,73 @@
+"""Tests for the analytics integrity checks"""
+
+import pytest
+
+from marketing_spec_kit.integrity import KPIColumns, check_kpi_columns, describe
+
+
+def _columns(*comparisons):
+    """One report with (target, actual, status) comparisons named kpi0, kpi1, ..."""
+    names = [f"kpi{i}" for i in range(len(comparisons))]
+    statuses = []
+    for _, _, status in comparisons:
+        if status not in statuses:
+            statuses.append(status)
+    return KPIColumns(
+        report_ids=["report-1"],
+        names=names + statuses,
+        rows=[0, len(comparisons)],
+        keys=list(range(len(comparisons))),
+        target=[c[0] for c in comparisons],
+        actual=[c[1] for c in comparisons],
+        achievement=[c[1] / c[0] * 100 if c[0] else 0.0 for c in comparisons],
+        status=[len(names) + statuses.index(c[2]) for c in comparisons],
+    )
+
+
+@pytest.mark.parametrize(
+    "actual,status",
+    [
+        (90, "on_track"),
+        (70, "on_track"),  # pace: one bucket below
+        (30, "below_target"),  # pace: one bucket below
+        (100, "meets"),
+    ],
+)
+def test_status_accepted(actual, status):
+    report = check_kpi_columns(_columns((100, actual, status)))
+    assert report.comparisons == 1
+    assert report.findings == []
+
+
+@pytest.mark.parametrize(
+    "actual,status,expected",
+    [
+        (5, "on_track", "far_below"),
+        (95, "below_target", "on_track"),
+        (120, "on_track", "exceeds"),
+        (60, "meets", "below_target"),
+    ],
+)
+def test_stale_status_reported(actual, status, expected):
+    report = check_kpi_columns(_columns((100, actual, status)))
+    assert [(f.code, f.expected_status) for f in report.findings] == [("ANLY-03", expected)]
+
+
+def test_zero_targets_are_not_counted():
+    report = check_kpi_columns(_columns((100, 90, "on_track"), (0, 5, "exceeds")))
+    assert report.comparisons == 1
+    assert report.findings == []
+
+
+def test_describe_leaves_field_to_caller():
+    report = check_kpi_columns(_columns((100, 50, "meets"), (200, 5, "on_track")))
+    drift, stale = report.findings
+    # Achievement stored as 25% for actual 50 / target 100
+    drift = drift.model_copy(update={"code": "ANLY-02", "achievement": 25.0})
+
+    assert describe(drift) == (
+        "achievement 25% does not match actual/target (50/100 = 50%)"
+    )
+    assert describe(stale) == (
+        "status 'on_track' does not match 2.5% achievement (expected 'far_below')"
+    )
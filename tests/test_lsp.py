@@ -0,0 +1,80 @@
+"""Tests for the language server documents"""
+
+import io
+
+import yaml
+
+from marketing_spec_kit.lsp import LanguageServer, SpecDocument
+
+
+def _write_spec(spec_data, tmp_path, channel_type):
+    channels = spec_data.pop("channels")
+    channels[0]["type"] = channel_type
+    (tmp_path / "channels.yaml").write_text(yaml.safe_dump(channels), encoding="utf-8")
+    spec_data["channels"] = {"$ref": "channels.yaml"}
+    path = tmp_path / "spec.yaml"
+    path.write_text(yaml.safe_dump(spec_data, sort_keys=False), encoding="utf-8")
+    return path
+
+
+def _errors(document):
+    return [d for d in document.diagnostics() if d["severity"] == 1]
+
+
+def test_reload_refs_after_target_changed(spec_data, tmp_path):
+    path = _write_spec(spec_data, tmp_path, "carrier_pigeon")
+    document = SpecDocument(path.as_uri(), path.read_text(encoding="utf-8"))
+    document.refresh()
+    text = document.text
+    assert _errors(document)
+
+    channels = yaml.safe_load((tmp_path / "channels.yaml").read_text(encoding="utf-8"))
+    channels[0]["type"] = "email"
+    (tmp_path / "channels.yaml").write_text(yaml.safe_dump(channels), encoding="utf-8")
+    document.parser.clear_ref_cache()
+
+    assert document.reload_refs()
+    assert document.refresh()
+    assert _errors(document) == []
+    assert document.text == text
+
+
+def test_save_marks_documents_with_refs_stale(spec_data, tmp_path):
+    path = _write_spec(spec_data, tmp_path, "email")
+    server = LanguageServer(io.BytesIO(), io.BytesIO())
+    plain = (tmp_path / "plain.yaml").as_uri()
+    server._did_open({"textDocument": {"uri": path.as_uri(), "text": path.read_text(encoding="utf-8")}})
+    server._did_open({"textDocument": {"uri": plain, "text": "project:\n  name: Plain\n"}})
+    for uri in list(server._stale):
+        server._publish(uri)
+
+    server._did_save({"textDocument": {"uri": (tmp_path / "channels.yaml").as_uri()}})
+    assert server._stale == {path.as_uri()}
+
+
+def test_duplicate_id_diagnostics_match_fresh_document(spec_data):
+    podcast = {
+        "id": "podcast",
+        "name": "Podcast",
+        "type": "podcast",
+        "platform": "rss",
+        "content_types": ["audio"],
+    }
+    spec_data["channels"].append(podcast)
+    text = yaml.safe_dump(spec_data, sort_keys=False)
+    document = SpecDocument("file:///spec.yaml", text)
+    document.refresh()
+
+    # Insert a second 'podcast' above the first: it registers last but comes first
+    line = text.splitlines().index("channels:") + 1
+    duplicate = yaml.safe_dump([podcast], sort_keys=False)
+    position = {"line": line, "character": 0}
+    document.change([{"range": {"start": position, "end": position}, "text": duplicate}])
+    document.refresh()
+    document.run_spec_rules()
+
+    fresh = SpecDocument("file:///spec.yaml", document.text)
+    fresh.refresh()
+    fresh.run_spec_rules()
+    assert document.diagnostics() == fresh.diagnostics()
+    assert any(d["code"] == "VR-G01" for d in fresh.diagnostics())
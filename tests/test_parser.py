@@ -0,0 +1,38 @@
+"""Tests for JSON parsing in MarketingSpecParser"""
+
+import json
+
+import pytest
+
+from marketing_spec_kit.exceptions import ParseError
+from marketing_spec_kit.parser import MarketingSpecParser
+
+
+def test_json_without_refs_matches_dict_parsing(spec_data, tmp_path):
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(spec_data), encoding="utf-8")
+
+    spec = MarketingSpecParser().parse(path)
+    assert spec == MarketingSpecParser().parse(spec_data, format="dict")
+
+
+def test_json_with_refs(spec_data, tmp_path):
+    (tmp_path / "channels.json").write_text(json.dumps(spec_data["channels"]), encoding="utf-8")
+    spec_data["channels"] = {"$ref": "channels.json"}
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(spec_data), encoding="utf-8")
+
+    spec = MarketingSpecParser().parse(path)
+    assert [channel.id for channel in spec.channels] == ["email"]
+
+
+@pytest.mark.parametrize("refs", [False, True], ids=["fast-path", "ref-path"])
+def test_malformed_json_reports_line(refs, tmp_path):
+    path = tmp_path / "spec.json"
+    body = '"$ref": "other.json",' if refs else ""
+    path.write_text('{\n  "project": {' + body + '\n  "name": \n}', encoding="utf-8")
+
+    with pytest.raises(ParseError) as excinfo:
+        MarketingSpecParser().parse(path)
+    assert excinfo.value.code == "MKT-VAL-001"
+    assert excinfo.value.line == 4
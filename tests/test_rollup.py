@@ -0,0 +1,43 @@
+"""Tests for the analytics rollup"""
+
+from marketing_spec_kit.models import MarketingSpec
+from marketing_spec_kit.rollup import AnalyticsRollup
+from marketing_spec_kit.snapshot import SpecSnapshot, write_snapshot
+
+
+def _report(report_id, report_type, entity_id, signups):
+    return {
+        "id": report_id,
+        "type": report_type,
+        "entity_id": entity_id,
+        "period": {"start_date": "2025-01-01", "end_date": "2025-01-31"},
+        "metrics": {"signups": signups},
+        "vs_target": {},
+        "insights": [{
+            "type": "success",
+            "description": "Signups",
+            "evidence": f"{signups} signups",
+            "recommendation": "Keep going",
+        }],
+        "generated_at": "2025-02-01T10:00:00Z",
+    }
+
+
+def test_snapshot_rollup_matches_spec_rollup(spec_data, tmp_path):
+    spec_data["analytics"] = [
+        _report("launch-report", "campaign", "launch-campaign", 300),
+        # Plan report whose entity id is also a campaign id
+        _report("plan-report", "plan", "launch-campaign", 100),
+    ]
+    spec = MarketingSpec.model_validate(spec_data)
+    path = tmp_path / "spec.mspec"
+    write_snapshot(spec, path)
+
+    from_spec = AnalyticsRollup().rollup(spec)
+    with SpecSnapshot(path) as snapshot:
+        from_snapshot = AnalyticsRollup().rollup_snapshot(snapshot)
+
+    assert from_snapshot == from_spec
+    plan = from_spec.plan("q1-plan")
+    assert (plan.reports, plan.metrics["signups"]) == (1, 300)
+    assert from_spec.skipped_reports == 1